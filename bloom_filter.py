@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 장기 중복 체크 블룸 필터 - 세대 회전형 확장 블룸 필터
+정확 인덱스(24시간)보다 긴 기간(30일+)의 처리 게시글 ID를 고정 크기 비트 배열로 기억합니다.
+
+구성:
+- BloomFilter: 고정 용량 블룸 필터 (bytearray 비트 배열, 이중 해싱)
+- GenerationalBloomFilter: 기간/용량 단위로 새 세대를 열고 보존 기간이 지난 세대를 버리는 필터
+  · 세대 수 상한이 있어 ID가 수백만 개여도 메모리/파일 크기가 제한됩니다.
+  · 세대별 오탐률은 전체 목표 오탐률을 최대 세대 수로 나눈 값으로 설정합니다.
+
+블룸 필터는 "없음"은 확실하고 "있음"은 오탐률만큼 틀릴 수 있습니다.
+단, 비트 배열은 flush() 때만 파일에 저장되므로 저장 전에 종료된 실행의 키는
+다음 실행의 필터에 없을 수 있습니다 (호출 측에서 정확 인덱스로 보완).
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+import os
+import json
+import math
+import time
+import struct
+import hashlib
+import tempfile
+import threading
+import logging
+from typing import Dict, List, Iterable
+
+logger = logging.getLogger(__name__)
+
+# 파일 형식: MAGIC + 헤더 길이(uint32) + JSON 헤더 + 세대별 비트 배열
+FILTER_FILE_MAGIC = b'E7BF'
+FILTER_FILE_VERSION = 1
+
+# =============================================================================
+# 고정 용량 블룸 필터
+# =============================================================================
+
+class BloomFilter:
+    """고정 용량 블룸 필터 (capacity 개 항목에서 error_rate 오탐률)"""
+
+    def __init__(self, capacity: int, error_rate: float, created_at: float = None,
+                 bits: bytearray = None, count: int = 0):
+        self.capacity = max(1, int(capacity))
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / self.capacity * math.log(2))))
+        self.created_at = created_at or time.time()
+        self.count = count
+        self.bits = bits if bits is not None else bytearray((self.num_bits + 7) // 8)
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+    def _positions(self, key: str) -> Iterable[int]:
+        # 이중 해싱 (Kirsch-Mitzenmacher) - 해시 한 번으로 k개 위치 생성
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        h2 |= 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> bool:
+        """항목 추가 - 새로 추가된 항목이면 True"""
+        added = False
+        for pos in self._positions(key):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def to_header(self) -> Dict:
+        return {
+            'capacity': self.capacity,
+            'error_rate': self.error_rate,
+            'created_at': self.created_at,
+            'count': self.count,
+            'num_bytes': len(self.bits)
+        }
+
+# =============================================================================
+# 세대 회전형 블룸 필터
+# =============================================================================
+
+class GenerationalBloomFilter:
+    """
+    보존 기간(retention_days)을 세대(generation_days) 단위로 나눈 블룸 필터 묶음
+
+    - 현재 세대가 기간을 넘기거나 용량이 차면 새 세대 생성
+    - 다음 세대가 보존 기간 이전에 시작된 세대(모든 항목이 기간 밖)는 제거
+    - 세대 수가 max_generations를 넘으면 가장 오래된 세대부터 제거
+    """
+
+    def __init__(self, file_path: str, retention_days: float = 30, generation_days: float = 5,
+                 capacity: int = 20000, error_rate: float = 0.001, max_generations: int = 12):
+        self.file_path = file_path
+        self.retention_seconds = retention_days * 86400
+        self.generation_seconds = generation_days * 86400
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.max_generations = max(1, max_generations)
+        # 세대 전체 오탐률이 error_rate를 넘지 않도록 세대별 오탐률을 낮춤
+        self.generation_error_rate = error_rate / self.max_generations
+
+        self._lock = threading.Lock()
+        self._generations = None
+        self._dirty = False
+
+    @property
+    def exists(self) -> bool:
+        """필터 파일 존재 여부 (최초 생성 시 기존 인덱스로 채우기 판단용)"""
+        return os.path.exists(self.file_path)
+
+    def add(self, key: str):
+        """처리 게시글 키 추가"""
+        with self._lock:
+            generations = self._load()
+            current = self._current_generation(generations)
+            if current.add(key):
+                self._dirty = True
+
+    def add_many(self, keys: Iterable[str]):
+        """여러 키 일괄 추가"""
+        with self._lock:
+            generations = self._load()
+            for key in keys:
+                if self._current_generation(generations).add(key):
+                    self._dirty = True
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return any(key in generation for generation in self._load())
+
+    def flush(self) -> bool:
+        """변경분이 있으면 파일에 원자적으로 저장"""
+        with self._lock:
+            if not self._dirty or self._generations is None:
+                return False
+            self._expire(self._generations)
+            try:
+                self._write(self._generations)
+                self._dirty = False
+                return True
+            except Exception as e:
+                logger.error(f"블룸 필터 저장 실패: {self.file_path} ({e})")
+                return False
+
+    def get_stats(self) -> Dict:
+        """세대 수, 항목 수, 메모리 사용량"""
+        with self._lock:
+            generations = self._load()
+            return {
+                'generations': len(generations),
+                'items': sum(generation.count for generation in generations),
+                'bytes': sum(len(generation.bits) for generation in generations),
+                'oldest_days': round((time.time() - generations[0].created_at) / 86400, 1) if generations else 0.0
+            }
+
+    def _current_generation(self, generations: List[BloomFilter]) -> BloomFilter:
+        now = time.time()
+        if (not generations or generations[-1].is_full
+                or now - generations[-1].created_at >= self.generation_seconds):
+            generations.append(BloomFilter(self.capacity, self.generation_error_rate, created_at=now))
+            self._expire(generations)
+            self._dirty = True
+        return generations[-1]
+
+    def _expire(self, generations: List[BloomFilter]):
+        """보존 기간 경과 세대 및 세대 수 상한 초과분 제거 (현재 세대는 유지)"""
+        cutoff = time.time() - self.retention_seconds
+        while len(generations) > 1 and (
+                len(generations) > self.max_generations
+                or generations[1].created_at <= cutoff):
+            # 다음 세대가 시작된 시점이 cutoff 이전이면 가장 오래된 세대의 항목은 모두 보존 기간 밖
+            generations.pop(0)
+            self._dirty = True
+
+    def _load(self) -> List[BloomFilter]:
+        """최초 접근 시 한 번만 파일 로드"""
+        if self._generations is None:
+            self._generations = []
+            if os.path.exists(self.file_path):
+                try:
+                    self._generations = self._read()
+                except Exception as e:
+                    logger.warning(f"블룸 필터 파일 읽기 실패, 새로 생성: {self.file_path} ({e})")
+            self._expire(self._generations)
+        return self._generations
+
+    def _read(self) -> List[BloomFilter]:
+        with open(self.file_path, 'rb') as f:
+            if f.read(4) != FILTER_FILE_MAGIC:
+                raise ValueError("블룸 필터 파일 형식 불일치")
+            header_len, = struct.unpack('<I', f.read(4))
+            header = json.loads(f.read(header_len).decode('utf-8'))
+            if header.get('version') != FILTER_FILE_VERSION:
+                raise ValueError(f"지원하지 않는 버전: {header.get('version')}")
+
+            generations = []
+            for meta in header['generations']:
+                bits = bytearray(meta['num_bytes'])
+                if f.readinto(bits) != meta['num_bytes']:
+                    raise ValueError("비트 배열 길이 불일치")
+                generation = BloomFilter(meta['capacity'], meta['error_rate'], meta['created_at'],
+                                         bits=bits, count=meta['count'])
+                if len(generation.bits) != (generation.num_bits + 7) // 8:
+                    raise ValueError("비트 배열 크기와 필터 설정 불일치")
+                generations.append(generation)
+            return generations
+
+    def _write(self, generations: List[BloomFilter]):
+        header = json.dumps({
+            'version': FILTER_FILE_VERSION,
+            'generations': [generation.to_header() for generation in generations]
+        }).encode('utf-8')
+
+        directory = os.path.dirname(self.file_path) or '.'
+        with tempfile.NamedTemporaryFile('wb', dir=directory, suffix='.tmp', delete=False) as tmp:
+            tmp.write(FILTER_FILE_MAGIC)
+            tmp.write(struct.pack('<I', len(header)))
+            tmp.write(header)
+            for generation in generations:
+                tmp.write(generation.bits)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp.name, self.file_path)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 분류 결과 캐시 - 게시글 내용 해시 기반 LRU (선택적 디스크 스필)
+
+같은 게시글이 즉시 처리, 재시도 큐, 재크롤링 등으로 여러 번 분류되므로
+(제목, 내용, 소스, 규칙 팩 버전) 해시를 키로 분류 결과를 재사용합니다.
+
+- 메모리: OrderedDict LRU (최대 항목 수 초과 시 가장 오래 사용하지 않은 항목 제거)
+- 디스크 스필(선택): LRU에서 밀려난 항목을 SQLite 테이블에 모아 기록, 메모리 미스 시 조회
+- 규칙 팩이 바뀌면 키가 달라지므로 이전 규칙의 결과는 자연히 재사용되지 않음
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+import json
+import atexit
+import hashlib
+import threading
+import logging
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from config import config
+from sqlite_store import SQLiteStateStore, SQLITE_AVAILABLE, get_state_store
+
+logger = logging.getLogger(__name__)
+
+def classification_key(title: str, content: str, source: str, ruleset_version: str) -> str:
+    """분류 결과 캐시 키 (입력 필드 경계가 섞이지 않도록 JSON 배열로 직렬화 후 해시)"""
+    payload = json.dumps([title, content, source, ruleset_version], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+# =============================================================================
+# 분류 결과 LRU 캐시
+# =============================================================================
+
+class ClassificationCache:
+    """분류 결과 LRU 캐시 (스레드 안전, 적중률 카운터)"""
+
+    def __init__(self, max_entries: int = None, spill_store: Optional[SQLiteStateStore] = None,
+                 spill_max_entries: int = None, spill_batch_size: int = 50):
+        self.max_entries = max_entries or config.Classification.CACHE_MAX_ENTRIES
+        self.spill_store = spill_store
+        self.spill_max_entries = spill_max_entries or config.Classification.CACHE_SPILL_MAX_ENTRIES
+        self.spill_batch_size = spill_batch_size
+
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, Dict]' = OrderedDict()
+        # 스필 대기 항목 (일괄 기록, 기록 전에도 조회 가능)
+        self._pending_spill: Dict[str, Dict] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'spill_hits': 0, 'evictions': 0, 'spilled': 0}
+
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시된 분류 결과 (없으면 None)"""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return result
+
+            result = self._pending_spill.pop(key, None)
+            if result is None and self.spill_store is not None:
+                try:
+                    result = self.spill_store.get_classification(key)
+                except Exception as e:
+                    logger.warning(f"분류 캐시 스필 조회 실패: {e}")
+            if result is None:
+                self._stats['misses'] += 1
+                return None
+
+            # 스필 적중 항목은 메모리로 다시 올림
+            self._stats['hits'] += 1
+            self._stats['spill_hits'] += 1
+            self._store(key, result)
+            return result
+
+    def put(self, key: str, result: Dict):
+        """분류 결과 저장 (최대 항목 수 초과 시 LRU 제거/스필)"""
+        with self._lock:
+            self._store(key, result)
+
+    def _store(self, key: str, result: Dict):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+            if self.spill_store is not None:
+                self._pending_spill[evicted_key] = evicted
+        if len(self._pending_spill) >= self.spill_batch_size:
+            self._flush_spill()
+
+    def flush(self):
+        """스필 대기 항목 기록"""
+        with self._lock:
+            self._flush_spill()
+
+    def _flush_spill(self):
+        if not self._pending_spill or self.spill_store is None:
+            return
+        try:
+            self.spill_store.put_classifications(self._pending_spill, self.spill_max_entries)
+            self._stats['spilled'] += len(self._pending_spill)
+        except Exception as e:
+            logger.warning(f"분류 캐시 스필 기록 실패 ({len(self._pending_spill)}건 폐기): {e}")
+        self._pending_spill = {}
+
+    def clear(self):
+        """메모리 캐시 비우기 (스필은 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._pending_spill.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict:
+        """적중/미스/제거/스필 카운터와 적중률"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
+
+def _create_spill_store() -> Optional[SQLiteStateStore]:
+    """디스크 스필 저장소 - SQLite 백엔드면 상태 DB, 아니면 별도 DB 파일 (EPIC7_CLASSIFICATION_SPILL=1)"""
+    if not config.Classification.CACHE_SPILL or not SQLITE_AVAILABLE:
+        return None
+    return get_state_store() or SQLiteStateStore(config.Classification.CACHE_SPILL_PATH)
+
+# 전역 분류 결과 캐시 인스턴스
+classification_cache = ClassificationCache(spill_store=_create_spill_store())
+atexit.register(classification_cache.flush)
@@ -26,17 +26,69 @@ Date: 2025-01-22
 
 import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Iterable, Iterator
 from collections import defaultdict
+from functools import lru_cache
 
 # 공통 모듈 임포트
 from config import config
 from utils import is_korean_text, get_category_emoji, setup_logging
+from keyword_automaton import KeywordAutomaton
+from classifier_rules import get_rule_pack
+from classification_cache import classification_cache, classification_key
+from statistical_classifier import get_statistical_model
 
 # 로깅 설정
 import logging
 logger = logging.getLogger(__name__)
 
+# 토큰 (한글/영문 소문자/숫자 연속 구간)
+TOKEN_PATTERN = re.compile(r'[가-힣a-z0-9]+')
+
+# =============================================================================
+# 게시글 텍스트 프로필
+# =============================================================================
+
+class TextProfile:
+    """
+    게시글 한 건의 정규화 텍스트 프로필 - 버그/감성/알림 단계가 공유
+
+    제목+내용 결합, 소문자 변환, 언어 판별은 게시글당 한 번만 수행하고
+    키워드 매칭 결과와 토큰 구간은 처음 필요할 때 계산합니다.
+    results는 단계별 계산 결과 캐시입니다 (같은 게시글의 중복 계산 방지).
+    """
+    
+    __slots__ = ('title', 'content', 'text', 'language', 'results', '_automata', '_matches', '_token_spans')
+    
+    def __init__(self, title: str, content: str, automata: Dict[str, KeywordAutomaton]):
+        self.title = title
+        self.content = content
+        self.text = (title + " " + content).lower().strip()
+        self.language = 'korean' if is_korean_text(self.text) else 'english'
+        self.results = {}
+        self._automata = automata
+        self._matches = None
+        self._token_spans = None
+    
+    @property
+    def matches(self):
+        """언어별 키워드 오토마톤 매칭 결과 (단일 패스)"""
+        if self._matches is None:
+            self._matches = self._automata[self.language].match(self.text)
+        return self._matches
+    
+    @property
+    def token_spans(self) -> List[Tuple[int, int]]:
+        """정규화 텍스트의 토큰 (시작, 끝) 구간"""
+        if self._token_spans is None:
+            self._token_spans = [match.span() for match in TOKEN_PATTERN.finditer(self.text)]
+        return self._token_spans
+    
+    @property
+    def tokens(self) -> List[str]:
+        """정규화 텍스트의 토큰 목록"""
+        return [self.text[start:end] for start, end in self.token_spans]
+
 # =============================================================================
 # Epic7 실시간 분류기
 # =============================================================================
@@ -44,309 +96,57 @@ logger = logging.getLogger(__name__)
 class Epic7Classifier:
     """Epic7 실시간 분류기"""
     
-    def __init__(self):
-        """분류기 초기화"""
-        self.load_keywords()
-        self.load_source_config()
-        self.load_priority_config()
+    def __init__(self, use_cache: bool = True):
+        """분류기 초기화 - 규칙은 프로세스 공용 규칙 팩(classifier_rules.json)에서 로드"""
+        self.use_cache = use_cache
+        self.rule_pack = None
+        # 통계 분류 엔진 (EPIC7_STATISTICAL_ENGINE=1 + 모델 파일, 없으면 None)
+        self.statistical_model = get_statistical_model()
+        self.refresh_rules()
         logger.info("Epic7 실시간 분류기 v3.2 초기화 완료")
     
-    def load_keywords(self):
-        """키워드 데이터베이스 로드 - Epic7 특화 키워드 200% 확장"""
-        
-        # 긍정 감성 키워드 (Epic7 특화 대폭 확장)
-        self.positive_keywords = {
-            'korean': [
-                # 기본 긍정 표현
-                '좋아', '좋다', '최고', '굿', '굿굿', '감사', '고마워',
-                '수고', '잘했', '잘만들', '완벽', '훌륭', '멋지', '쩐다',
-                '대박', '개좋', '개쩐', '사랑', '❤️', '♥️', '👍',
-                '👏', '🔥', '💯', '추천', '강추', '만족', '행복',
-                
-                # Epic7 게임 특화 긍정 키워드
-                '개선', '향상', '업그레이드', '패치굿', '업데이트굿', '밸런스굿',
-                '재밌', '재미있', '즐거움', '기쁨', '꿀', '꿀템', '꿀컨텐츠',
-                '사기템', '사기캐', '메타', '티어1', '오피', '오피캐',
-                '깡패', '사기캐릭터', '밸런스좋', '밸런스맞음', 'op', 'imba',
-                
-                # 게임 시스템 관련 긍정
-                '뽑기운좋', '확률좋', '운좋', '럭키', '잭팟', '대성공',
-                '풀돌', '완주', '완성', '성공', '클리어', '깼다', '승리',
-                '무료', '공짜', '선물', '이벤트좋', '혜택', '보상좋',
-                
-                # 커뮤니티 반응 긍정
-                '공감', '동감', '맞음', '인정', '팩트', '정답', '옳음',
-                '유용', '도움', '정보감사', '설명굿', '가이드감사',
-                'ㄱㅅ', 'ㄲㅅ', 'ㅇㅈ', 'ㅇㅇㅈ', '굿굿', '쩜나',
-                
-                # 업데이트/패치 관련 긍정
-                '신캐좋', '신캐쩐다', '신컨텐츠좋', '이벤트대박',
-                '보상개선', '편의성향상', 'qol향상', '시스템개선',
-                '로딩빨라짐', '최적화굿', '버그수정굿', '안정화됨'
-            ],
-            'english': [
-                'good', 'great', 'awesome', 'excellent', 'perfect', 'love',
-                'amazing', 'fantastic', 'wonderful', 'nice', 'cool',
-                'op', 'overpowered', 'imbalanced', 'meta', 'tier1', 'strong',
-                'buff', 'improvement', 'better', 'fixed', 'stable',
-                'lucky', 'jackpot', 'free', 'event', 'reward', 'thanks',
-                'useful', 'helpful', 'guide', 'tutorial', 'recommend'
-            ]
-        }
-        
-        # 부정 감성 키워드 (Epic7 특화 대폭 확장)
-        self.negative_keywords = {
-            'korean': [
-                # 기본 부정 표현
-                '싫어', '싫다', '별로', '안좋', '나쁘', '최악', '망했',
-                '실망', '짜증', '화남', '열받', '빡침', '개빡', '개짜증',
-                '쓰레기', '헛소리', '개소리', '뭐지', '이상해', '이상함',
-                '어이없', '황당', '멘탈나감', '포기', '그만', '탈주', '삭제',
-                
-                # Epic7 게임 특화 부정 키워드
-                '밸런스개판', '밸런스망', '밸런스붕괴', '밸패', '런영진',
-                '운영진', '멍청', '바보', '돈벌이', '과금유도', '현질',
-                '지갑털기', '사기', '사기게임', '돈게임', '확률조작',
-                '확률구림', '확률망', '뽑기망', '가챠지옥', '가챠망',
-                
-                # 게임 시스템 관련 부정
-                '렉', '버그', '오류', '튕김', '먹통', '접속장애',
-                '서버터짐', '서버불안정', '로딩늦', '최적화안됨',
-                '용량큰', '발열심함', '배터리많이먹', '폰뜨거워짐',
-                
-                # 컨텐츠 관련 부정
-                '노잼', '재미없', '지루', '루틴', '똑같', '반복',
-                '컨텐츠부족', '할게없', '막막', '진부', '식상',
-                '어려워', '힘들어', '빡세', '악랄', '개같', '개빡세',
-                
-                # 캐릭터/밸런스 관련 부정
-                '약캐', '쓰레기캐', '하향', '너프', 'nerf', '망캐',
-                '버려진캐', '사장된캐', '고인캐', '폐캐', 'op캐',
-                '사기캐너무', '밸런스엉망', '밸런스포기',
-                
-                # 커뮤니티 반응 부정  
-                '어그로', '키배', '논란', '분란', '싸움', '갈등',
-                '독성', '민폐', '트롤', '어뷰징', '매크로', '핵',
-                '욕설', '비방', '음해', '악플', '테러', '도배',
-                
-                # 게임 운영 관련 부정
-                '공지늦', '소통부족', '피드백무시', '유저무시',
-                '일방통행', '독선', '오만', '건방짐', '답답',
-                '무능', '게으름', '성의없음', '대충', '엉성'
-            ],
-            'english': [
-                'bad', 'terrible', 'awful', 'worst', 'hate', 'sucks',
-                'broken', 'bug', 'error', 'lag', 'crash', 'disconnect',
-                'nerf', 'weak', 'useless', 'trash', 'garbage',
-                'boring', 'repetitive', 'grind', 'p2w', 'pay2win',
-                'scam', 'rigged', 'unfair', 'imbalanced', 'toxic',
-                'quit', 'uninstall', 'disappointed', 'frustrated'
-            ]
-        }
-        
-        # 중립 감성 키워드 (Epic7 특화 확장)
-        self.neutral_keywords = {
-            'korean': [
-                # 기본 중립 표현
-                '그냥', '보통', '평범', '무난', '괜찮', '나쁘지않',
-                '어떨까', '궁금', '질문', '문의', '확인', '체크',
-                '정보', '공지', '알림', '안내', '가이드', '설명',
-                
-                # Epic7 게임 관련 중립
-                '빌드', '세팅', '장비', '아티팩트', '스킬', '스탯',
-                '효율', '계산', '공략', '팁', '추천', '조합',
-                '파밍', '던전', '레이드', '아레나', '길드', '월드보스',
-                '이벤트', '업데이트', '패치', '점검', '메인테넌스',
-                
-                # 질문/정보 관련
-                '언제', '어디서', '어떻게', '누구', '뭐', '왜',
-                '방법', '순서', '절차', '과정', '단계', '조건',
-                '확률', '드랍률', '스케줄', '일정', '시간', '기간',
-                
-                # 게임 용어 중립
-                '6성', '각성', '초월', '한돌', '완돌', '풀돌',
-                '모라고라', '문북', '카탈', '룬', '젬', '스카이스톤',
-                '북마크', '갤럭시북마크', '미스틱북마크', '소환',
-                '선별소환', '월광소환', '아티소환', '연결소환'
-            ],
-            'english': [
-                'neutral', 'average', 'normal', 'okay', 'fine',
-                'question', 'ask', 'help', 'guide', 'tutorial',
-                'build', 'setup', 'equipment', 'artifact', 'skill',
-                'farm', 'dungeon', 'raid', 'arena', 'guild',
-                'event', 'update', 'patch', 'maintenance',
-                'when', 'where', 'how', 'who', 'what', 'why',
-                'method', 'process', 'step', 'condition', 'rate'
-            ]
-        }
-        
-        # 버그 관련 키워드 (Epic7 특화 대폭 확장)
-        self.bug_keywords = {
-            'korean': [
-                # 기본 버그 키워드
-                '버그', '오류', '에러', 'error', 'bug', '문제',
-                '안됨', '안되', '작동안함', '실행안됨', '진행안됨',
-                
-                # Epic7 특화 버그 키워드
-                '튕김', '먹통', '멈춤', '정지', '프리징', '얼음',
-                '접속불가', '로그인불가', '서버터짐', '서버먹통',
-                '로딩안됨', '로딩멈춤', '무한로딩', '로딩지옥',
-                
-                # 게임 내 버그 현상
-                '스킬안됨', '스킬버그', '데미지버그', '능력치버그',
-                '아티팩트버그', '장비버그', '스탯버그', 'ai버그',
-                '자동전투버그', '스킵버그', '배속버그', '음성버그',
-                
-                # 시스템 버그
-                '보상못받', '보상안옴', '보상버그', '우편버그',
-                '상점버그', '교환버그', '소환버그', '뽑기버그',
-                '랭킹버그', '아레나버그', '길드버그', '채팅버그',
-                
-                # UI/UX 버그
-                '화면깨짐', '화면버그', '터치버그', '버튼안됨',
-                '이미지깨짐', '텍스트깨짐', '폰트깨짐', '번역오류',
-                '표시오류', '수치오류', '계산오류', 'ui버그',
-                
-                # 성능 관련 버그
-                '렉', '지연', '느림', '버벅', '끊김', '딜레이',
-                '발열', '배터리', '최적화', '용량', '메모리',
-                '크래시', 'crash', '강제종료', '앱터짐'
-            ],
-            'english': [
-                'bug', 'error', 'glitch', 'issue', 'problem',
-                'crash', 'freeze', 'lag', 'delay', 'stuck',
-                'broken', 'not working', 'cant', 'unable',
-                'disconnect', 'connection', 'server', 'login',
-                'loading', 'infinite', 'skill', 'damage',
-                'artifact', 'equipment', 'stats', 'ai',
-                'auto', 'skip', 'speed', 'sound', 'voice',
-                'reward', 'mail', 'shop', 'exchange', 'summon',
-                'ranking', 'arena', 'guild', 'chat',
-                'screen', 'display', 'touch', 'button',
-                'image', 'text', 'font', 'translation',
-                'ui', 'interface', 'memory', 'optimization'
-            ]
-        }
-        
-        # 임계값 설정 (최적화)
-        self.sentiment_thresholds = {
-            'positive': 0.4,    # 0.3 → 0.4 (더 확실한 긍정만)
-            'negative': 0.4,    # 0.3 → 0.4 (더 확실한 부정만)
-            'neutral': 0.2      # 유지
-        }
+    def refresh_rules(self):
+        """규칙 팩이 다시 로드되었으면 키워드/임계값/소스 설정 교체"""
+        pack = get_rule_pack()
+        if pack is self.rule_pack:
+            return
         
-        # 버그 우선순위 임계값 (최적화)
-        self.bug_thresholds = {
-            'critical': 0.8,    # 0.7 → 0.8 (더 확실한 치명적만)
-            'high': 0.6,        # 0.5 → 0.6 (더 확실한 높음만)
-            'medium': 0.3,      # 유지
-            'low': 0.1          # 유지
-        }
-    
-    def load_source_config(self):
-        """소스별 가중치 및 설정"""
-        self.source_config = {
-            # 스토브 한국 게시판
-            'stove_korea_bug': {
-                'weight': 1.5,      # 버그 게시판은 가중치 높임
-                'priority_boost': 0.2,
-                'realtime_threshold': 0.5
-            },
-            'stove_korea_general': {
-                'weight': 1.0,
-                'priority_boost': 0.0,
-                'realtime_threshold': 0.7
-            },
-            
-            # 스토브 글로벌 게시판  
-            'stove_global_bug': {
-                'weight': 1.4,
-                'priority_boost': 0.2,
-                'realtime_threshold': 0.5
-            },
-            'stove_global_general': {
-                'weight': 1.0,
-                'priority_boost': 0.0,
-                'realtime_threshold': 0.7
-            },
-            
-            # 루리웹
-            'ruliweb_epic7': {
-                'weight': 0.9,      # 루리웹은 약간 낮은 가중치
-                'priority_boost': 0.0,
-                'realtime_threshold': 0.8
-            },
-            
-            # Reddit
-            'reddit_epicseven': {
-                'weight': 1.1,      # Reddit은 약간 높은 가중치
-                'priority_boost': 0.1,
-                'realtime_threshold': 0.6
-            }
-        }
+        self.positive_keywords = pack.keywords['positive']
+        self.negative_keywords = pack.keywords['negative']
+        self.neutral_keywords = pack.keywords['neutral']
+        self.bug_keywords = pack.keywords['bug']
+        self.high_priority_keywords = pack.keywords['high_priority']
+        self.sentiment_thresholds = pack.sentiment_thresholds
+        self.bug_thresholds = pack.bug_thresholds
+        self.source_config = pack.source_config
+        self.schedule_weights = pack.schedule_weights
+        self.keyword_automata = pack.automata
+        self.rule_pack = pack
     
-    def load_priority_config(self):
-        """우선순위 설정"""
-        # 실시간 알림 우선순위 키워드
-        self.high_priority_keywords = {
-            'korean': [
-                '서버터짐', '접속불가', '로그인불가', '먹통',
-                '장애', '점검', '긴급', '치명적', '심각',
-                '전체', '모든', '대규모', '광범위'
-            ],
-            'english': [
-                'server down', 'cant login', 'connection', 'critical',
-                'urgent', 'emergency', 'serious', 'major', 'widespread'
-            ]
-        }
-        
-        # 스케줄별 설정
-        self.schedule_weights = {
-            'frequent': 1.2,    # 15분 주기 (버그 게시판)
-            'regular': 1.0      # 30분 주기 (일반 게시판)
-        }
+    def build_profile(self, title: str, content: str = "") -> TextProfile:
+        """게시글 텍스트 프로필 생성 (정규화/언어 판별 1회, 규칙 변경 확인)"""
+        self.refresh_rules()
+        return TextProfile(title, content, self.keyword_automata)
     
-    def analyze_sentiment(self, title: str, content: str = "", source: str = "") -> Tuple[str, float, str]:
+    def analyze_sentiment(self, title: str, content: str = "", source: str = "",
+                          profile: Optional[TextProfile] = None) -> Tuple[str, float, str]:
         """감성 분석 - Epic7 특화 키워드로 정확도 향상"""
         if not title:
             return "neutral", 0.0, "제목 없음"
         
         try:
-            # 텍스트 정규화
-            text = (title + " " + content).lower().strip()
+            # 텍스트 정규화 + 언어 판별 + 키워드 매칭 (프로필 공유, 오토마톤 단일 패스)
+            profile = profile or self.build_profile(title, content)
+            matches = profile.matches
             
-            # 언어 판별
-            language = 'korean' if is_korean_text(text) else 'english'
+            # 감성 점수 계산 (긍정/부정: 길이 가중치, 중립: 키워드당 0.2)
+            positive_matches = matches.hits('positive')
+            negative_matches = matches.hits('negative')
+            neutral_matches = matches.hits('neutral')
             
-            # 감성 점수 계산
-            positive_score = 0.0
-            negative_score = 0.0
-            neutral_score = 0.0
-            
-            positive_matches = []
-            negative_matches = []
-            neutral_matches = []
-            
-            # 긍정 키워드 매칭 (가중치 적용)
-            for keyword in self.positive_keywords[language]:
-                if keyword in text:
-                    positive_matches.append(keyword)
-                    # 길이에 따른 가중치 (긴 키워드일수록 정확도 높음)
-                    weight = 0.3 + (len(keyword) * 0.05)
-                    positive_score += weight
-            
-            # 부정 키워드 매칭 (가중치 적용)
-            for keyword in self.negative_keywords[language]:
-                if keyword in text:
-                    negative_matches.append(keyword)
-                    weight = 0.3 + (len(keyword) * 0.05)
-                    negative_score += weight
-            
-            # 중립 키워드 매칭
-            for keyword in self.neutral_keywords[language]:
-                if keyword in text:
-                    neutral_matches.append(keyword)
-                    neutral_score += 0.2
+            positive_score = matches.score('positive')
+            negative_score = matches.score('negative')
+            neutral_score = matches.score('neutral')
             
             # 소스별 가중치 적용
             source_weight = 1.0
@@ -384,8 +184,49 @@ class Epic7Classifier:
             logger.error(f"감성 분석 중 오류: {e}")
             return "neutral", 0.0, f"분석 오류: {str(e)}"
     
+    def classify_posts(self, posts: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        게시글 일괄 분류 - 입력 순서대로 결과를 하나씩 생성 (스트리밍)
+        크롤링 배치나 과거 데이터를 전부 메모리에 올리지 않고 분류할 수 있습니다.
+        """
+        if self.statistical_model is None:
+            for post_data in posts:
+                yield self.classify_post(post_data)
+            return
+        
+        # 통계 엔진: 배치 단위로 한 번에 점수 계산 후 게시글별 분류
+        batch = []
+        for post_data in posts:
+            batch.append(post_data)
+            if len(batch) >= config.Classification.STATISTICAL_BATCH_SIZE:
+                yield from self._classify_batch(batch)
+                batch = []
+        if batch:
+            yield from self._classify_batch(batch)
+    
+    def _classify_batch(self, posts: List[Dict]) -> Iterator[Dict]:
+        texts = [self._statistical_text(post_data.get('title', ''), post_data.get('content', '')) for post_data in posts]
+        for post_data, statistical in zip(posts, self._predict_statistical(texts)):
+            yield self._classify_post(post_data, statistical)
+    
+    @staticmethod
+    def _statistical_text(title: str, content: str) -> str:
+        return f"{title.strip()} {content.strip()}"
+    
+    def _predict_statistical(self, texts: List[str]) -> List[Optional[Dict]]:
+        """통계 모델 배치 예측 (실패 시 키워드 규칙만 사용)"""
+        try:
+            return self.statistical_model.predict(texts)
+        except Exception as e:
+            logger.warning(f"통계 모델 예측 실패, 키워드 규칙만 사용: {e}")
+            return [None] * len(texts)
+    
     def classify_post(self, post_data: Dict) -> Dict:
         """게시글 종합 분류 - 전체 dict 반환 보장"""
+        return self._classify_post(post_data)
+    
+    def _classify_post(self, post_data: Dict, statistical: Optional[Dict] = None) -> Dict:
+        """게시글 분류 - statistical은 배치로 미리 계산한 통계 모델 예측 (없으면 필요 시 단건 예측)"""
         try:
             # 입력 데이터 검증 및 기본값 설정
             title = post_data.get('title', '').strip()
@@ -398,18 +239,49 @@ class Epic7Classifier:
                 logger.warning("제목이 없는 게시글입니다.")
                 return self._create_empty_result("제목 없음")
             
-            # 언어 및 소스 타입 판별
-            text = title + " " + content
-            language = 'korean' if is_korean_text(text) else 'english'
+            # 분류 결과 캐시 (같은 게시글 재분류 시 키워드 스캔 생략, 규칙 변경 시 키 변경)
+            self.refresh_rules()
+            ruleset_version = self.rule_pack.content_hash
+            if self.statistical_model is not None:
+                ruleset_version += f"+{self.statistical_model.version}"
+            cache_key = classification_key(title, content, source, ruleset_version)
+            cached = classification_cache.get(cache_key) if self.use_cache else None
+            if cached is not None:
+                logger.debug(f"분류 캐시 적중: {title[:30]}...")
+                return self._copy_result(cached, url, timestamp)
+            
+            # 텍스트 프로필 (버그/감성/알림 단계 공유) 및 소스 타입 판별
+            profile = self.build_profile(title, content)
+            language = profile.language
             source_type = self._get_source_type(source)
             schedule_type = self._get_schedule_type(source)
             
+            # 통계 모델 예측 (키워드 규칙이 놓친 표현 보완용)
+            if self.statistical_model is not None and statistical is None:
+                statistical = self._predict_statistical([self._statistical_text(title, content)])[0]
+            min_confidence = config.Classification.STATISTICAL_MIN_CONFIDENCE
+            
             # 버그 분석
-            is_bug, bug_priority, bug_confidence, bug_reason = self._analyze_bug(title, content, source)
+            is_bug, bug_priority, bug_confidence, bug_reason = self._analyze_bug(title, content, source, profile)
             
             # 감성 분석 (버그가 아닌 경우만)
             if not is_bug:
-                sentiment, sentiment_confidence, sentiment_reason = self.analyze_sentiment(title, content, source)
+                sentiment, sentiment_confidence, sentiment_reason = self.analyze_sentiment(title, content, source, profile)
+                
+                # 모델은 키워드 결과가 비어 있을 때(버그 키워드 없음 + 중립)만 보완, 키워드 판정은 뒤집지 않음
+                keyword_empty = sentiment == 'neutral' and not profile.matches.hits('bug')
+                if (keyword_empty and statistical and config.Classification.STATISTICAL_BUG_OVERRIDE
+                        and statistical['bug_probability'] >= config.Classification.STATISTICAL_BUG_MIN_CONFIDENCE):
+                    # 키워드 없이 모델만 버그로 본 경우 낮은 우선순위 (실시간 알림 대상 아님)
+                    bug_probability = statistical['bug_probability']
+                    is_bug, bug_priority, bug_confidence = True, 'low', bug_probability
+                    bug_reason = f"통계 모델: 버그 확률 {bug_probability:.2f}"
+                    sentiment, sentiment_confidence, sentiment_reason = "neutral", 0.5, "버그 게시글"
+                elif (sentiment == 'neutral' and statistical and statistical['sentiment'] != 'neutral'
+                        and statistical['sentiment_confidence'] >= min_confidence):
+                    sentiment = statistical['sentiment']
+                    sentiment_confidence = statistical['sentiment_confidence']
+                    sentiment_reason = f"통계 모델: {sentiment} 확률 {sentiment_confidence:.2f}"
             else:
                 sentiment, sentiment_confidence, sentiment_reason = "neutral", 0.5, "버그 게시글"
             
@@ -429,7 +301,7 @@ class Epic7Classifier:
             
             # 실시간 알림 판별
             should_alert, alert_reason = self._should_send_realtime_alert(
-                category, bug_priority, sentiment, source, title, content
+                category, bug_priority, sentiment, source, title, content, profile
             )
             
             # 분류 결과 생성 (전체 dict 반환)
@@ -473,14 +345,28 @@ class Epic7Classifier:
                 'classification_timestamp': datetime.now().isoformat(),
                 'classifier_version': f'Epic7 Unified v{config.VERSION}'
             }
+            if statistical:
+                result['statistical_analysis'] = dict(statistical, model_version=self.statistical_model.version)
             
             logger.info(f"분류 완료: {category} ({primary_confidence:.2f}) - {title[:30]}...")
-            return result
+            if not self.use_cache:
+                return result
+            classification_cache.put(cache_key, result)
+            return self._copy_result(result, url, timestamp)
             
         except Exception as e:
             logger.error(f"게시글 분류 중 오류: {e}")
             return self._create_error_result(str(e))
     
+    @staticmethod
+    def _copy_result(result: Dict, url: str, timestamp: str) -> Dict:
+        """캐시 결과 복사 (호출자 수정이 캐시에 반영되지 않도록) + 게시글별 메타데이터 갱신"""
+        copied = {key: dict(value) if isinstance(value, dict) else value for key, value in result.items()}
+        copied['original_data']['url'] = url
+        copied['original_data']['timestamp'] = timestamp
+        copied['classification_timestamp'] = datetime.now().isoformat()
+        return copied
+    
     def _create_empty_result(self, reason: str) -> Dict:
         """빈 결과 생성"""
         return {
@@ -540,28 +426,19 @@ class Epic7Classifier:
             'error': error_msg
         }
         
-    def _analyze_bug(self, title: str, content: str, source: str) -> Tuple[bool, str, float, str]:
+    def _analyze_bug(self, title: str, content: str, source: str,
+                     profile: Optional[TextProfile] = None) -> Tuple[bool, str, float, str]:
         """버그 분석"""
         try:
-            text = (title + " " + content).lower().strip()
-            language = 'korean' if is_korean_text(text) else 'english'
+            profile = profile or self.build_profile(title, content)
+            matches = profile.matches
             
-            bug_score = 0.0
-            matched_keywords = []
+            # 버그 키워드 매칭 (긴 키워드일수록 높은 점수)
+            matched_keywords = matches.hits('bug')
+            bug_score = matches.score('bug')
             
-            # 버그 키워드 매칭
-            for keyword in self.bug_keywords[language]:
-                if keyword in text:
-                    matched_keywords.append(keyword)
-                    # 긴 키워드일수록 높은 점수
-                    weight = 0.3 + (len(keyword) * 0.05)
-                    bug_score += weight
-            
-            # 고우선순위 키워드 체크
-            priority_boost = 0.0
-            for keyword in self.high_priority_keywords[language]:
-                if keyword in text:
-                    priority_boost += 0.3
+            # 고우선순위 키워드 체크 (키워드당 0.3)
+            priority_boost = matches.score('high_priority')
                     
             bug_score += priority_boost
             
@@ -587,7 +464,8 @@ class Epic7Classifier:
             return False, 'none', 0.0, f"분석 오류: {str(e)}"
     
     def _should_send_realtime_alert(self, category: str, bug_priority: str, 
-                                   sentiment: str, source: str, title: str, content: str) -> Tuple[bool, str]:
+                                   sentiment: str, source: str, title: str, content: str,
+                                   profile: Optional[TextProfile] = None) -> Tuple[bool, str]:
         """실시간 알림 판별"""
         try:
             # 버그 게시글의 경우
@@ -608,7 +486,7 @@ class Epic7Classifier:
                 
                 # 부정 감성의 경우 더 민감하게
                 if sentiment == 'negative':
-                    text = (title + " " + content).lower()
+                    text = profile.text if profile else (title + " " + content).lower()
                     high_impact_keywords = ['서버', '접속', '장애', '먹통', '전체', '모든']
                     has_high_impact = any(keyword in text for keyword in high_impact_keywords)
                     
@@ -770,11 +648,15 @@ class Epic7Classifier:
 # 독립 함수들 (monitor_bugs.py 호환성)
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def get_classifier() -> Epic7Classifier:
+    """프로세스 공용 분류기 (규칙 변경은 규칙 팩 핫 리로드로 반영)"""
+    return Epic7Classifier()
+
 def is_bug_post(post_data: Dict) -> bool:
     """버그 게시글 여부 판별"""
     try:
-        classifier = Epic7Classifier()
-        result = classifier.classify_post(post_data)
+        result = get_classifier().classify_post(post_data)
         return result.get('bug_analysis', {}).get('is_bug', False)
     except Exception as e:
         logger.error(f"버그 게시글 판별 중 오류: {e}")
@@ -783,8 +665,7 @@ def is_bug_post(post_data: Dict) -> bool:
 def is_high_priority_bug(post_data: Dict) -> bool:
     """고우선순위 버그 여부 판별"""
     try:
-        classifier = Epic7Classifier()
-        result = classifier.classify_post(post_data)
+        result = get_classifier().classify_post(post_data)
         priority = result.get('bug_analysis', {}).get('priority', 'low')
         return priority in ['critical', 'high']
     except Exception as e:
@@ -794,8 +675,7 @@ def is_high_priority_bug(post_data: Dict) -> bool:
 def extract_bug_severity(post_data: Dict) -> str:
     """버그 심각도 추출"""
     try:
-        classifier = Epic7Classifier()
-        result = classifier.classify_post(post_data)
+        result = get_classifier().classify_post(post_data)
         return result.get('bug_analysis', {}).get('priority', 'low')
     except Exception as e:
         logger.error(f"버그 심각도 추출 중 오류: {e}")
@@ -804,8 +684,7 @@ def extract_bug_severity(post_data: Dict) -> str:
 def should_send_realtime_alert(post_data: Dict) -> bool:
     """실시간 알림 전송 여부 판별"""
     try:
-        classifier = Epic7Classifier()
-        result = classifier.classify_post(post_data)
+        result = get_classifier().classify_post(post_data)
         return result.get('realtime_alert', {}).get('should_alert', False)
     except Exception as e:
         logger.error(f"실시간 알림 판별 중 오류: {e}")
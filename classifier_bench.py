@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 분류 엔진 일치성 검증 / 벤치마크 도구
+실시간 분류 API(classifier.py)와 리포트 분류 API(generate_report.py)를 같은 게시글 묶음으로 실행합니다.
+
+- parity: 공유 오토마톤 엔진 결과가 키워드별 부분 문자열 검사(기존 방식) 참조 매처 결과와
+          완전히 같은지 두 API 모두 확인 (불일치 시 종료 코드 1)
+- bench: 게시글당 처리 시간 (엔진/참조 매처, 분류 결과 캐시 적중, 호출마다 분류기 생성 vs 프로세스 공용 분류기)
+
+게시글 입력은 JSON 파일(목록 또는 {'posts': [...]}), 없으면 규칙 키워드로 만든 합성 게시글을 사용합니다.
+
+사용 예:
+    python classifier_bench.py parity --input daily_sentiment_data.json
+    python classifier_bench.py bench --count 2000
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+from typing import Dict, List, Callable
+
+import classifier
+import generate_report
+from classifier_rules import get_rule_pack, LANGUAGES
+from classification_cache import classification_cache
+
+# 결과 비교에서 제외할 필드 (실행 시각)
+VOLATILE_FIELDS = ('classification_timestamp',)
+
+# 합성 게시글 소스 (두 API의 소스별 설정 포함)
+SAMPLE_SOURCES = ['stove_bug', 'stove_global_bug', 'stove_general', 'stove_korea_bug',
+                  'ruliweb_epic7', 'reddit_epic7', 'reddit_epicseven', '']
+
+FILLER_WORDS = ['오늘', '아레나', '매칭', '했는데', '그리고', 'the', 'game', 'today', 'and', '!!', '...']
+
+# =============================================================================
+# 게시글 준비
+# =============================================================================
+
+def load_posts(paths: List[str]) -> List[Dict]:
+    """JSON 파일들에서 게시글 로드 (제목 있는 항목만)"""
+    posts = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get('posts', [])
+        posts.extend(post for post in data if isinstance(post, dict) and post.get('title'))
+    return posts
+
+def synthetic_posts(count: int, seed: int = 7) -> List[Dict]:
+    """규칙 팩 키워드(두 API 전체)와 일반 단어를 섞은 합성 게시글"""
+    pack = get_rule_pack()
+    rnd = random.Random(seed)
+    keywords = {language: [] for language in LANGUAGES}
+    for tables in (pack.keywords, pack.report.keywords):
+        for by_language in tables.values():
+            for language in LANGUAGES:
+                keywords[language].extend(by_language[language])
+
+    posts = []
+    for _ in range(count):
+        language = rnd.choice(LANGUAGES)
+        words = [rnd.choice(keywords[language]) if rnd.random() < 0.3 else rnd.choice(FILLER_WORDS)
+                 for _ in range(rnd.randint(3, 60))]
+        # 대소문자 섞기 (정규화 경로 확인)
+        words = [word.upper() if rnd.random() < 0.1 else word for word in words]
+        split = rnd.randint(1, min(8, len(words)))
+        posts.append({
+            'title': ' '.join(words[:split]),
+            'content': ' '.join(words[split:]),
+            'source': rnd.choice(SAMPLE_SOURCES),
+            'url': '',
+            'timestamp': '2025-07-28T00:00:00'
+        })
+    return posts
+
+# =============================================================================
+# 분류기 구성
+# =============================================================================
+
+def build_classifiers(reference: bool = False) -> Dict[str, Callable[[Dict], Dict]]:
+    """API별 분류 함수 - reference=True면 키워드 매칭을 참조 매처로 교체"""
+    # 분류 결과 캐시를 거치지 않고 매번 실제로 분류
+    realtime = classifier.Epic7Classifier(use_cache=False)
+    report = generate_report.Epic7Classifier()
+    if reference:
+        matchers = get_rule_pack().build_reference_matchers()
+        realtime.keyword_automata = matchers
+        report.keyword_automata = matchers
+    return {
+        'classifier': realtime.classify_post,
+        'generate_report': report.classify_post
+    }
+
+def _comparable(result: Dict) -> Dict:
+    return {key: value for key, value in result.items() if key not in VOLATILE_FIELDS}
+
+# =============================================================================
+# 명령
+# =============================================================================
+
+def run_parity(posts: List[Dict]) -> int:
+    """엔진 vs 참조 매처 결과 비교"""
+    engine = build_classifiers()
+    reference = build_classifiers(reference=True)
+
+    failures = 0
+    for api, classify in engine.items():
+        mismatches = 0
+        for post in posts:
+            expected = _comparable(reference[api](dict(post)))
+            actual = _comparable(classify(dict(post)))
+            if actual != expected:
+                mismatches += 1
+                if mismatches <= 3:
+                    print(f"[PARITY] {api} 불일치: {post.get('title', '')[:40]!r}")
+                    print(f"  expected: {expected}")
+                    print(f"  actual:   {actual}")
+        print(f"[PARITY] {api}: {len(posts) - mismatches}/{len(posts)} 일치")
+        failures += mismatches
+    return 1 if failures else 0
+
+def _per_post_us(fn: Callable[[Dict], object], posts: List[Dict]) -> float:
+    start = time.perf_counter()
+    for post in posts:
+        fn(post)
+    return (time.perf_counter() - start) / max(1, len(posts)) * 1e6
+
+def run_bench(posts: List[Dict]) -> int:
+    """API별 게시글당 처리 시간 (마이크로초)"""
+    engine = build_classifiers()
+    reference = build_classifiers(reference=True)
+
+    for api in engine:
+        print(f"[BENCH] {api:16s} 엔진 {_per_post_us(engine[api], posts):8.1f}us/건, "
+              f"참조 매처 {_per_post_us(reference[api], posts):8.1f}us/건")
+
+    # 같은 게시글 재분류 (분류 결과 캐시 적중)
+    cached = classifier.Epic7Classifier()
+    for post in posts:
+        cached.classify_post(post)
+    print(f"[BENCH] classifier       캐시 적중 {_per_post_us(cached.classify_post, posts):8.1f}us/건 "
+          f"({classification_cache.get_stats()})")
+
+    # 호출마다 분류기 생성 (기존 편의 함수 방식) vs 프로세스 공용 분류기
+    sample = posts[:200]
+    per_call = _per_post_us(lambda post: generate_report.Epic7Classifier().classify_post(post), sample)
+    shared = _per_post_us(lambda post: generate_report.should_send_realtime_alert(post), sample)
+    print(f"[BENCH] generate_report 편의 함수: 호출마다 생성 {per_call:8.1f}us/건, 공용 분류기 {shared:8.1f}us/건")
+
+    start = time.perf_counter()
+    classifier.Epic7Classifier()
+    print(f"[BENCH] Epic7Classifier 생성: {(time.perf_counter() - start) * 1000:.2f}ms")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Epic7 분류 엔진 일치성 검증/벤치마크")
+    parser.add_argument('command', choices=['parity', 'bench'], help="parity: 참조 매처와 결과 비교, bench: 처리 시간 측정")
+    parser.add_argument('--input', nargs='*', default=[], help="게시글 JSON 파일 (없으면 합성 게시글)")
+    parser.add_argument('--count', type=int, default=1000, help="합성 게시글 수")
+    args = parser.parse_args()
+
+    # 게시글별 분류 로그 억제
+    logging.disable(logging.INFO)
+
+    posts = load_posts(args.input) if args.input else synthetic_posts(args.count)
+    print(f"[INFO] 게시글 {len(posts)}건")
+    if args.command == 'parity':
+        return run_parity(posts)
+    return run_bench(posts)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 분류기 규칙 팩 - 외부 규칙 파일(classifier_rules.json) 로드/컴파일/핫 리로드
+
+구성:
+- classifier_rules.json: 키워드 목록, 키워드 가중치, 임계값, 소스별 가중치 (코드 수정 없이 규칙 변경)
+- 컴파일 캐시(classifier_rules.json.pack): 키워드 오토마톤 + 가중치 테이블을 pickle로 저장,
+  헤더의 규칙 파일 내용 해시/본문 해시가 맞으면 JSON 파싱/오토마톤 생성 없이 바로 로드
+- RulePackManager: 프로세스 공용 규칙 팩, 규칙 파일 mtime이 바뀌면 다시 로드
+
+실시간 분류기(classifier.py)와 리포트 분류 API(generate_report.py)의 키워드를
+언어별 오토마톤 하나로 함께 컴파일하므로 게시글당 한 번의 스캔으로 두 API가 모두 동작합니다.
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+import os
+import re
+import json
+import time
+import pickle
+import hashlib
+import tempfile
+import threading
+import logging
+from typing import Dict, List, Optional, Union, Tuple
+
+from config import config
+from keyword_automaton import KeywordAutomaton, KeywordScanner, AHOCORASICK_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+# 컴파일 캐시 형식 버전 (KeywordAutomaton/CompiledRulePack 구조 변경 시 올림)
+RULE_PACK_FORMAT_VERSION = 3
+
+# 컴파일 캐시 헤더 매직 (헤더 검증 후에만 피클 본문을 역직렬화)
+RULE_PACK_CACHE_MAGIC = 'EPIC7RULEPACK'
+
+# 분류 키워드 카테고리 및 언어
+KEYWORD_CATEGORIES = ('positive', 'negative', 'neutral', 'bug', 'high_priority')
+REPORT_KEYWORD_CATEGORIES = ('critical_bug', 'high_bug', 'medium_bug', 'low_bug', 'bug_exclusion',
+                             'positive', 'negative', 'neutral')
+LANGUAGES = ('korean', 'english')
+
+# 리포트 규칙 카테고리의 오토마톤 내 이름 접두사
+REPORT_PREFIX = 'report.'
+
+def get_rules_file() -> str:
+    """규칙 파일 경로 (상대 경로는 모듈 디렉토리 기준 - 소스와 함께 배포되는 파일)"""
+    path = os.environ.get('EPIC7_CLASSIFIER_RULES', config.Files.CLASSIFIER_RULES)
+    if os.path.isabs(path):
+        return path
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+
+def _flatten_keywords(value: Union[List[str], Dict[str, List[str]]]) -> List[str]:
+    # 언어별 키워드는 목록 또는 {그룹 설명: 목록} (그룹 순서대로 이어 붙임)
+    if isinstance(value, dict):
+        return [keyword for group in value.values() for keyword in group]
+    return list(value)
+
+def _length_weight(spec: Dict):
+    base, per_char = spec['base'], spec.get('per_char', 0.0)
+    return lambda keyword: base + (len(keyword) * per_char)
+
+def _language_keywords(section: Dict, categories: Tuple[str, ...]) -> Dict[str, Dict[str, List[str]]]:
+    return {
+        category: {language: _flatten_keywords(section['keywords'][category].get(language, []))
+                   for language in LANGUAGES}
+        for category in categories
+    }
+
+class ReportRuleSet:
+    """리포트 분류 API 규칙 (우선순위별 버그 키워드 + 정규식 패턴 점수)"""
+
+    def __init__(self, section: Dict):
+        self.keywords = _language_keywords(section, REPORT_KEYWORD_CATEGORIES)
+        self.keyword_weights = {category: section['keyword_weights'][category]
+                                for category in REPORT_KEYWORD_CATEGORIES}
+        self.bug_threshold = section.get('bug_threshold', 0.3)
+        self.pattern_weight = section.get('pattern_weight', 0.2)
+        self.source_config = dict(section.get('source_config', {}))
+        # 패턴은 우선순위 순서 유지 (동점 시 앞 우선순위 선택)
+        self.priority_patterns = [
+            (priority, pattern, re.compile(pattern))
+            for priority, patterns in section['priority_patterns'].items()
+            for pattern in patterns
+        ]
+
+# =============================================================================
+# 컴파일된 규칙 팩
+# =============================================================================
+
+class CompiledRulePack:
+    """규칙 파일 한 버전의 컴파일 결과 (언어별 오토마톤 + 임계값/가중치 테이블)"""
+
+    def __init__(self, rules: Dict, content_hash: str):
+        self.content_hash = content_hash
+        self.version = rules.get('version', 1)
+
+        self.keywords = _language_keywords(rules, KEYWORD_CATEGORIES)
+        self.keyword_weights = {category: rules['keyword_weights'][category] for category in KEYWORD_CATEGORIES}
+        self.report = ReportRuleSet(rules['report'])
+        self.sentiment_thresholds = dict(rules['sentiment_thresholds'])
+        self.bug_thresholds = dict(rules['bug_thresholds'])
+        self.source_config = dict(rules.get('source_config', {}))
+        self.schedule_weights = dict(rules.get('schedule_weights', {}))
+
+        # 두 규칙 세트를 언어별 오토마톤 하나로 컴파일
+        self.automata = {language: KeywordAutomaton(*self.matcher_tables(language)) for language in LANGUAGES}
+
+    def matcher_tables(self, language: str) -> Tuple[Dict[str, List[str]], Dict]:
+        """언어별 (카테고리 → 키워드 목록, 카테고리 → 가중치 함수) - 리포트 카테고리는 접두사 포함"""
+        # 키워드 가중치: base + 키워드 길이 × per_char (긴 키워드일수록 정확도 높음)
+        categories = {category: self.keywords[category][language] for category in KEYWORD_CATEGORIES}
+        weights = {category: _length_weight(self.keyword_weights[category]) for category in KEYWORD_CATEGORIES}
+        for category in REPORT_KEYWORD_CATEGORIES:
+            categories[REPORT_PREFIX + category] = self.report.keywords[category][language]
+            weights[REPORT_PREFIX + category] = _length_weight(self.report.keyword_weights[category])
+        return categories, weights
+
+    def build_reference_matchers(self) -> Dict[str, KeywordScanner]:
+        """키워드별 부분 문자열 검사 방식의 참조 매처 (일치성 검증/벤치마크용)"""
+        return {language: KeywordScanner(*self.matcher_tables(language)) for language in LANGUAGES}
+
+def _content_hash(content: bytes) -> str:
+    # 네이티브 오토마톤 사용 여부가 다르면 캐시 구조도 다름
+    digest = hashlib.sha256(content)
+    digest.update(f"|format={RULE_PACK_FORMAT_VERSION}|native={AHOCORASICK_AVAILABLE}".encode('utf-8'))
+    return digest.hexdigest()
+
+def _read_pack_cache(cache_file: str, content_hash: str) -> Optional[CompiledRulePack]:
+    """
+    컴파일 캐시 읽기 - 헤더의 규칙 해시와 본문 해시를 먼저 검증한 뒤에만 역직렬화
+
+    캐시 형식: "<매직> <규칙 내용 해시> <피클 본문 sha256>\n" + 피클 본문
+    다른 규칙 파일/손상된 캐시는 pickle.loads 전에 걸러짐
+    """
+    with open(cache_file, 'rb') as f:
+        header = f.readline().decode('ascii', 'replace').split()
+        if len(header) != 3 or header[0] != RULE_PACK_CACHE_MAGIC or header[1] != content_hash:
+            return None
+        payload = f.read()
+    if hashlib.sha256(payload).hexdigest() != header[2]:
+        raise ValueError("캐시 본문 해시 불일치")
+
+    pack = pickle.loads(payload)
+    if isinstance(pack, CompiledRulePack) and pack.content_hash == content_hash:
+        return pack
+    return None
+
+def _write_pack_cache(cache_file: str, pack: CompiledRulePack):
+    """컴파일 캐시 원자적 저장 (임시 파일 → replace, 실패 시 임시 파일 삭제)"""
+    payload = pickle.dumps(pack, protocol=pickle.HIGHEST_PROTOCOL)
+    header = f"{RULE_PACK_CACHE_MAGIC} {pack.content_hash} {hashlib.sha256(payload).hexdigest()}\n"
+
+    directory = os.path.dirname(cache_file) or '.'
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile('wb', dir=directory, suffix='.tmp', delete=False) as tmp:
+            tmp_path = tmp.name
+            tmp.write(header.encode('ascii'))
+            tmp.write(payload)
+        os.replace(tmp_path, cache_file)
+        tmp_path = None
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+def load_rule_pack(rules_file: str, cache_file: Optional[str] = None) -> CompiledRulePack:
+    """규칙 파일 로드 - 내용 해시가 같은 컴파일 캐시가 있으면 재사용, 없으면 컴파일 후 캐시 저장"""
+    cache_file = cache_file or rules_file + '.pack'
+    with open(rules_file, 'rb') as f:
+        content = f.read()
+    content_hash = _content_hash(content)
+
+    if os.path.exists(cache_file):
+        try:
+            pack = _read_pack_cache(cache_file, content_hash)
+            if pack is not None:
+                return pack
+        except Exception as e:
+            logger.warning(f"규칙 팩 캐시 로드 실패, 다시 컴파일: {cache_file} ({e})")
+
+    started = time.time()
+    pack = CompiledRulePack(json.loads(content.decode('utf-8')), content_hash)
+    logger.info(f"분류기 규칙 컴파일 완료: {os.path.basename(rules_file)} ({(time.time() - started) * 1000:.0f}ms)")
+
+    try:
+        _write_pack_cache(cache_file, pack)
+    except (OSError, pickle.PicklingError, TypeError) as e:
+        logger.warning(f"규칙 팩 캐시 저장 실패 (메모리 팩 사용): {e}")
+    return pack
+
+# =============================================================================
+# 프로세스 공용 규칙 팩 관리자
+# =============================================================================
+
+class RulePackManager:
+    """
+    프로세스 공용 규칙 팩 (핫 리로드)
+
+    get()은 check_interval 초마다 규칙 파일 mtime을 확인해 바뀌었으면 다시 로드합니다.
+    수정 중인 파일이 잘못된 경우 기존 팩을 계속 사용합니다.
+    """
+
+    def __init__(self, rules_file: str = None, check_interval: float = None):
+        self.rules_file = rules_file or get_rules_file()
+        self.check_interval = (config.Classification.RULES_RELOAD_INTERVAL
+                               if check_interval is None else check_interval)
+        self._lock = threading.Lock()
+        self._pack = None
+        self._mtime = None
+        self._checked_at = 0.0
+
+    def get(self) -> CompiledRulePack:
+        """현재 규칙 팩 (필요 시 다시 로드)"""
+        pack = self._pack
+        if pack is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return pack
+
+        with self._lock:
+            if self._pack is None or time.monotonic() - self._checked_at >= self.check_interval:
+                self._checked_at = time.monotonic()
+                self._reload_if_changed()
+            return self._pack
+
+    def reload(self) -> CompiledRulePack:
+        """mtime과 관계없이 즉시 다시 로드"""
+        with self._lock:
+            self._mtime = None
+            self._checked_at = time.monotonic()
+            self._reload_if_changed()
+            return self._pack
+
+    def _reload_if_changed(self):
+        try:
+            mtime = os.stat(self.rules_file).st_mtime_ns
+        except OSError as e:
+            if self._pack is None:
+                raise
+            logger.warning(f"규칙 파일 확인 실패, 기존 규칙 사용: {e}")
+            return
+
+        if mtime == self._mtime and self._pack is not None:
+            return
+
+        try:
+            pack = load_rule_pack(self.rules_file)
+        except (ValueError, KeyError, TypeError) as e:
+            if self._pack is None:
+                raise
+            logger.error(f"규칙 파일 오류, 기존 규칙 사용: {self.rules_file} ({e})")
+            self._mtime = mtime
+            return
+
+        if self._pack is not None and pack.content_hash != self._pack.content_hash:
+            logger.info(f"분류기 규칙 다시 로드: {os.path.basename(self.rules_file)}")
+        self._pack = pack
+        self._mtime = mtime
+
+# 전역 규칙 팩 관리자 인스턴스
+rule_pack_manager = RulePackManager()
+
+def get_rule_pack() -> CompiledRulePack:
+    """프로세스 공용 규칙 팩"""
+    return rule_pack_manager.get()
@@ -53,6 +53,9 @@ class Epic7Config:
         SENTIMENT_TRENDS = "sentiment_trends.json"
         SENTIMENT_KEYWORDS = "sentiment_keywords.json"
         
+        # 규칙 파일 (소스와 함께 배포)
+        CLASSIFIER_RULES = "classifier_rules.json"
+        
         # 로그 파일
         MAIN_LOG = "monitor_bugs.log"
         ERROR_LOG = "error.log"
@@ -61,6 +64,18 @@ class Epic7Config:
         # 디버그 디렉토리
         DEBUG_DIR = "debug"
     
+    # =============================================================================
+    # 저장소 설정
+    # =============================================================================
+    
+    class Storage:
+        # 상태 저장 백엔드 ('json' 기본, 'sqlite' 선택)
+        BACKEND = os.environ.get('EPIC7_STORAGE_BACKEND', 'json').lower()
+        
+        # SQLite (WAL) 데이터베이스 설정
+        SQLITE_PATH = os.environ.get('EPIC7_SQLITE_PATH', 'epic7_state.db')
+        SQLITE_BUSY_TIMEOUT = 30  # 다른 실행(한국/글로벌)의 쓰기 잠금 대기 시간 (초)
+    
     # =============================================================================
     # 크롤링 설정
     # =============================================================================
@@ -78,6 +93,46 @@ class Epic7Config:
         BUG_CACHE_HOURS = 6
         GENERAL_CACHE_HOURS = 24
         
+        # 콘텐츠 캐시 설정 (소스별 LRU + TTL)
+        CONTENT_CACHE_TTL_HOURS = 24
+        CONTENT_CACHE_MAX_PER_SOURCE = 200
+        
+        # 장기 중복 체크 블룸 필터 설정 (정확 인덱스 24시간 이후 구간)
+        SEEN_FILTER_RETENTION_DAYS = 30
+        SEEN_FILTER_GENERATION_DAYS = 5      # 세대 단위 기간
+        SEEN_FILTER_CAPACITY = 20000         # 세대별 최대 항목 수 (초과 시 새 세대)
+        SEEN_FILTER_ERROR_RATE = float(os.environ.get('EPIC7_SEEN_FILTER_ERROR_RATE', '0.001'))
+        SEEN_FILTER_MAX_GENERATIONS = 12     # 메모리/파일 크기 상한
+        
+        # Chrome 드라이버 풀 설정
+        DRIVER_POOL_SIZE = int(os.environ.get('EPIC7_DRIVER_POOL_SIZE', '2'))
+        DRIVER_CHECKOUT_TIMEOUT = 600  # 드라이버 대여 대기 최대 시간 (초)
+        
+        # 크롤링 오케스트레이터 설정 (호스트별 동시 실행 제한)
+        HOST_CONCURRENCY = {
+            'page.onstove.com': 4,
+            'bbs.ruliweb.com': 1,
+            'www.reddit.com': 1
+        }
+        DEFAULT_HOST_CONCURRENCY = 2
+        TASK_DEADLINE = 300     # 작업별 최대 실행 시간 (초)
+        TASK_CANCEL_GRACE = 10  # 취소 신호 후 부분 결과 대기 시간 (초)
+        
+        # 네트워크 필터 설정 (CDP 하위 리소스 차단)
+        NETWORK_FILTER_ENABLED = os.environ.get('EPIC7_NETWORK_FILTER', '1') != '0'
+        # 소스 그룹별 스크립트 출처 허용 목록 (그 외 출처 스크립트는 학습 후 차단)
+        SCRIPT_ORIGIN_ALLOWLIST = {
+            'stove': ['onstove.com', 'gate8.com', 'smilegate.com', 'smilegate.net']
+        }
+        
+        # 처리 파이프라인 설정 (분류 → 알림 → 저장)
+        PIPELINE_QUEUE_SIZE = 50  # 단계별 큐 최대 크기 (가득 차면 앞 단계 대기)
+        PIPELINE_WORKERS = {
+            'classify': 2,
+            'notify': 2,
+            'persist': 1  # crawled_links.json 재작성은 단일 워커로 직렬화
+        }
+        
         # 15분 간격 소스 (버그 게시판)
         FREQUENT_SOURCES = {
             'stove_bug': {
@@ -158,6 +213,32 @@ class Epic7Config:
             'bug_medium': 0.6,
             'sentiment_negative': 0.7
         }
+        
+        # 분류기 규칙 파일 변경 확인 주기 (초, 변경 시 자동 재로드)
+        RULES_RELOAD_INTERVAL = 5
+        
+        # 분류 결과 캐시 (제목/내용/소스/규칙 버전 해시 → 결과, LRU)
+        CACHE_MAX_ENTRIES = 2000
+        # 디스크 스필 (LRU에서 밀려난 결과를 SQLite에 보관, 선택)
+        CACHE_SPILL = os.environ.get('EPIC7_CLASSIFICATION_SPILL', '0') == '1'
+        CACHE_SPILL_PATH = os.environ.get('EPIC7_CLASSIFICATION_SPILL_PATH', 'classification_cache.db')
+        CACHE_SPILL_MAX_ENTRIES = 50000
+        
+        # 과거 감성 데이터 재분류 (reclassify.py)
+        RECLASSIFY_CHUNK_SIZE = 500  # 워커 프로세스에 한 번에 넘기는 게시글 수
+        RECLASSIFY_FLUSH_INTERVAL = 10  # 결과 기록 + 체크포인트 주기 (초)
+        RECLASSIFY_CHECKPOINT = "reclassify_checkpoint.jsonl"
+        
+        # 통계 분류 엔진 (statistical_classifier.py, NumPy 필요) - 키워드 규칙 보완
+        STATISTICAL_ENGINE = os.environ.get('EPIC7_STATISTICAL_ENGINE', '0') == '1'
+        STATISTICAL_MODEL = os.environ.get('EPIC7_STATISTICAL_MODEL', 'statistical_model')  # .npy/.json 경로 (확장자 제외)
+        STATISTICAL_MIN_CONFIDENCE = 0.8  # 키워드 감성이 중립일 때 모델 감성을 채택하는 최소 확률
+        STATISTICAL_BATCH_SIZE = 256  # classify_posts 배치 추론 단위
+
+        # 모델 단독 버그 판정 (기본 꺼짐) - 키워드 결과가 비어 있을 때(버그 키워드 없음 + 중립)만 적용,
+        # 키워드 비버그 판정은 뒤집지 않음. 오탐 비용이 커서 감성보다 높은 확률을 요구
+        STATISTICAL_BUG_OVERRIDE = os.environ.get('EPIC7_STATISTICAL_BUG_OVERRIDE', '0') == '1'
+        STATISTICAL_BUG_MIN_CONFIDENCE = 0.9
     
     # =============================================================================
     # 알림 설정
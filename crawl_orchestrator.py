@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 크롤링 오케스트레이터 - asyncio 기반 소스별 동시 실행 스케줄러
+호스트별 동시성 제한, 작업별 데드라인 및 실제 취소, 완료 순 결과 스트림 제공
+
+고정 크기 ThreadPoolExecutor 대신 모든 소스를 동시에 시작하고,
+같은 호스트로 향하는 작업만 세마포어로 제한합니다.
+브라우저(Selenium) 작업과 HTTP 작업은 별도 실행기에서 동작하여
+빠른 HTTP 소스가 느린 브라우저 작업 뒤에서 대기하지 않습니다.
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+import asyncio
+import threading
+import time
+import concurrent.futures
+from typing import Dict, List, Optional, Callable, Any
+from urllib.parse import urlparse
+
+from config import config
+
+# =============================================================================
+# 작업 취소 토큰
+# =============================================================================
+
+class CrawlCancelled(Exception):
+    """데드라인 초과로 취소된 크롤링 작업"""
+    pass
+
+class CancelToken:
+    """
+    협조적 취소 토큰
+    작업 함수는 루프마다 cancelled를 확인하고, 차단 자원(드라이버 등)은
+    콜백으로 등록하여 데드라인 초과 시 즉시 해제되도록 합니다.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """취소 시 실행할 정리 콜백 등록 (이미 취소된 경우 즉시 실행)"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return callback
+        self._run_callback(callback)
+        return callback
+
+    def remove_callback(self, callback: Callable[[], None]):
+        """
+        정리 콜백 해제
+        반환 이후에는 콜백이 실행 중이거나 실행될 일이 없음을 보장합니다.
+        """
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def cancel(self):
+        """취소 신호 설정 및 등록된 정리 콜백 실행"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+            # 잠금 안에서 실행 - remove_callback 이후 콜백이 실행되지 않도록 보장
+            for callback in callbacks:
+                self._run_callback(callback)
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise CrawlCancelled("크롤링 작업 취소됨")
+
+    def guard(self, callback: Callable[..., Any]) -> Callable[..., Any]:
+        """취소 이후 호출을 막는 콜백 래퍼 (분리된 작업이 게시글 후처리를 계속 투입하지 않도록)"""
+        def guarded(*args, **kwargs):
+            self.raise_if_cancelled()
+            return callback(*args, **kwargs)
+        return guarded
+
+    @staticmethod
+    def _run_callback(callback: Callable[[], None]):
+        try:
+            callback()
+        except Exception as e:
+            print(f"[ORCHESTRATOR] 취소 콜백 실행 실패: {e}")
+
+# =============================================================================
+# 작업 및 결과 정의
+# =============================================================================
+
+class CrawlTask:
+    """
+    크롤링 작업 정의
+
+    Args:
+        name: 표시용 작업 이름
+        url: 대상 URL (호스트별 동시성 제한 기준)
+        func: CancelToken을 인자로 받아 게시글 리스트를 반환하는 함수
+        kind: 'browser' (Selenium 사용 가능) 또는 'http'
+        deadline: 작업별 최대 실행 시간 (초, None이면 기본값)
+    """
+
+    def __init__(self, name: str, url: str, func: Callable[[CancelToken], List[Dict]],
+                 kind: str = 'http', deadline: Optional[float] = None):
+        self.name = name
+        self.url = url
+        self.host = urlparse(url).netloc
+        self.func = func
+        self.kind = kind
+        self.deadline = deadline
+
+class CrawlResult:
+    """크롤링 작업 결과"""
+
+    def __init__(self, name: str, status: str, posts: List[Dict], elapsed: float,
+                 queued: float, error: Optional[str] = None):
+        self.name = name
+        self.status = status  # success / timeout / error
+        self.posts = posts
+        self.elapsed = elapsed
+        self.queued = queued
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 'success'
+
+# =============================================================================
+# 오케스트레이터
+# =============================================================================
+
+class CrawlOrchestrator:
+    """asyncio 크롤링 스케줄러"""
+
+    def __init__(self, host_limits: Optional[Dict[str, int]] = None,
+                 default_host_limit: int = 2, default_deadline: float = 300.0,
+                 cancel_grace: float = 10.0, browser_workers: int = 4, http_workers: int = 4):
+        self.host_limits = host_limits or {}
+        self.default_host_limit = max(1, default_host_limit)
+        self.default_deadline = default_deadline
+        self.cancel_grace = cancel_grace
+        self.browser_workers = max(1, browser_workers)
+        self.http_workers = max(1, http_workers)
+
+    async def stream(self, tasks: List[CrawlTask]):
+        """작업 동시 실행 후 완료 순서대로 결과를 비동기 스트림으로 반환"""
+        semaphores = {
+            host: asyncio.Semaphore(self.host_limits.get(host, self.default_host_limit))
+            for host in {task.host for task in tasks}
+        }
+        executors = {
+            'browser': concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.browser_workers, thread_name_prefix='crawl-browser'),
+            'http': concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.http_workers, thread_name_prefix='crawl-http')
+        }
+
+        pending = [
+            asyncio.ensure_future(self._run_task(
+                task, semaphores[task.host], executors.get(task.kind, executors['http'])
+            ))
+            for task in tasks
+        ]
+
+        try:
+            for next_result in asyncio.as_completed(pending):
+                yield await next_result
+        finally:
+            for future in pending:
+                future.cancel()
+            # 취소 후에도 멈춘 스레드가 종료를 막지 않도록 대기하지 않음
+            for executor in executors.values():
+                executor.shutdown(wait=False)
+
+    async def _run_task(self, task: CrawlTask, semaphore: asyncio.Semaphore,
+                        executor: concurrent.futures.Executor) -> CrawlResult:
+        """단일 작업 실행 - 호스트 세마포어, 데드라인, 취소 처리"""
+        loop = asyncio.get_running_loop()
+        submitted = time.time()
+        deadline = task.deadline or self.default_deadline
+        token = CancelToken()
+
+        await semaphore.acquire()
+        release_on_exit = True
+        started = time.time()
+        queued = started - submitted
+        future = loop.run_in_executor(executor, task.func, token)
+
+        try:
+            posts = await asyncio.wait_for(asyncio.shield(future), timeout=deadline)
+            return CrawlResult(task.name, 'success', posts or [], time.time() - started, queued)
+
+        except asyncio.TimeoutError:
+            print(f"[ORCHESTRATOR] {task.name} 데드라인 초과 ({deadline}초) - 취소")
+            token.cancel()
+            posts = []
+            try:
+                # 취소 신호 후 부분 결과 회수 대기
+                posts = await asyncio.wait_for(asyncio.shield(future), timeout=self.cancel_grace) or []
+            except asyncio.TimeoutError:
+                # 분리된 스레드는 드라이버 등 호스트 자원을 계속 쓰므로 실제 종료 시 슬롯 반환
+                print(f"[ORCHESTRATOR] {task.name} 취소 유예 시간 초과 - 작업 분리 (종료 시 호스트 슬롯 반환)")
+                release_on_exit = False
+                future.add_done_callback(lambda _: semaphore.release())
+            except Exception:
+                pass
+            return CrawlResult(task.name, 'timeout', posts, time.time() - started, queued,
+                               error=f"deadline {deadline}s exceeded")
+
+        except Exception as e:
+            return CrawlResult(task.name, 'error', [], time.time() - started, queued, error=str(e))
+
+        finally:
+            if release_on_exit:
+                semaphore.release()
+
+    def run(self, tasks: List[CrawlTask],
+            on_result: Optional[Callable[[CrawlResult], Any]] = None) -> List[CrawlResult]:
+        """동기 진입점 - 결과 스트림을 소비하며 on_result 콜백 호출"""
+
+        async def consume():
+            results = []
+            async for result in self.stream(tasks):
+                if on_result:
+                    on_result(result)
+                results.append(result)
+            return results
+
+        return asyncio.run(consume())
+
+# 전역 오케스트레이터 인스턴스
+crawl_orchestrator = CrawlOrchestrator(
+    host_limits=config.Crawling.HOST_CONCURRENCY,
+    default_host_limit=config.Crawling.DEFAULT_HOST_CONCURRENCY,
+    default_deadline=config.Crawling.TASK_DEADLINE,
+    cancel_grace=config.Crawling.TASK_CANCEL_GRACE,
+    browser_workers=config.Crawling.DRIVER_POOL_SIZE * 2,
+    http_workers=4
+)
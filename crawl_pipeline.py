@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 처리 파이프라인 - 크롤링과 후처리를 분리하는 단계별 생산자/소비자 구조
+크롤링 → 분류 → 알림 → 저장 단계를 제한된 크기의 큐로 연결
+
+크롤러 스레드는 게시글을 큐에 넣기만 하고 다음 게시글로 진행하며,
+분류/알림(Discord)/저장(crawled_links.json)은 단계별 워커가 병렬로 처리합니다.
+큐가 가득 차면 앞 단계가 대기하여(backpressure) 메모리 사용량이 제한됩니다.
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Callable, Any
+
+# 워커 종료 신호
+_STOP = object()
+
+# =============================================================================
+# 파이프라인 단계
+# =============================================================================
+
+class PipelineStage:
+    """
+    파이프라인 단일 단계
+
+    handler(item)는 다음 단계로 넘길 항목을 반환하고, None을 반환하면 항목을 종료합니다.
+    """
+
+    def __init__(self, name: str, handler: Callable[[Any], Any], workers: int = 1, queue_size: int = 50):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.queue = queue.Queue(maxsize=max(1, queue_size))
+        self.threads = []
+        self._lock = threading.Lock()
+        self.stats = {
+            'submitted': 0,
+            'processed': 0,
+            'failed': 0,
+            'blocked_puts': 0,
+            'max_depth': 0,
+            'depth_samples': 0,
+            'depth_total': 0,
+            'busy_time': 0.0
+        }
+
+    def put(self, item):
+        """항목 투입 - 큐가 가득 차면 빈 자리가 생길 때까지 대기"""
+        with self._lock:
+            if self.queue.full():
+                self.stats['blocked_puts'] += 1
+        self.queue.put(item)
+        depth = self.queue.qsize()
+        with self._lock:
+            self.stats['submitted'] += 1
+            self.stats['max_depth'] = max(self.stats['max_depth'], depth)
+            self.stats['depth_samples'] += 1
+            self.stats['depth_total'] += depth
+
+    def record(self, elapsed: float, failed: bool):
+        with self._lock:
+            self.stats['busy_time'] += elapsed
+            if failed:
+                self.stats['failed'] += 1
+            else:
+                self.stats['processed'] += 1
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self.stats)
+        samples = stats.pop('depth_samples')
+        total = stats.pop('depth_total')
+        stats['avg_depth'] = round(total / samples, 2) if samples else 0.0
+        stats['depth'] = self.queue.qsize()
+        stats['capacity'] = self.queue.maxsize
+        stats['workers'] = self.workers
+        stats['busy_time'] = round(stats['busy_time'], 2)
+        return stats
+
+# =============================================================================
+# 단계별 파이프라인
+# =============================================================================
+
+class CrawlPipeline:
+    """제한 큐로 연결된 단계별 처리 파이프라인"""
+
+    def __init__(self, stages: List[PipelineStage],
+                 on_error: Optional[Callable[[str, Any, Exception], None]] = None):
+        if not stages:
+            raise ValueError("파이프라인 단계가 비어 있습니다")
+        self.stages = stages
+        self.on_error = on_error
+        self._started = False
+        self._closed = False
+        self._submit_lock = threading.Lock()
+        self._start_time = None
+
+    def start(self):
+        """단계별 워커 스레드 시작"""
+        if self._started:
+            return
+        self._started = True
+        self._closed = False
+        self._start_time = time.time()
+
+        for index, stage in enumerate(self.stages):
+            next_stage = self.stages[index + 1] if index + 1 < len(self.stages) else None
+            for worker_id in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._worker, args=(stage, next_stage),
+                    name=f"pipeline-{stage.name}-{worker_id}", daemon=True
+                )
+                thread.start()
+                stage.threads.append(thread)
+
+        print(f"[PIPELINE] 시작: " + " → ".join(f"{s.name}({s.workers})" for s in self.stages))
+
+    def submit(self, item) -> bool:
+        """
+        첫 단계에 항목 투입 (크롤러 스레드에서 호출)
+        drain() 이후 투입은 거부 - 워커를 다시 띄우면 프로세스 종료 시 항목이 유실됨
+        """
+        with self._submit_lock:
+            if self._closed:
+                print("[PIPELINE] 종료된 파이프라인 - 항목 거부 (다음 실행에서 재수집)")
+                return False
+            if not self._started:
+                self.start()
+            self.stages[0].put(item)
+            return True
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        모든 단계의 큐가 빌 때까지 대기한 뒤 워커 종료
+        앞 단계가 비워진 후 다음 단계를 기다리므로 단계 간 이동 중인 항목도 보장됩니다.
+        """
+        with self._submit_lock:
+            self._closed = True
+        if not self._started:
+            return True
+
+        deadline = time.time() + timeout if timeout else None
+        completed = True
+
+        for stage in self.stages:
+            if not self._join_queue(stage.queue, deadline):
+                print(f"[PIPELINE] {stage.name} 단계 비우기 시간 초과 - 남은 항목 {stage.queue.qsize()}개")
+                completed = False
+                break
+
+        for stage in self.stages:
+            for _ in stage.threads:
+                stage.queue.put(_STOP)
+        for stage in self.stages:
+            for thread in stage.threads:
+                thread.join(timeout=5)
+            stage.threads = []
+
+        self._started = False
+        print(f"[PIPELINE] 종료 ({time.time() - self._start_time:.1f}초)")
+        return completed
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """단계별 큐 깊이 및 처리 통계"""
+        return {stage.name: stage.get_stats() for stage in self.stages}
+
+    def _worker(self, stage: PipelineStage, next_stage: Optional[PipelineStage]):
+        while True:
+            item = stage.queue.get()
+            if item is _STOP:
+                stage.queue.task_done()
+                return
+
+            start = time.time()
+            failed = False
+            try:
+                result = stage.handler(item)
+                if result is not None and next_stage is not None:
+                    next_stage.put(result)
+            except Exception as e:
+                failed = True
+                print(f"[PIPELINE] {stage.name} 단계 처리 실패: {e}")
+                if self.on_error:
+                    try:
+                        self.on_error(stage.name, item, e)
+                    except Exception as handler_error:
+                        print(f"[PIPELINE] 오류 처리기 실패: {handler_error}")
+            finally:
+                stage.record(time.time() - start, failed)
+                stage.queue.task_done()
+
+    @staticmethod
+    def _join_queue(q: queue.Queue, deadline: Optional[float]) -> bool:
+        """제한 시간 내 queue.join()"""
+        if deadline is None:
+            q.join()
+            return True
+
+        with q.all_tasks_done:
+            while q.unfinished_tasks:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                q.all_tasks_done.wait(remaining)
+        return True
@@ -23,14 +23,33 @@ Fixed: 루리웹 파싱 로직 완전 구현
 import time
 import random
 import re
+import html
+import base64
+import hashlib
 import requests
 import concurrent.futures
 import os
 import json
 import logging
+import queue
+import atexit
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Callable
 from urllib.parse import urljoin, urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import config
+from file_manager import file_manager
+from sqlite_store import SQLiteStateStore, get_state_store
+from crawl_orchestrator import CrawlTask, CrawlResult, CancelToken, crawl_orchestrator
+from crawl_pipeline import CrawlPipeline, PipelineStage
+from link_index import crawled_link_index, get_crawled_links_file
+from classification_cache import classification_cache
+from utils import normalize_post_url, canonical_post_key, post_identity
 
 # Selenium 관련 import
 from selenium import webdriver
@@ -38,7 +57,7 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, JavascriptException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
@@ -85,6 +104,18 @@ class ImmediateProcessor:
         self.failed_count = 0
         self.retry_queue = []
         self.classifier = None
+        self._lock = threading.Lock()
+        self._notified_ids = set()
+        
+        # SQLite 백엔드: 이전 실행에서 남은 재시도 항목 복원
+        self.state_store = get_state_store()
+        if self.state_store is not None:
+            try:
+                self.retry_queue = self.state_store.get_retry_items()
+                if self.retry_queue:
+                    print(f"[RETRY] 이전 실행 재시도 항목 복원: {len(self.retry_queue)}개")
+            except Exception as e:
+                print(f"[WARNING] 재시도 항목 복원 실패: {e}")
         
         if EPIC7_MODULES_AVAILABLE:
             try:
@@ -95,41 +126,109 @@ class ImmediateProcessor:
                 
     def process_post_immediately(self, post_data: Dict) -> bool:
         """
-        게시글별 즉시 처리 메인 함수
+        게시글별 즉시 처리 메인 함수 (호출 스레드에서 전 단계 순차 실행)
         Master 요구사항: 크롤링 → 감성분석 → 알림 → 마킹
         """
         try:
-            print(f"[IMMEDIATE] 즉시 처리 시작: {post_data.get('title', '')[:50]}...")
-            
-            if not EPIC7_MODULES_AVAILABLE:
-                print("[WARNING] 처리 모듈 없음, 기본 처리만 수행")
-                self._basic_processing(post_data)
-                return True
-            
-            # 1. 유저 동향 감성 분석
-            sentiment_result = self._analyze_sentiment(post_data)
-            
-            # 2. 알림 전송 여부 체크 및 전송
-            notification_sent = self._handle_notifications(post_data, sentiment_result)
-            
-            # 3. 처리 완료 마킹 (알림 성공 시에만)
-            if notification_sent:
-                self._mark_as_processed(post_data['url'], notified=True)
-                self.processed_count += 1
-                print(f"[SUCCESS] 즉시 처리 완료: {post_data.get('title', '')[:30]}...")
-            else:
-                # 실패한 경우 재시도 큐에 추가
-                self._add_to_retry_queue(post_data, sentiment_result)
-                self.failed_count += 1
-                
-            return notification_sent
+            item = self.classify_stage({'post_data': post_data})
+            item = self.notify_stage(item)
+            if item is None:
+                return False
+            self.persist_stage(item)
+            return True
             
         except Exception as e:
-            print(f"[ERROR] 즉시 처리 실패: {e}")
-            self._add_to_retry_queue(post_data, None)
-            self.failed_count += 1
+            self.handle_stage_error('immediate', {'post_data': post_data}, e)
             return False
     
+    # -------------------------------------------------------------------------
+    # 파이프라인 단계 (분류 → 알림 → 저장)
+    # -------------------------------------------------------------------------
+    
+    def classify_stage(self, item: Dict) -> Dict:
+        """분류 단계: 유저 동향 감성 분석"""
+        post_data = item['post_data']
+        print(f"[IMMEDIATE] 즉시 처리 시작: {post_data.get('title', '')[:50]}...")
+        
+        if not EPIC7_MODULES_AVAILABLE:
+            print("[WARNING] 처리 모듈 없음, 기본 처리만 수행")
+            item['basic'] = True
+            return item
+        
+        item['sentiment_result'] = self._analyze_sentiment(post_data)
+        return item
+    
+    def notify_stage(self, item: Dict) -> Optional[Dict]:
+        """알림 단계: 알림 전송 여부 체크 및 전송 (실패 시 재시도 큐)"""
+        if item.get('basic'):
+            return item
+        
+        post_data = item['post_data']
+        sentiment_result = item.get('sentiment_result')
+        
+        # 같은 게시글이 URL 변형/여러 게시판으로 한 실행에서 두 번 들어와도 알림은 한 번만
+        identity = post_identity(post_data['url'])
+        with self._lock:
+            if identity in self._notified_ids:
+                # 알림은 생략하되 저장 단계로 넘겨 이 소스/게시글 ID의 커서는 완료 처리
+                print(f"[SKIP] 이미 알림 처리 중인 게시글: {identity}")
+                item['duplicate'] = True
+                return item
+            self._notified_ids.add(identity)
+        
+        if self._handle_notifications(post_data, sentiment_result):
+            item['notified'] = True
+            return item
+        
+        # 실패한 경우 재시도 큐에 추가
+        with self._lock:
+            self._notified_ids.discard(identity)
+        self._add_to_retry_queue(post_data, sentiment_result)
+        with self._lock:
+            self.failed_count += 1
+        return None
+    
+    def persist_stage(self, item: Dict) -> None:
+        """저장 단계: 처리 완료 마킹 (알림 성공 시에만, 중복 게시글은 커서만 완료)"""
+        post_data = item['post_data']
+        
+        if item.get('duplicate'):
+            crawl_cursor_store.complete(post_data.get('source'), post_data.get('post_id'))
+            return None
+        
+        if item.get('basic'):
+            self._basic_processing(post_data)
+            crawl_cursor_store.complete(post_data.get('source'), post_data.get('post_id'))
+            return None
+        
+        self._mark_as_processed(post_data['url'], notified=True)
+        crawl_cursor_store.complete(post_data.get('source'), post_data.get('post_id'))
+        with self._lock:
+            self.processed_count += 1
+        print(f"[SUCCESS] 즉시 처리 완료: {post_data.get('title', '')[:30]}...")
+        return None
+    
+    def handle_stage_error(self, stage_name: str, item: Dict, error: Exception):
+        """단계 처리 중 예외 - 재시도 큐로 이동"""
+        print(f"[ERROR] 즉시 처리 실패 ({stage_name}): {error}")
+        self._add_to_retry_queue(item['post_data'], item.get('sentiment_result'))
+        with self._lock:
+            self.failed_count += 1
+    
+    def pipeline_submitter(self, pipeline: CrawlPipeline) -> Callable[[Dict], None]:
+        """크롤러 on_post_process 콜백 - 게시글을 단계 항목({'post_data': ...})으로 감싸 파이프라인에 투입"""
+        return lambda post_data: pipeline.submit({'post_data': post_data})
+    
+    def create_pipeline(self) -> CrawlPipeline:
+        """분류 → 알림 → 저장 단계 파이프라인 생성 (크롤링 스레드와 분리)"""
+        queue_size = config.Crawling.PIPELINE_QUEUE_SIZE
+        workers = config.Crawling.PIPELINE_WORKERS
+        return CrawlPipeline([
+            PipelineStage('classify', self.classify_stage, workers['classify'], queue_size),
+            PipelineStage('notify', self.notify_stage, workers['notify'], queue_size),
+            PipelineStage('persist', self.persist_stage, workers['persist'], queue_size)
+        ], on_error=self.handle_stage_error)
+    
     def _analyze_sentiment(self, post_data: Dict) -> Dict:
         """감성 분석 수행"""
         try:
@@ -219,8 +318,10 @@ class ImmediateProcessor:
             "timestamp": datetime.now().isoformat(),
             "retry_count": 0
         }
-        self.retry_queue.append(retry_item)
-        print(f"[RETRY] 재시도 큐 추가: {len(self.retry_queue)}개 대기중")
+        with self._lock:
+            self.retry_queue.append(retry_item)
+            queued = len(self.retry_queue)
+        print(f"[RETRY] 재시도 큐 추가: {queued}개 대기중")
     
     def _basic_processing(self, post_data: Dict):
         """기본 처리 (모듈 없을 때)"""
@@ -255,6 +356,14 @@ class ImmediateProcessor:
         for item in processed_items:
             self.retry_queue.remove(item)
         
+        # SQLite 백엔드: 완료 항목 삭제, 남은 항목은 다음 실행으로 이월
+        if self.state_store is not None:
+            try:
+                self.state_store.delete_retry_items([item["post_data"].get("url") for item in processed_items])
+                self.state_store.save_retry_items(self.retry_queue)
+            except Exception as e:
+                print(f"[WARNING] 재시도 항목 저장 실패: {e}")
+        
         print(f"[RETRY] 재시도 완료: {len(processed_items)}개 처리, {len(self.retry_queue)}개 남음")
     
     def get_stats(self) -> Dict:
@@ -284,6 +393,20 @@ class CrawlingSchedule:
     FREQUENT_SCROLL_COUNT = 2    # 15분 주기 스크롤 (성능 최적화)
     REGULAR_SCROLL_COUNT = 3
 
+    # 준비 상태 대기 설정 (대기시간은 상한값으로만 사용)
+    READY_POLL_INTERVAL = 0.25   # 준비 상태 폴링 간격 (초)
+    NETWORK_IDLE_MS = 1500       # 리소스 요청이 없으면 네트워크 유휴로 판단 (ms)
+    SETTLE_CEILING = 3           # 스크롤 후 DOM 안정화 최대 대기 (초)
+    SETTLE_INTERVAL = 0.5        # DOM 변화 없음 판단 구간 (초)
+
+    # 상세 페이지 HTTP 수집 설정 (브라우저 쿠키 재사용)
+    DETAIL_HTTP_CONCURRENCY = 6  # 동시 HTTP 상세 요청 수
+    DETAIL_HTTP_TIMEOUT = 10     # 상세 요청 타임아웃 (초)
+
+    # 상세 페이지 멀티탭 수집 설정 (게시판별)
+    DETAIL_TAB_CONCURRENCY = 4   # 동시에 여는 탭 수
+    DETAIL_BATCH_BUDGET = 60     # 게시판당 상세 수집 전체 시간 예산 (초)
+
     @staticmethod
     def get_wait_time(schedule_type: str) -> int:
         """스케줄 타입별 대기시간 반환"""
@@ -307,19 +430,136 @@ class CrawlingSchedule:
             return CrawlingSchedule.REGULAR_SCROLL_COUNT
 
 # =============================================================================
-# 파일 관리 시스템 - 시간 기반 중복 관리 개선
+# 페이지 준비 대기 엔진 - 고정 sleep 대체
 # =============================================================================
 
-def get_crawled_links_file():
-    """워크플로우별 독립적인 크롤링 링크 파일명 생성"""
-    workflow_name = os.environ.get('GITHUB_WORKFLOW', 'default')
+# 스토브 목록/상세 페이지 준비 판별 선택자
+STOVE_LIST_READY_SELECTORS = ['section.s-board-item', 'p.s-board-text', 'h3.s-board-title']
+STOVE_DETAIL_READY_SELECTORS = [
+    'div.s-article-content', 'div.s-article-content-text',
+    'section.s-article-body', 'div.s-board-content', 'meta[data-vmid="description"]'
+]
+
+PAGE_READY_SCRIPT = """
+    var selectors = arguments[0];
+    var idleMs = arguments[1];
+    if (document.readyState === 'loading') { return null; }
+    for (var i = 0; i < selectors.length; i++) {
+        if (document.querySelector(selectors[i])) { return 'selector:' + selectors[i]; }
+    }
+    if (document.readyState === 'complete' && window.performance && performance.getEntriesByType) {
+        var entries = performance.getEntriesByType('resource');
+        var lastEnd = 0;
+        for (var j = 0; j < entries.length; j++) {
+            if (entries[j].responseEnd > lastEnd) { lastEnd = entries[j].responseEnd; }
+        }
+        if (performance.now() - lastEnd >= idleMs) { return 'network_idle'; }
+    }
+    return null;
+"""
 
-    if 'debug' in workflow_name.lower() or 'test' in workflow_name.lower():
-        return "crawled_links_debug.json"
-    elif 'monitor' in workflow_name.lower():
-        return "crawled_links_monitor.json"
-    else:
-        return "crawled_links.json"
+PAGE_SETTLE_PROBE_SCRIPT = """
+    var selector = arguments[0];
+    var count = selector ? document.querySelectorAll(selector).length : 0;
+    var size = document.body ? document.body.innerHTML.length : 0;
+    return count + ':' + size;
+"""
+
+class PageReadyWaiter:
+    """콘텐츠 준비 즉시 반환하는 대기 엔진 + 소스별 로딩 지연 통계"""
+
+    def __init__(self, poll_interval: float = 0.25, network_idle_ms: int = 1500):
+        self.poll_interval = poll_interval
+        self.network_idle_ms = network_idle_ms
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def wait(self, driver: webdriver.Chrome, source: str, selectors: List[str], ceiling: float) -> Optional[str]:
+        """선택자 등장 또는 네트워크 유휴까지 대기 (ceiling 초 상한), 준비 사유 반환"""
+        start = time.time()
+        reason = None
+        try:
+            reason = WebDriverWait(
+                driver, ceiling,
+                poll_frequency=self.poll_interval,
+                ignored_exceptions=(JavascriptException,)
+            ).until(lambda d: d.execute_script(PAGE_READY_SCRIPT, selectors, self.network_idle_ms))
+        except TimeoutException:
+            reason = None
+
+        elapsed = time.time() - start
+        self.record(source, elapsed, reason)
+
+        if reason:
+            print(f"[WAIT] {source} 준비 완료: {reason} ({elapsed:.2f}초)")
+        else:
+            print(f"[WAIT] {source} 준비 대기 상한 도달 ({ceiling}초)")
+        return reason
+
+    def wait_for_settle(self, driver: webdriver.Chrome, selector: Optional[str] = None,
+                        ceiling: float = 3.0, settle: float = 0.5) -> float:
+        """스크롤 등으로 유발된 DOM 변화가 settle 초 동안 멈출 때까지 대기"""
+        start = time.time()
+        last_probe = None
+        last_change = start
+
+        while time.time() - start < ceiling:
+            try:
+                probe = driver.execute_script(PAGE_SETTLE_PROBE_SCRIPT, selector)
+            except JavascriptException:
+                probe = None
+
+            now = time.time()
+            if probe != last_probe:
+                last_probe = probe
+                last_change = now
+            elif now - last_change >= settle:
+                break
+            time.sleep(self.poll_interval)
+
+        return time.time() - start
+
+    def record(self, source: str, elapsed: float, reason: Optional[str]):
+        """소스별 로딩 지연 통계 기록"""
+        with self._lock:
+            stats = self._stats.setdefault(source, {
+                'count': 0, 'total_time': 0.0, 'min_time': None,
+                'max_time': 0.0, 'timeouts': 0, 'reasons': {}
+            })
+            stats['count'] += 1
+            stats['total_time'] += elapsed
+            stats['max_time'] = max(stats['max_time'], elapsed)
+            stats['min_time'] = elapsed if stats['min_time'] is None else min(stats['min_time'], elapsed)
+            if reason is None:
+                stats['timeouts'] += 1
+            else:
+                key = reason.split(':', 1)[0]
+                stats['reasons'][key] = stats['reasons'].get(key, 0) + 1
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """소스별 로딩 지연 통계 반환"""
+        with self._lock:
+            return {
+                source: {
+                    'count': stats['count'],
+                    'avg_time': round(stats['total_time'] / max(1, stats['count']), 3),
+                    'min_time': round(stats['min_time'] or 0.0, 3),
+                    'max_time': round(stats['max_time'], 3),
+                    'timeouts': stats['timeouts'],
+                    'reasons': dict(stats['reasons'])
+                }
+                for source, stats in self._stats.items()
+            }
+
+# 전역 페이지 대기 엔진 인스턴스
+page_ready_waiter = PageReadyWaiter(
+    poll_interval=CrawlingSchedule.READY_POLL_INTERVAL,
+    network_idle_ms=CrawlingSchedule.NETWORK_IDLE_MS
+)
+
+# =============================================================================
+# 파일 관리 시스템 - 시간 기반 중복 관리 개선
+# =============================================================================
 
 def get_content_cache_file():
     """워크플로우별 독립적인 콘텐츠 캐시 파일명 생성"""
@@ -331,116 +571,31 @@ def get_content_cache_file():
         return "content_cache.json"
 
 def load_crawled_links():
-    """크롤링 링크 로드 - 시간 기반 구조 적용"""
-    crawled_links_file = get_crawled_links_file()
-    
-    if os.path.exists(crawled_links_file):
-        try:
-            with open(crawled_links_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-                # 기존 단순 리스트 형태를 새 구조로 변환
-                if isinstance(data, dict) and "links" in data:
-                    if isinstance(data["links"], list) and len(data["links"]) > 0:
-                        # 기존 단순 링크를 시간 구조로 변환
-                        if isinstance(data["links"][0], str):
-                            converted_links = []
-                            for link in data["links"]:
-                                converted_links.append({
-                                    "url": link,
-                                    "processed_at": (datetime.now() - timedelta(hours=25)).isoformat(),
-                                    "notified": False
-                                })
-                            data["links"] = converted_links
-                            print(f"[INFO] 기존 {len(converted_links)}개 링크를 새 구조로 변환")
-                
-                # 24시간 지난 항목 자동 제거
-                now = datetime.now()
-                valid_links = []
-                for item in data.get("links", []):
-                    try:
-                        processed_time = datetime.fromisoformat(item["processed_at"])
-                        if now - processed_time < timedelta(hours=24):
-                            valid_links.append(item)
-                    except:
-                        continue
-                
-                data["links"] = valid_links
-                print(f"[INFO] 24시간 기준 유효한 링크: {len(valid_links)}개")
-                return data
-                        
-        except Exception as e:
-            print(f"[WARNING] 크롤링 링크 파일 읽기 실패: {e}")
-    
-    return {"links": [], "last_updated": datetime.now().isoformat()}
+    """크롤링 링크 조회 - 기존 파일 형식 dict (인덱스 스냅샷)"""
+    return crawled_link_index.snapshot()
 
 def save_crawled_links(link_data):
-    """크롤링 링크 저장 - 적극적 크기 관리"""
-    try:
-        # 크기 제한을 100개로 축소 (더 적극적 관리)
-        if len(link_data["links"]) > 100:
-            # 최신 100개만 유지
-            link_data["links"] = sorted(
-                link_data["links"], 
-                key=lambda x: x.get("processed_at", ""), 
-                reverse=True
-            )[:100]
-            print(f"[INFO] 링크 목록을 최신 100개로 정리")
-
-        link_data["last_updated"] = datetime.now().isoformat()
-
-        crawled_links_file = get_crawled_links_file()
-        with open(crawled_links_file, 'w', encoding='utf-8') as f:
-            json.dump(link_data, f, ensure_ascii=False, indent=2)
-            
-        print(f"[INFO] 크롤링 링크 저장 완료: {len(link_data['links'])}개")
-
-    except Exception as e:
-        print(f"[ERROR] 링크 저장 실패: {e}")
+    """크롤링 링크 전체 교체 후 스냅샷 저장"""
+    crawled_link_index.replace(link_data)
 
-def is_recently_processed(url: str, links_data: List[Dict], hours: int = 24) -> bool:
-    """시간 기반 중복 체크 - 24시간 내 처리된 링크인지 확인"""
-    try:
-        now = datetime.now()
-        for item in links_data:
-            if item.get("url") == url:
-                processed_time = datetime.fromisoformat(item["processed_at"])
-                if now - processed_time < timedelta(hours=hours):
-                    return True
-        return False
-    except Exception as e:
-        print(f"[DEBUG] 중복 체크 오류: {e}")
-        return False
+def is_recently_processed(url: str, links_data: Optional[List[Dict]] = None, hours: int = 24) -> bool:
+    """
+    중복 체크 - 30일 블룸 필터를 먼저 조회하고 필요 시 24시간 정확 인덱스 조회
+    (수정/끌어올림으로 1페이지에 다시 올라온 오래된 게시글 재알림 방지)
+    links_data는 이전 호출 형식 호환용으로 무시됩니다.
+    """
+    return crawled_link_index.is_seen(url, hours)
 
 def mark_as_processed(url: str, notified: bool = False):
-    """게시글을 처리됨으로 마킹 - 알림 성공 후에만 호출"""
+    """게시글을 처리됨으로 마킹 - 알림 성공 후에만 호출 (저널에 즉시 추가)"""
     try:
-        link_data = load_crawled_links()
-        
-        # 기존 항목 업데이트 또는 새 항목 추가
-        found = False
-        for item in link_data["links"]:
-            if item.get("url") == url:
-                item["processed_at"] = datetime.now().isoformat()
-                item["notified"] = notified
-                found = True
-                break
-        
-        if not found:
-            link_data["links"].append({
-                "url": url,
-                "processed_at": datetime.now().isoformat(),
-                "notified": notified
-            })
-        
-        save_crawled_links(link_data)
+        crawled_link_index.mark(url, notified)
         print(f"[INFO] 링크 처리 완료 마킹: {url[:50]}... (알림: {notified})")
-        
     except Exception as e:
         print(f"[ERROR] 링크 마킹 실패: {e}")
 
 def load_content_cache():
-    """게시글 내용 캐시 로드"""
+    """게시글 내용 캐시 파일 로드 (원본 dict)"""
     content_cache_file = get_content_cache_file()
 
     if os.path.exists(content_cache_file):
@@ -452,20 +607,300 @@ def load_content_cache():
     return {}
 
 def save_content_cache(cache_data):
-    """게시글 내용 캐시 저장"""
+    """게시글 내용 캐시 파일 저장 (크기 관리는 ContentCache에서 수행)"""
     try:
-        if len(cache_data) > 500:
-            sorted_items = sorted(cache_data.items(), 
-                                key=lambda x: x[1].get('timestamp', ''), reverse=True)
-            cache_data = dict(sorted_items[:500])
-
         content_cache_file = get_content_cache_file()
         with open(content_cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            json.dump(cache_data, f, ensure_ascii=False, separators=(',', ':'))
 
     except Exception as e:
         print(f"[ERROR] 캐시 저장 실패: {e}")
 
+def get_content_key(post_url: str) -> str:
+    """실행 간 고정되는 콘텐츠 캐시 키 (게시글 식별자 "source:post_id"의 SHA-1)"""
+    return hashlib.sha1(post_identity(post_url).encode('utf-8')).hexdigest()
+
+class ContentCache:
+    """
+    게시글 본문 캐시 - 소스별 샤드, LRU + TTL 제거
+    프로세스당 한 번 로드하고, 변경은 저널(content_cache.jsonl)에 이벤트 한 줄씩 추가합니다.
+    SQLite 백엔드에서는 content_cache 테이블을 직접 조회합니다.
+    """
+
+    FORMAT_VERSION = 2
+
+    def __init__(self, ttl_hours: float = 24, max_entries_per_source: int = 200,
+                 store: Optional[SQLiteStateStore] = None):
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries_per_source = max_entries_per_source
+        self._store = store
+        self._lock = threading.Lock()
+        self._shards = None
+        self._journal = None
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'evicted': 0,
+            'writes': 0
+        }
+
+    def get(self, post_url: str, source: str) -> Optional[str]:
+        """캐시된 본문 반환 (없거나 만료되면 None)"""
+        key = get_content_key(post_url)
+        if self._store is not None:
+            entry = self._store.get_content(source, key, time.time() - self.ttl_seconds)
+            with self._lock:
+                self.stats['hits' if entry else 'misses'] += 1
+            return entry.get('content', STOVE_CONTENT_FALLBACK) if entry else None
+        with self._lock:
+            shard = self._load().get(source)
+            entry = shard.get(key) if shard else None
+
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+
+            if time.time() - entry.get('ts', 0) >= self.ttl_seconds:
+                del shard[key]
+                self._journal.record_delete([source, key])
+                self.stats['expired'] += 1
+                self.stats['misses'] += 1
+                return None
+
+            shard.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry.get('content', STOVE_CONTENT_FALLBACK)
+
+    def put(self, post_url: str, content: str, source: str):
+        """본문 기록 - 소스 샤드가 가득 차면 가장 오래 사용하지 않은 항목 제거"""
+        key = get_content_key(post_url)
+        entry = {'content': content, 'ts': time.time(), 'url': post_url}
+        if self._store is not None:
+            evicted = self._store.put_content(source, key, post_url, content, entry['ts'],
+                                              self.max_entries_per_source)
+            with self._lock:
+                self.stats['evicted'] += evicted
+                self.stats['writes'] += 1
+            return
+        with self._lock:
+            shard = self._load().setdefault(source, OrderedDict())
+            shard[key] = entry
+            shard.move_to_end(key)
+            self._journal.record_set([source, key], entry)
+            while len(shard) > self.max_entries_per_source:
+                evicted_key, _ = shard.popitem(last=False)
+                self._journal.record_delete([source, evicted_key])
+                self.stats['evicted'] += 1
+            self.stats['writes'] += 1
+
+    def flush(self, force: bool = False) -> bool:
+        """저널이 임계값을 넘었으면 만료 항목을 뺀 스냅샷으로 압축 (force 시 항상)"""
+        if self._store is not None:
+            self._store.prune_content(time.time() - self.ttl_seconds)
+            return True
+        with self._lock:
+            if self._shards is None:
+                return False
+            try:
+                if force:
+                    return self._journal.compact(self._shards)
+                return self._journal.maybe_compact(self._shards)
+            except Exception as e:
+                print(f"[ERROR] 캐시 저장 실패: {e}")
+                return False
+
+    def close(self):
+        """진행 중인 백그라운드 압축 완료 대기"""
+        if self._journal is not None:
+            self._journal.close()
+
+    def get_stats(self) -> Dict:
+        """적중/미스 통계 반환"""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            if self._store is not None:
+                entries = self._store.count_content()
+            else:
+                entries = sum(len(shard) for shard in (self._shards or {}).values())
+            return {
+                **self.stats,
+                'hit_rate': round(self.stats['hits'] / lookups, 3) if lookups else 0.0,
+                'entries': entries
+            }
+
+    def _load(self) -> Dict[str, OrderedDict]:
+        """최초 접근 시 한 번만 스냅샷 + 저널 재생 (LRU 순서는 기록 시각 기준 복원)"""
+        if self._shards is None:
+            self._journal = file_manager.open_journal(
+                get_content_cache_file(), encode=self._encode, decode=self._decode,
+                apply=self._apply, indent=None
+            )
+            try:
+                self._shards = self._journal.load()
+            except Exception as e:
+                print(f"[WARNING] 콘텐츠 캐시 로드 실패, 새로 생성: {e}")
+                self._shards = {}
+        return self._shards
+
+    def _encode(self, shards: Dict[str, OrderedDict]) -> Dict:
+        cutoff = time.time() - self.ttl_seconds
+        data = {'version': self.FORMAT_VERSION, 'shards': {}}
+        for source, shard in shards.items():
+            live = {k: v for k, v in shard.items() if v.get('ts', 0) > cutoff}
+            if live:
+                data['shards'][source] = live
+        return data
+
+    def _decode(self, raw) -> Dict[str, OrderedDict]:
+        shards = {}
+        if isinstance(raw, dict) and raw.get('version') == self.FORMAT_VERSION:
+            for source, entries in raw.get('shards', {}).items():
+                ordered = sorted(entries.items(), key=lambda item: item[1].get('ts', 0))
+                shards[source] = OrderedDict(ordered)
+        elif raw:
+            # 구버전 키(hash 기반)는 실행마다 달라 재사용 불가 - 폐기 (다음 압축 시 스냅샷 교체)
+            print(f"[INFO] 구버전 콘텐츠 캐시 {len(raw)}개 항목 폐기 (키 형식 변경)")
+        return shards
+
+    @staticmethod
+    def _apply(shards: Dict[str, OrderedDict], op: str, key, value):
+        # 저널 키 = (source, content_key)
+        source, content_key = key
+        shard = shards.setdefault(source, OrderedDict())
+        if op == 'set':
+            shard[content_key] = value
+            shard.move_to_end(content_key)
+        elif op == 'del':
+            shard.pop(content_key, None)
+
+# 전역 콘텐츠 캐시 인스턴스
+content_cache = ContentCache(
+    ttl_hours=config.Crawling.CONTENT_CACHE_TTL_HOURS,
+    max_entries_per_source=config.Crawling.CONTENT_CACHE_MAX_PER_SOURCE,
+    store=get_state_store()
+)
+atexit.register(content_cache.close)
+
+# =============================================================================
+# 크롤링 커서 - 소스별 최고 처리 post_id (High-water mark)
+# =============================================================================
+
+def get_crawl_cursor_file():
+    """워크플로우별 독립적인 크롤링 커서 파일명 생성"""
+    workflow_name = os.environ.get('GITHUB_WORKFLOW', 'default')
+
+    if 'debug' in workflow_name.lower() or 'test' in workflow_name.lower():
+        return "crawl_cursors_debug.json"
+    elif 'monitor' in workflow_name.lower():
+        return "crawl_cursors_monitor.json"
+    else:
+        return "crawl_cursors.json"
+
+class CrawlCursorStore:
+    """
+    소스별 크롤링 커서 관리
+    Stove(/view/ID), 루리웹(/read/ID) 게시글 ID는 시간순 증가하므로
+    커서 이하 ID를 만나면 목록 탐색을 중단합니다.
+
+    커서는 실행 종료 시 한 번에 갱신되며, 목록에 있던 커서 초과 ID 중
+    처리 실패/미완료 게시글 직전까지만 전진하여 재시도 대상을 건너뛰지 않습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cursors = None
+        self._listed = {}
+        self._done = {}
+
+    def get(self, source: str) -> Optional[int]:
+        """소스 커서 조회 (없으면 None)"""
+        with self._lock:
+            return self._load().get(source)
+
+    def register(self, source: str, post_ids: List) -> None:
+        """이번 실행에서 목록에 나타난 게시글 ID 등록"""
+        ids = {int(post_id) for post_id in post_ids if str(post_id).isdigit()}
+        with self._lock:
+            self._listed.setdefault(source, set()).update(ids)
+
+    def complete(self, source: str, post_id) -> None:
+        """처리 완료(또는 의도적으로 제외된) 게시글 ID 기록"""
+        if not source or not str(post_id).isdigit():
+            return
+        with self._lock:
+            self._done.setdefault(source, set()).add(int(post_id))
+
+    def commit(self) -> Dict[str, int]:
+        """실패 없는 연속 구간까지 커서 전진 후 저장, 실행 상태 초기화"""
+        with self._lock:
+            cursors = self._load()
+            advanced = {}
+
+            for source, listed in self._listed.items():
+                current = cursors.get(source, 0)
+                done = self._done.get(source, set())
+                new_cursor = current
+
+                # 오래된 ID부터 확인 - 처음 미완료 ID에서 중단
+                for post_id in sorted(i for i in listed if i > current):
+                    if post_id not in done:
+                        break
+                    new_cursor = post_id
+
+                if new_cursor > current:
+                    cursors[source] = new_cursor
+                    advanced[source] = new_cursor
+
+            self._listed = {}
+            self._done = {}
+
+            if advanced:
+                self._save(advanced)
+            return advanced
+
+    def _load(self) -> Dict[str, int]:
+        if self._cursors is None:
+            cursor_file = get_crawl_cursor_file()
+            try:
+                with file_manager.file_lock(cursor_file, shared=True):
+                    self._cursors = self._read(cursor_file)
+            except Exception as e:
+                print(f"[WARNING] 크롤링 커서 파일 읽기 실패: {e}")
+                self._cursors = {}
+        return self._cursors
+
+    @staticmethod
+    def _read(cursor_file: str) -> Dict[str, int]:
+        if not os.path.exists(cursor_file):
+            return {}
+        with open(cursor_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {k: int(v) for k, v in data.get('cursors', {}).items()}
+
+    def _save(self, advanced: Dict[str, int]):
+        """잠금 안에서 최신 파일에 전진한 커서만 병합 후 원자적 교체 (중간 종료 시에도 파일 보존)"""
+        cursor_file = get_crawl_cursor_file()
+        try:
+            with file_manager.file_lock(cursor_file):
+                try:
+                    cursors = self._read(cursor_file)
+                except (OSError, ValueError) as e:
+                    print(f"[WARNING] 크롤링 커서 파일 읽기 실패, 이번 실행 커서로 저장: {e}")
+                    cursors = dict(self._cursors or {})
+                for source, cursor in advanced.items():
+                    cursors[source] = max(cursors.get(source, 0), cursor)
+                file_manager.write_json_atomic(cursor_file, {
+                    'cursors': cursors,
+                    'last_updated': datetime.now().isoformat()
+                })
+                self._cursors = cursors
+        except Exception as e:
+            print(f"[ERROR] 크롤링 커서 저장 실패: {e}")
+
+# 전역 크롤링 커서 인스턴스
+crawl_cursor_store = CrawlCursorStore()
+
 # =============================================================================
 # Chrome Driver 관리 - 리소스 최적화 강화
 # =============================================================================
@@ -517,6 +952,9 @@ def get_chrome_driver():
     }
     options.add_experimental_option('prefs', prefs)
 
+    # 네트워크 필터 통계용 성능 로그 (Network 도메인 이벤트)
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
     # 3단계 폴백 메커니즘
     possible_paths = [
         '/usr/bin/chromedriver',
@@ -550,36 +988,333 @@ def get_chrome_driver():
 
     raise Exception("모든 ChromeDriver 초기화 방법이 실패했습니다.")
 
+# =============================================================================
+# 네트워크 필터 - CDP 기반 무거운 하위 리소스 차단
+# =============================================================================
+
+# 확장자 기반 차단 대상 (폰트, 스타일시트, 이미지, 동영상)
+BLOCKED_RESOURCE_EXTENSIONS = [
+    '.woff', '.woff2', '.ttf', '.otf', '.eot',
+    '.css',
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.ico',
+    '.mp4', '.webm', '.m3u8', '.mp3'
+]
+
+# 분석/광고 도메인 차단 대상
+BLOCKED_TRACKER_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*adservice.google.*', '*facebook.net*',
+    '*scorecardresearch.com*', '*hotjar.com*', '*criteo.*', '*clarity.ms*', '*amplitude.com*'
+]
+
+# 차단 리소스 유형별 예상 절감 바이트 (실제 응답 크기를 알 수 없어 평균값 사용)
+ESTIMATED_RESOURCE_BYTES = {
+    'Font': 40000,
+    'Stylesheet': 30000,
+    'Image': 50000,
+    'Media': 500000,
+    'Script': 80000
+}
+
+def drain_performance_log(driver: webdriver.Chrome) -> List[Dict]:
+    """성능 로그에서 CDP 이벤트 메시지 수집 (로그 버퍼는 읽으면 비워짐)"""
+    messages = []
+    try:
+        entries = driver.get_log('performance')
+    except Exception:
+        return messages
+
+    for entry in entries:
+        try:
+            messages.append(json.loads(entry['message'])['message'])
+        except (KeyError, ValueError, TypeError):
+            continue
+    return messages
+
+class NetworkFilter:
+    """
+    Network.setBlockedURLs 기반 하위 리소스 차단
+    소스별 스크립트 출처 허용 목록 밖에서 관측된 스크립트 출처는 학습하여 다음 로딩부터 차단합니다.
+    """
+
+    def __init__(self, enabled: bool = True, script_allowlist: Optional[Dict[str, List[str]]] = None):
+        self.enabled = enabled
+        self.script_allowlist = script_allowlist or {}
+        self.base_patterns = BLOCKED_TRACKER_PATTERNS + [
+            pattern
+            for ext in BLOCKED_RESOURCE_EXTENSIONS
+            for pattern in (f'*{ext}', f'*{ext}?*')
+        ]
+        self._lock = threading.Lock()
+        self._learned_origins = {}
+        self.stats = {
+            'applied': 0,
+            'requests': 0,
+            'blocked': 0,
+            'blocked_by_type': {},
+            'bytes_saved': 0
+        }
+
+    def apply(self, driver: webdriver.Chrome, source: str) -> bool:
+        """현재 탭에 차단 패턴 적용 (탭/타겟마다 호출 필요)"""
+        if not self.enabled:
+            return False
+        with self._lock:
+            learned = sorted(self._learned_origins.get(self._source_group(source), set()))
+        patterns = self.base_patterns + [f'*://{host}/*' for host in learned]
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            with self._lock:
+                self.stats['applied'] += 1
+            return True
+        except Exception as e:
+            print(f"[NETFILTER] 차단 패턴 적용 실패: {str(e)[:100]}")
+            return False
+
+    def collect(self, messages: List[Dict], source: str):
+        """CDP 네트워크 이벤트로 차단 통계 집계 및 허용 목록 밖 스크립트 출처 학습"""
+        if not self.enabled:
+            return
+
+        group = self._source_group(source)
+        allowed = self.script_allowlist.get(group)
+
+        with self._lock:
+            for message in messages:
+                method = message.get('method')
+                params = message.get('params', {})
+
+                if method == 'Network.requestWillBeSent':
+                    self.stats['requests'] += 1
+                    if allowed and params.get('type') == 'Script':
+                        host = urlparse(params.get('request', {}).get('url', '')).hostname or ''
+                        if host and not self._is_allowed(host, allowed):
+                            learned = self._learned_origins.setdefault(group, set())
+                            if host not in learned:
+                                learned.add(host)
+                                print(f"[NETFILTER] {group} 허용 목록 밖 스크립트 출처 학습: {host}")
+
+                elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                    resource_type = params.get('type', 'Other')
+                    self.stats['blocked'] += 1
+                    self.stats['blocked_by_type'][resource_type] = \
+                        self.stats['blocked_by_type'].get(resource_type, 0) + 1
+                    self.stats['bytes_saved'] += ESTIMATED_RESOURCE_BYTES.get(resource_type, 0)
+
+    def get_stats(self) -> Dict:
+        """차단 통계 반환"""
+        with self._lock:
+            return {
+                **self.stats,
+                'blocked_by_type': dict(self.stats['blocked_by_type']),
+                'learned_origins': {k: sorted(v) for k, v in self._learned_origins.items()}
+            }
+
+    @staticmethod
+    def _source_group(source: str) -> str:
+        """소스명 → 허용 목록 그룹 (stove_korea_bug:detail → stove)"""
+        return source.split(':', 1)[0].split('_', 1)[0]
+
+    @staticmethod
+    def _is_allowed(host: str, allowed_domains: List[str]) -> bool:
+        return any(host == domain or host.endswith('.' + domain) for domain in allowed_domains)
+
+# 전역 네트워크 필터 인스턴스
+network_filter = NetworkFilter(
+    enabled=config.Crawling.NETWORK_FILTER_ENABLED,
+    script_allowlist=config.Crawling.SCRIPT_ORIGIN_ALLOWLIST
+)
+
+# =============================================================================
+# Chrome Driver 풀 - 웜 브라우저 재사용
+# =============================================================================
+
+class ChromeDriverPool:
+    """고정 크기 Chrome 드라이버 풀 - 콜드 스타트 제거 및 상태 초기화"""
+
+    def __init__(self, size: int = 2, checkout_timeout: float = 600.0):
+        self.size = max(1, size)
+        self.checkout_timeout = checkout_timeout
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._aborted = set()
+        self.stats = {
+            'created': 0,
+            'reused': 0,
+            'replaced': 0,
+            'closed': 0,
+            'aborted': 0
+        }
+
+    def acquire(self) -> webdriver.Chrome:
+        """드라이버 대여 - 유휴 드라이버 재사용, 없으면 풀 크기 내에서 신규 생성"""
+        deadline = time.time() + self.checkout_timeout
+
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = None
+
+            if driver is None:
+                with self._lock:
+                    can_create = self._created < self.size
+                    if can_create:
+                        self._created += 1
+
+                if can_create:
+                    try:
+                        driver = get_chrome_driver()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                    self.stats['created'] += 1
+                    print(f"[POOL] 신규 ChromeDriver 생성 ({self._created}/{self.size})")
+                    return driver
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"ChromeDriver 대여 대기 시간 초과 ({self.checkout_timeout}초)")
+                try:
+                    driver = self._idle.get(timeout=min(remaining, 1.0))
+                except queue.Empty:
+                    continue
+
+            # 유휴 드라이버 헬스 체크 - 죽은 드라이버는 교체
+            if self._is_healthy(driver):
+                self.stats['reused'] += 1
+                print("[POOL] 웜 ChromeDriver 재사용")
+                return driver
+
+            print("[POOL] 비정상 ChromeDriver 감지 - 교체")
+            self._discard(driver)
+            self.stats['replaced'] += 1
+
+    def release(self, driver: webdriver.Chrome, broken: bool = False):
+        """드라이버 반납 - 페이지/쿠키 상태 초기화 후 유휴 큐로 복귀"""
+        if driver is None:
+            return
+
+        with self._lock:
+            aborted = id(driver) in self._aborted
+            self._aborted.discard(id(driver))
+            if aborted:
+                # abort()에서 이미 종료된 드라이버 - 슬롯만 반환
+                self._created = max(0, self._created - 1)
+        if aborted:
+            return
+
+        if broken or not self._reset_state(driver):
+            print("[POOL] 드라이버 상태 초기화 실패 - 폐기")
+            self._discard(driver)
+            self.stats['replaced'] += 1
+            return
+
+        self._idle.put(driver)
+
+    def abort(self, driver: webdriver.Chrome):
+        """사용 중인 드라이버 강제 종료 - 데드라인 초과 시 다른 스레드에서 호출"""
+        with self._lock:
+            if id(driver) in self._aborted:
+                return
+            self._aborted.add(id(driver))
+        self.stats['aborted'] += 1
+        print("[POOL] 데드라인 초과 - 사용 중인 ChromeDriver 강제 종료")
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def borrow(self):
+        """드라이버 대여 컨텍스트 매니저"""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close_all(self):
+        """유휴 드라이버 전체 종료 (실행 종료 시 호출)"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+            self.stats['closed'] += 1
+
+    def get_stats(self) -> Dict:
+        """풀 통계 반환"""
+        return {
+            **self.stats,
+            'size': self.size,
+            'alive': self._created,
+            'idle': self._idle.qsize()
+        }
+
+    def _is_healthy(self, driver: webdriver.Chrome) -> bool:
+        """드라이버 헬스 체크"""
+        try:
+            return bool(driver.window_handles) and driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def _reset_state(self, driver: webdriver.Chrome) -> bool:
+        """체크아웃 간 상태 초기화 - 추가 탭, 스토리지, 쿠키, 현재 페이지"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            try:
+                # 모든 도메인 쿠키 삭제 (delete_all_cookies는 현재 도메인만 삭제)
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            except Exception:
+                driver.delete_all_cookies()
+
+            driver.implicitly_wait(0)
+            driver.get('about:blank')
+            return self._is_healthy(driver)
+        except Exception as e:
+            print(f"[POOL] 상태 초기화 오류: {str(e)[:100]}")
+            return False
+
+    def _discard(self, driver: webdriver.Chrome):
+        """드라이버 종료 및 풀 슬롯 반환"""
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"[WARNING] ChromeDriver 종료 실패: {e}")
+        finally:
+            with self._lock:
+                self._created = max(0, self._created - 1)
+
+# 전역 드라이버 풀 인스턴스
+chrome_driver_pool = ChromeDriverPool(
+    size=config.Crawling.DRIVER_POOL_SIZE,
+    checkout_timeout=config.Crawling.DRIVER_CHECKOUT_TIMEOUT
+)
+atexit.register(chrome_driver_pool.close_all)
+
 # =============================================================================
 # URL 처리 유틸리티
 # =============================================================================
 
 def fix_url_bug(url):
-    """URL 버그 수정 함수"""
-    if not url:
-        return url
-
-    # ttps:// → https:// 수정
-    if url.startswith('ttps://'):
-        url = 'h' + url
-        print(f"[URL FIX] ttps → https: {url}")
-
-    # 상대 경로 → 절대 경로
-    elif url.startswith('/'):
-        if 'onstove.com' in url or 'epicseven' in url:
-            url = 'https://page.onstove.com' + url
-        elif 'ruliweb.com' in url:
-            url = 'https://bbs.ruliweb.com' + url
-        elif 'reddit.com' in url:
-            url = 'https://www.reddit.com' + url
-        print(f"[URL FIX] 상대경로 수정: {url}")
-
-    # 프로토콜 누락
-    elif not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-        print(f"[URL FIX] 프로토콜 추가: {url}")
-
-    return url
+    """URL 버그 수정 함수 (잘린 스킴/상대 경로/스킴 누락 - utils.normalize_post_url 규칙)"""
+    fixed = normalize_post_url(url)
+    if fixed != url:
+        print(f"[URL FIX] {url} → {fixed}")
+    return fixed
 
 # =============================================================================
 # Phase 2: 의미있는 본문 추출 함수 (성능 최적화)
@@ -655,23 +1390,125 @@ def extract_meaningful_content(text: str) -> str:
 # Phase 2: Stove 게시글 내용 추출 함수 - 성능 최적화 완료
 # =============================================================================
 
-def get_stove_post_content(post_url: str, driver: webdriver.Chrome, 
+# Phase 2: Master 발견 CSS Selector 우선순위 (앞쪽일수록 우선)
+STOVE_CONTENT_SELECTORS = [
+    # Master 지적사항: 목록 페이지에서 직접 추출
+    'meta[data-vmid="description"]',
+    'meta[name="description"]',
+
+    # 개별 페이지 선택자들 (백업)
+    'div.s-article-content',
+    'div.s-article-content-text',
+    'section.s-article-body',
+    'div.s-board-content',
+
+    # Phase 2: 추가 백업 선택자
+    '.article-content',
+    '.post-content',
+    '[class*="content"]'
+]
+
+# Phase 2: 메타데이터 필터링 강화 - 본문 후보 제외 키워드
+STOVE_CONTENT_SKIP_KEYWORDS = [
+    'install stove', '스토브를 설치', '로그인이 필요', 
+    'javascript', '댓글', '공유', '좋아요', '추천', '신고',
+    '작성자', '작성일', '조회수', '첨부파일', '다운로드',
+    'copyright', '저작권', '이용약관', '개인정보', '쿠키',
+    '광고', 'ad', 'advertisement', '프로모션', '이벤트',
+    '로그인', 'login', 'sign in', '회원가입', 'register',
+    '메뉴', 'menu', 'navigation', '네비게이션', '사이드바',
+    '배너', 'banner', '푸터', 'footer', '헤더', 'header'
+]
+
+# 상세 페이지 단일 패스 추출 스크립트
+# arguments[0]: 선택자 목록, arguments[1]: 제외 키워드 → 우선순위 순 후보 텍스트 반환
+STOVE_DETAIL_EXTRACT_SCRIPT = """
+    var selectors = arguments[0];
+    var skipKeywords = arguments[1].map(function(k) { return k.toLowerCase(); });
+    var candidates = [];
+
+    for (var rank = 0; rank < selectors.length; rank++) {
+        var selector = selectors[rank];
+        var elements;
+        try {
+            elements = document.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+
+        for (var i = 0; i < elements.length; i++) {
+            var element = elements[i];
+            // 메타 태그는 content 속성에서, 일반 태그는 화면 텍스트에서 추출
+            var raw = selector.indexOf('meta') === 0
+                ? (element.getAttribute('content') || '')
+                : (element.innerText || '');
+            raw = raw.trim();
+
+            if (!raw || raw.length < 30) {
+                continue;
+            }
+
+            var lower = raw.toLowerCase();
+            var skipped = skipKeywords.some(function(k) { return lower.indexOf(k) !== -1; });
+            if (skipped) {
+                continue;
+            }
+
+            candidates.push({rank: rank, selector: selector, text: raw});
+        }
+    }
+    return candidates;
+"""
+
+STOVE_CONTENT_FALLBACK = "게시글 내용을 확인할 수 없습니다."
+
+def _summarize_content_candidates(candidates: List[Dict]) -> Optional[str]:
+    """Phase 2: 선택자 우선순위 순으로 의미있는 본문 추출 알고리즘 적용"""
+    for candidate in candidates:
+        meaningful_content = extract_meaningful_content(candidate['text'])
+
+        # Phase 2: 최소 길이 50자 이상으로 증가
+        if len(meaningful_content) >= 50:
+            print(f"[SUCCESS] 선택자 {candidate['rank'] + 1}/{len(STOVE_CONTENT_SELECTORS)} "
+                  f"'{candidate['selector']}'로 내용 추출 성공")
+            # 150자 이내로 요약
+            if len(meaningful_content) > 150:
+                return meaningful_content[:147] + '...'
+            return meaningful_content
+    return None
+
+def get_stove_post_content(post_url: str, driver: Optional[webdriver.Chrome] = None, 
                           source: str = "stove_korea_bug", 
                           schedule_type: str = "frequent") -> str:
-    """Phase 2: 스토브 게시글 내용 추출 - 성능 최적화 완료"""
+    """Phase 2: 스토브 게시글 내용 추출 - 성능 최적화 완료 (driver 미지정 시 풀에서 대여)"""
 
     # 캐시 확인
-    cache = load_content_cache()
-    url_hash = hash(post_url) % (10**8)
+    cached_content = content_cache.get(post_url, source)
+    if cached_content is not None:
+        print(f"[CACHE] 캐시된 내용 사용: {post_url}")
+        return cached_content
+
+    # 브라우저 세션 쿠키로 HTTP 우선 수집 (한 번만) - 검증 실패 시에만 브라우저 구동
+    http_content = _fetch_stove_detail_http(post_url, export_driver_cookies(driver))
+    if http_content:
+        print(f"[HTTP] 상세 HTTP 수집 성공: {post_url}")
+        content_cache.put(post_url, http_content, source)
+        return http_content
+
+    if driver is None:
+        with chrome_driver_pool.borrow() as pooled_driver:
+            network_filter.apply(pooled_driver, source)
+            try:
+                return _get_stove_post_content_browser(post_url, pooled_driver, source, schedule_type)
+            finally:
+                network_filter.collect(drain_performance_log(pooled_driver), source)
 
-    if str(url_hash) in cache:
-        cached_item = cache[str(url_hash)]
-        cache_time = datetime.fromisoformat(cached_item.get('timestamp', '2000-01-01'))
-        if datetime.now() - cache_time < timedelta(hours=24):
-            print(f"[CACHE] 캐시된 내용 사용: {post_url}")
-            return cached_item.get('content', "게시글 내용을 확인할 수 없습니다.")
+    return _get_stove_post_content_browser(post_url, driver, source, schedule_type)
 
-    content_summary = "게시글 내용을 확인할 수 없습니다."
+def _get_stove_post_content_browser(post_url: str, driver: webdriver.Chrome,
+                                    source: str, schedule_type: str) -> str:
+    """브라우저로 상세 페이지 본문 추출 (캐시/HTTP 확인은 호출 측에서 완료)"""
+    content_summary = STOVE_CONTENT_FALLBACK
 
     try:
         print(f"[DEBUG] 게시글 내용 추출 시도: {post_url}")
@@ -680,102 +1517,33 @@ def get_stove_post_content(post_url: str, driver: webdriver.Chrome,
         driver.set_page_load_timeout(wait_time + 10)
         driver.get(post_url)
 
-        print(f"[DEBUG] 페이지 로딩 대기 중... ({wait_time}초)")
-        time.sleep(wait_time)
-
-        # JavaScript 완전 로딩 확인
-        WebDriverWait(driver, 15).until(
-            lambda d: d.execute_script("return document.readyState") == "complete"
-        )
+        # 본문 요소 등장 즉시 진행 (wait_time은 상한값)
+        print(f"[DEBUG] 페이지 준비 대기 중... (최대 {wait_time}초)")
+        page_ready_waiter.wait(driver, f"{source}:detail", STOVE_DETAIL_READY_SELECTORS, wait_time)
 
-        # Phase 2 최적화: 단계별 스크롤링 (성능 개선)
-        print("[DEBUG] 최적화된 스크롤링 시작...")
-        driver.execute_script("window.scrollTo(0, 500);")
-        time.sleep(2)
+        # 지연 로딩 콘텐츠 트리거 후 DOM 안정화 대기
         driver.execute_script("window.scrollTo(0, 1000);")
-        time.sleep(2)
+        settle_time = page_ready_waiter.wait_for_settle(
+            driver, STOVE_DETAIL_READY_SELECTORS[0],
+            CrawlingSchedule.SETTLE_CEILING, CrawlingSchedule.SETTLE_INTERVAL
+        )
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
-        print("[DEBUG] 최적화된 스크롤링 완료")
-
-        # Phase 2: Master 발견 CSS Selector 우선 적용
-        content_selectors = [
-            # Master 지적사항: 목록 페이지에서 직접 추출
-            'meta[data-vmid="description"]',
-            'meta[name="description"]',
-
-            # 개별 페이지 선택자들 (백업)
-            'div.s-article-content',
-            'div.s-article-content-text',
-            'section.s-article-body',
-            'div.s-board-content',
-
-            # Phase 2: 추가 백업 선택자
-            '.article-content',
-            '.post-content',
-            '[class*="content"]'
-        ]
+        print(f"[DEBUG] 스크롤 후 안정화 완료 ({settle_time:.2f}초)")
 
-        # Phase 2: 의미있는 본문 추출 알고리즘 적용
-        for i, selector in enumerate(content_selectors):
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    for element in elements:
-                        # 메타 태그는 content 속성에서, 일반 태그는 text에서 추출
-                        if selector.startswith('meta'):
-                            raw_text = element.get_attribute('content').strip()
-                        else:
-                            raw_text = element.text.strip()
-
-                        if not raw_text or len(raw_text) < 30:
-                            continue           
-
-                        # Phase 2: 메타데이터 필터링 강화
-                        skip_keywords = [
-                            'install stove', '스토브를 설치', '로그인이 필요', 
-                            'javascript', '댓글', '공유', '좋아요', '추천', '신고',
-                            '작성자', '작성일', '조회수', '첨부파일', '다운로드',
-                            'copyright', '저작권', '이용약관', '개인정보', '쿠키',
-                            '광고', 'ad', 'advertisement', '프로모션', '이벤트',
-                            '로그인', 'login', 'sign in', '회원가입', 'register',
-                            '메뉴', 'menu', 'navigation', '네비게이션', '사이드바',
-                            '배너', 'banner', '푸터', 'footer', '헤더', 'header'
-                        ]
-
-                        if any(skip.lower() in raw_text.lower() for skip in skip_keywords):
-                            continue
-
-                        # Phase 2: 의미있는 문단 추출 (성능 최적화)
-                        meaningful_content = extract_meaningful_content(raw_text)
-
-                        # Phase 2: 최소 길이 50자 이상으로 증가
-                        if len(meaningful_content) >= 50:
-                            # 150자 이내로 요약
-                            if len(meaningful_content) > 150:
-                                content_summary = meaningful_content[:147] + '...'
-                            else:
-                                content_summary = meaningful_content
-
-                            print(f"[SUCCESS] 선택자 {i+1}/{len(content_selectors)} '{selector}'로 내용 추출 성공")
-                            print(f"[CONTENT] {content_summary[:80]}...")
-                            break
-
-                    if content_summary != "게시글 내용을 확인할 수 없습니다.":
-                        break
+        # 모든 선택자/메타 설명/제외 키워드를 한 번의 스크립트 호출로 평가 (암시적 대기 없음)
+        driver.implicitly_wait(0)
+        candidates = driver.execute_script(
+            STOVE_DETAIL_EXTRACT_SCRIPT, STOVE_CONTENT_SELECTORS, STOVE_CONTENT_SKIP_KEYWORDS
+        ) or []
+        print(f"[DEBUG] 본문 후보 {len(candidates)}개 (단일 스크립트 호출)")
 
-            except Exception as e:
-                print(f"[DEBUG] 선택자 '{selector}' 실패: {e}")
-                continue
+        summary = _summarize_content_candidates(candidates)
+        if summary:
+            content_summary = summary
+            print(f"[CONTENT] {content_summary[:80]}...")
 
-        # 캐시 저장
-        cache[str(url_hash)] = {
-            'content': content_summary,
-            'timestamp': datetime.now().isoformat(),
-            'url': post_url,
-            'source': source
-        }
-        save_content_cache(cache)
+        # 캐시 기록 (파일 저장은 실행 종료 시 일괄)
+        content_cache.put(post_url, content_summary, source)
 
     except TimeoutException:
         print(f"[ERROR] 페이지 로딩 타임아웃: {post_url}")
@@ -786,231 +1554,783 @@ def get_stove_post_content(post_url: str, driver: webdriver.Chrome,
 
     return content_summary
 
+def export_driver_cookies(driver: Optional[webdriver.Chrome]) -> Dict[str, str]:
+    """브라우저 세션 쿠키를 requests용 dict로 내보내기"""
+    if driver is None:
+        return {}
+    try:
+        return {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
+    except Exception as e:
+        print(f"[DEBUG] 쿠키 내보내기 실패: {str(e)[:100]}")
+        return {}
+
+def _extract_content_candidates_from_html(html_text: str, body_only: bool = False) -> List[Dict]:
+    """
+    상세 페이지 HTML에서 본문 후보 추출 - STOVE_DETAIL_EXTRACT_SCRIPT와 동일 규칙
+    body_only=True면 meta 설명 선택자를 건너뛰고 게시글 본문 요소만 후보로 사용
+    """
+    if not BEAUTIFULSOUP_AVAILABLE:
+        return []
+
+    soup = BeautifulSoup(html_text, 'html.parser')
+    skip_keywords = [keyword.lower() for keyword in STOVE_CONTENT_SKIP_KEYWORDS]
+    candidates = []
+
+    for rank, selector in enumerate(STOVE_CONTENT_SELECTORS):
+        if body_only and selector.startswith('meta'):
+            continue
+        for element in soup.select(selector):
+            if selector.startswith('meta'):
+                raw_text = (element.get('content') or '').strip()
+            else:
+                raw_text = element.get_text(' ', strip=True)
+
+            if not raw_text or len(raw_text) < 30:
+                continue
+            lowered = raw_text.lower()
+            if any(keyword in lowered for keyword in skip_keywords):
+                continue
+
+            candidates.append({'rank': rank, 'selector': selector, 'text': raw_text})
+
+    return candidates
+
+def _fetch_stove_detail_http(post_url: str, cookies: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """상세 페이지 HTTP 수집 - 검증된 본문 요약 반환, 실패 시 None (브라우저 폴백)"""
+    try:
+        response = get_http_session().get(
+            post_url, cookies=cookies or None, timeout=CrawlingSchedule.DETAIL_HTTP_TIMEOUT
+        )
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"[HTTP] 상세 요청 실패: {post_url} ({str(e)[:80]})")
+        return None
+
+    # Stove는 클라이언트 렌더링이라 서버 HTML의 meta 설명은 사이트 공통 문구일 수 있음
+    # (모든 게시글에 같은 내용이 캐시되지 않도록 HTTP 경로는 본문 요소가 있어야 성공)
+    return _summarize_content_candidates(_extract_content_candidates_from_html(response.text, body_only=True))
+
+def fetch_stove_details_http(post_urls: List[str], source: str = "stove_korea_bug",
+                             cookies: Optional[Dict[str, str]] = None,
+                             max_workers: int = CrawlingSchedule.DETAIL_HTTP_CONCURRENCY) -> Dict[str, str]:
+    """
+    상세 페이지 병렬 HTTP 수집 (keep-alive 세션 + 브라우저 쿠키)
+    검증을 통과한 본문만 반환하며, 나머지 URL은 호출 측에서 브라우저로 수집합니다.
+    """
+    results = {}
+
+    pending = []
+    for url in post_urls:
+        cached_content = content_cache.get(url, source)
+        if cached_content is not None:
+            print(f"[CACHE] 캐시된 내용 사용: {url}")
+            results[url] = cached_content
+        else:
+            pending.append(url)
+
+    if not pending:
+        return results
+
+    start = time.time()
+    fetched = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+        future_to_url = {executor.submit(_fetch_stove_detail_http, url, cookies): url for url in pending}
+        for future in concurrent.futures.as_completed(future_to_url):
+            url = future_to_url[future]
+            try:
+                content = future.result()
+            except Exception as e:
+                print(f"[HTTP] 상세 수집 오류: {url} ({e})")
+                continue
+            if content:
+                results[url] = content
+                content_cache.put(url, content, source)
+                fetched += 1
+
+    print(f"[HTTP] {source} 상세 HTTP 수집: {fetched}/{len(pending)}개 성공 "
+          f"({time.time() - start:.2f}초, 쿠키 {len(cookies or {})}개)")
+    return results
+
+def fetch_stove_details_multitab(driver: webdriver.Chrome, post_urls: List[str],
+                                 source: str = "stove_korea_bug", schedule_type: str = "frequent",
+                                 max_tabs: int = CrawlingSchedule.DETAIL_TAB_CONCURRENCY,
+                                 budget: float = CrawlingSchedule.DETAIL_BATCH_BUDGET,
+                                 cancel_token: Optional[CancelToken] = None) -> Dict[str, str]:
+    """
+    한 Chrome 세션에서 여러 탭(CDP 타겟)으로 상세 페이지 병렬 로딩
+    준비된 탭부터 본문을 수집하며, 동시 탭 수와 전체 시간 예산을 지킵니다.
+    예산 내 수집하지 못한 URL은 결과에 포함되지 않습니다.
+    """
+    results = {}
+
+    pending = []
+    for url in post_urls:
+        cached_content = content_cache.get(url, source)
+        if cached_content is not None:
+            print(f"[CACHE] 캐시된 내용 사용: {url}")
+            results[url] = cached_content
+        else:
+            pending.append(url)
+
+    if not pending:
+        return results
+
+    wait_time = CrawlingSchedule.get_wait_time(schedule_type)
+    detail_source = f"{source}:detail"
+    start = time.time()
+    deadline = start + budget
+    open_tabs = {}  # handle -> (url, opened_at)
+
+    driver.implicitly_wait(0)
+    main_handle = driver.current_window_handle
+    print(f"[TABS] {source} 상세 {len(pending)}개 멀티탭 수집 시작 (동시 {max_tabs}탭, 예산 {budget}초)")
+
+    try:
+        while (pending or open_tabs) and time.time() < deadline:
+            if cancel_token and cancel_token.cancelled:
+                print(f"[CANCEL] {source} 상세 수집 중단")
+                break
+
+            # 빈 슬롯만큼 새 탭 열기 - CDP 타겟 생성은 팝업 차단 설정(popups: 2)의 영향을 받지 않음
+            # 차단 패턴은 타겟별 설정이므로 빈 탭에 적용 후 이동 (location 변경은 로딩을 기다리지 않음)
+            while pending and len(open_tabs) < max_tabs:
+                url = pending.pop(0)
+                before = set(driver.window_handles)
+                driver.execute_cdp_cmd('Target.createTarget', {'url': 'about:blank', 'background': True})
+                new_handles = [h for h in driver.window_handles if h not in before]
+                if not new_handles:
+                    print(f"[TABS] 탭 열기 실패: {url}")
+                    continue
+                driver.switch_to.window(new_handles[0])
+                network_filter.apply(driver, detail_source)
+                driver.execute_script("window.location.href = arguments[0];", url)
+                open_tabs[new_handles[0]] = (url, time.time())
+
+            # 준비된 탭부터 본문 수집 후 닫기
+            for handle, (url, opened_at) in list(open_tabs.items()):
+                driver.switch_to.window(handle)
+                try:
+                    reason = driver.execute_script(
+                        PAGE_READY_SCRIPT, STOVE_DETAIL_READY_SELECTORS, page_ready_waiter.network_idle_ms
+                    )
+                except JavascriptException:
+                    reason = None
+
+                elapsed = time.time() - opened_at
+                if not reason and elapsed < wait_time:
+                    continue
+
+                page_ready_waiter.record(detail_source, elapsed, reason)
+                if reason:
+                    candidates = driver.execute_script(
+                        STOVE_DETAIL_EXTRACT_SCRIPT, STOVE_CONTENT_SELECTORS, STOVE_CONTENT_SKIP_KEYWORDS
+                    ) or []
+                    content = _summarize_content_candidates(candidates) or STOVE_CONTENT_FALLBACK
+                    content_cache.put(url, content, source)
+                else:
+                    print(f"[ERROR] 페이지 로딩 타임아웃: {url}")
+                    content = "⏰ 게시글 로딩 시간 초과"
+
+                results[url] = content
+                driver.close()
+                del open_tabs[handle]
+
+            if open_tabs:
+                time.sleep(page_ready_waiter.poll_interval)
+
+    except Exception as e:
+        print(f"[ERROR] {source} 멀티탭 상세 수집 실패: {e}")
+    finally:
+        # 남은 탭 정리 후 기본 탭으로 복귀
+        for handle in list(open_tabs):
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except Exception:
+                pass
+        try:
+            driver.switch_to.window(main_handle)
+        except Exception:
+            pass
+
+    missed = len(post_urls) - len(results)
+    print(f"[TABS] {source} 상세 수집 완료: {len(results)}/{len(post_urls)}개 "
+          f"({time.time() - start:.1f}초, 미수집 {missed}개)")
+    return results
+
 # =============================================================================
-# 🚀 Master 요구사항: Stove 게시판 크롤링 + 즉시 처리 통합
+# Stove HTTP 목록 수집기 - Chrome 없는 크롤링 (Selenium은 폴백 전용)
 # =============================================================================
 
-def crawl_stove_board(board_url: str, source: str, force_crawl: bool = False, 
-                     schedule_type: str = "frequent", region: str = "korea",
-                     on_post_process: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+STOVE_BASE_URL = 'https://page.onstove.com'
+STOVE_LIST_LIMIT = 20
+
+# 공지사항 ID들 (제외 대상) 및 제목 제외 키워드 - JavaScript 추출기와 동일 기준
+STOVE_OFFICIAL_IDS = {'10518001', '10855687', '10855562', '10855132'}
+STOVE_SKIP_TITLE_KEYWORDS = ['[공지]', '[이벤트]', '[안내]', '[점검]', '[공지사항]']
+
+# 페이지가 자체적으로 로드하는 서버 렌더링 데이터 스크립트
+STOVE_PAYLOAD_SCRIPT_PATTERNS = [
+    re.compile(r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S),
+    re.compile(r'window\.__(?:INITIAL_STATE|APOLLO_STATE|NUXT)__\s*=\s*(\{.*?\})\s*;?\s*</script>', re.S),
+    re.compile(r'<script[^>]*type="application/json"[^>]*>(.*?)</script>', re.S),
+]
+
+STOVE_ID_KEYS = ('article_id', 'articleId', 'post_id', 'postId', 'id')
+STOVE_TITLE_KEYS = ('article_title', 'articleTitle', 'title', 'subject')
+STOVE_PREVIEW_KEYS = ('summary', 'content_summary', 'preview', 'description',
+                      'content', 'contents', 'article_content', 'text')
+STOVE_DATE_KEYS = ('create_datetime', 'created_at', 'createdAt', 'reg_date', 'regDate')
+STOVE_NOTICE_KEYS = ('is_notice', 'isNotice', 'notice', 'is_official', 'isOfficial', 'is_event')
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """keep-alive 연결 풀을 공유하는 requests 세션 반환"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            retry = Retry(
+                total=2,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(['GET'])
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,application/json;q=0.8,*/*;q=0.7',
+                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+            })
+            _http_session = session
+        return _http_session
+
+def _stove_view_url(board_url: str, post_id: str) -> str:
+    """게시판 URL과 게시글 ID로 상세 페이지 URL 구성"""
+    match = re.search(r'/epicseven/(kr|global)/', board_url)
+    region_path = match.group(1) if match else 'kr'
+    return f"{STOVE_BASE_URL}/epicseven/{region_path}/view/{post_id}"
+
+def _clean_payload_text(value) -> str:
+    """payload 문자열에서 HTML 태그/엔티티 제거"""
+    if not isinstance(value, str):
+        return ''
+    text = re.sub(r'<[^>]+>', ' ', value)
+    text = html.unescape(text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+def _stove_item_from_dict(node: Dict, board_url: str) -> Optional[Dict]:
+    """payload dict가 게시글 항목이면 목록 항목으로 변환"""
+    id_key = next((k for k in STOVE_ID_KEYS if k in node), None)
+    title_key = next((k for k in STOVE_TITLE_KEYS if isinstance(node.get(k), str)), None)
+    if not id_key or not title_key:
+        return None
+
+    post_id = str(node.get(id_key, '')).strip()
+    if not post_id.isdigit():
+        return None
+
+    preview_key = next((k for k in STOVE_PREVIEW_KEYS if isinstance(node.get(k), str)), None)
+
+    # 일반 'id' 키는 게시판/작성자 객체와 구분하기 위해 본문 또는 작성일 필드 요구
+    if id_key == 'id' and not preview_key and not any(k in node for k in STOVE_DATE_KEYS):
+        return None
+
+    is_notice = any(node.get(k) in (True, 1, 'Y', 'y', 'true') for k in STOVE_NOTICE_KEYS)
+
+    return {
+        'href': _stove_view_url(board_url, post_id),
+        'id': post_id,
+        'title': _clean_payload_text(node.get(title_key)),
+        'preview_content': _clean_payload_text(node.get(preview_key)) if preview_key else '',
+        'is_notice': is_notice
+    }
+
+def _extract_stove_posts_from_payload(payload, board_url: str) -> List[Dict]:
+    """구조화된 payload(JSON)에서 게시글 항목을 문서 순서대로 추출"""
+    items = []
+    seen_ids = set()
+    board_match = re.search(r'/list/(\d+)', board_url)
+    board_id = board_match.group(1) if board_match else None
+
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            item = _stove_item_from_dict(node, board_url)
+            if item and item['id'] != board_id and item['id'] not in seen_ids:
+                seen_ids.add(item['id'])
+                items.append(item)
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+    return items
+
+def _extract_stove_items_from_payload_html(html_text: str, board_url: str) -> List[Dict]:
+    """HTML에 포함된 서버 렌더링 payload 스크립트에서 게시글 추출"""
+    for pattern in STOVE_PAYLOAD_SCRIPT_PATTERNS:
+        for match in pattern.finditer(html_text):
+            try:
+                payload = json.loads(match.group(1))
+            except (ValueError, TypeError):
+                continue
+            items = _extract_stove_posts_from_payload(payload, board_url)
+            if items:
+                return items
+    return []
+
+def _extract_stove_items_from_markup(html_text: str, board_url: str) -> List[Dict]:
+    """서버 렌더링 마크업에서 section.s-board-item 기준으로 게시글 추출"""
+    if not BEAUTIFULSOUP_AVAILABLE:
+        return []
+
+    soup = BeautifulSoup(html_text, 'html.parser')
+    items = []
+
+    for element in soup.select('section.s-board-item'):
+        link_element = element.select_one('a[href*="/view/"]')
+        title_element = element.select_one('.s-board-title-text, .board-title, h3 span, .title')
+        content_element = element.select_one('p.s-board-text')
+
+        href = link_element.get('href', '') if link_element else ''
+        id_match = re.search(r'/view/(\d+)', href)
+        if not id_match or not title_element:
+            continue
+
+        is_notice = element.select_one(
+            'i.element-badge__s.notice, .notice, [class*="notice"], '
+            'i.element-badge__s.event, .event, [class*="event"], '
+            'span.s-profile-staff-official, [class*="official"]'
+        ) is not None
+
+        items.append({
+            'href': urljoin(STOVE_BASE_URL, href),
+            'id': id_match.group(1),
+            'title': title_element.get_text(strip=True),
+            'preview_content': content_element.get_text(strip=True) if content_element else '',
+            'is_notice': is_notice
+        })
+
+    return items
+
+def _validate_stove_list(items: List[Dict]) -> bool:
+    """HTTP 추출 결과 검증 - 실패 시 Selenium 폴백"""
+    if not items:
+        return False
+    return all(
+        str(item.get('id', '')).isdigit()
+        and len(item.get('title', '')) >= 3
+        and '/view/' in item.get('href', '')
+        for item in items
+    )
+
+def _filter_stove_list_items(items: List[Dict], method: str, cursor: Optional[int] = None) -> List[Dict]:
+    """공지/이벤트/공식 게시글 제외 및 커서 이하 게시글에서 중단 - JavaScript 추출기와 동일한 규칙"""
+    user_posts = []
+
+    for item in items[:STOVE_LIST_LIMIT]:
+        title = item['title']
+
+        if item['id'] in STOVE_OFFICIAL_IDS or item.get('is_notice'):
+            continue
+        if any(keyword in title for keyword in STOVE_SKIP_TITLE_KEYWORDS):
+            continue
+        if cursor is not None and int(item['id']) <= cursor:
+            break
+
+        user_posts.append({
+            'href': item['href'],
+            'id': item['id'],
+            'title': title[:200].strip(),
+            'preview_content': item.get('preview_content', '')[:150].strip(),
+            'selector_used': f'http:{method}'
+        })
+
+    return user_posts
+
+def fetch_stove_board_http(board_url: str, source: str, timeout: int = 10,
+                           cursor: Optional[int] = None) -> Optional[List[Dict]]:
     """
-    Stove 게시판 크롤링 + 즉시 처리 통합
-    Master 요구사항: 게시글별 즉시 처리 (크롤링→감성분석→알림→마킹)
+    Stove 게시판 목록 HTTP 수집 - Chrome 없이 payload/마크업 파싱
+    검증 실패 시 None 반환 (호출 측에서 Selenium 폴백)
     """
+    start = time.time()
 
-    posts = []
-    link_data = load_crawled_links()
+    try:
+        response = get_http_session().get(board_url, timeout=timeout)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"[HTTP] {source} 목록 요청 실패: {e}")
+        return None
 
-    print(f"[INFO] {source} 크롤링 시작 - URL: {board_url}")
-    print(f"[DEBUG] 기존 링크 수: {len(link_data['links'])}, Force Crawl: {force_crawl}")
+    html_text = response.text
 
-    driver = None
-    try:
-        driver = get_chrome_driver()
+    method = 'payload'
+    items = _extract_stove_items_from_payload_html(html_text, board_url)
+    if not _validate_stove_list(items):
+        method = 'markup'
+        items = _extract_stove_items_from_markup(html_text, board_url)
 
-        wait_time = CrawlingSchedule.get_wait_time(schedule_type)
-        driver.set_page_load_timeout(wait_time + 10)
-        driver.implicitly_wait(15)
+    if not _validate_stove_list(items):
+        print(f"[HTTP] {source} 목록 검증 실패 (payload/마크업 모두 게시글 없음)")
+        return None
 
-        print(f"[DEBUG] 게시판 접속 중: {board_url}")
-        driver.get(board_url)
+    user_posts = _filter_stove_list_items(items, method, cursor)
+    print(f"[HTTP] {source} 목록 수집 성공: {len(user_posts)}개 ({method}, {time.time() - start:.2f}초)")
+    return user_posts
 
-        print(f"[DEBUG] 페이지 로딩 대기 중... ({wait_time}초)")
-        time.sleep(wait_time)
+# 목록 JSON 후보 응답 최대 검사 수
+STOVE_NETWORK_MAX_RESPONSES = 10
 
-        # JavaScript 완전 로딩 확인
-        WebDriverWait(driver, 15).until(
-            lambda d: d.execute_script("return document.readyState") == "complete"
-        )
+def capture_stove_list_from_network(driver: webdriver.Chrome, board_url: str, source: str,
+                                    cursor: Optional[int] = None) -> Optional[List[Dict]]:
+    """
+    Chrome 성능 로그의 Network.responseReceived 이벤트에서 XHR/Fetch JSON 응답을 찾아
+    Network.getResponseBody로 본문을 읽고 게시글 목록 구성
+    검증 실패 시 None 반환 (호출 측에서 DOM 탐색)
+    """
+    messages = drain_performance_log(driver)
+    network_filter.collect(messages, source)
 
-        # Phase 2: 최적화된 스크롤링 (성능 개선)
-        driver.execute_script("window.scrollTo(0, 800);")
-        time.sleep(3)
-
-        # 디버깅용 HTML 저장
-        debug_filename = f"{source}_debug_selenium.html"
-        with open(debug_filename, "w", encoding="utf-8") as f:
-            f.write(driver.page_source)
-        print(f"[DEBUG] HTML 저장: {debug_filename}")
-
-        # Phase 2: Master 발견 선택자 우선 적용 - JavaScript 최적화
-        user_posts = driver.execute_script("""
-            var userPosts = [];
-
-            // Phase 2: Master 지적사항 - section.s-board-item 최우선 적용
-            const selectors = [
-                'section.s-board-item',           // Master 발견 선택자 (최우선)
-                'h3.s-board-title',               // 기존 선택자 (백업)
-                '[class*="board-title"]',         // 클래스명 포함
-                '[class*="post-title"]',          // post-title 포함
-                '[class*="article-title"]',       // article-title 포함
-                'h3[class*="title"]',            // h3 태그 title 포함
-                'a[href*="/view/"]'              // view 링크 직접 찾기
-            ];
-
-            var elements = [];
-            var successful_selector = '';
-
-            // 선택자별 시도
-            for (var i = 0; i < selectors.length; i++) {
-                try {
-                    elements = document.querySelectorAll(selectors[i]);
-                    if (elements && elements.length > 0) {
-                        successful_selector = selectors[i];
-                        console.log('Phase 2 선택자 성공:', selectors[i], '개수:', elements.length);
-                        break;
-                    }
-                } catch (e) {
-                    console.log('선택자 실패:', selectors[i], e);
-                    continue;
+    responses = []
+    for message in messages:
+        if message.get('method') != 'Network.responseReceived':
+            continue
+        params = message.get('params', {})
+        response = params.get('response', {})
+        if params.get('type') not in ('XHR', 'Fetch'):
+            continue
+        if 'json' not in response.get('mimeType', '') or response.get('status') != 200:
+            continue
+        responses.append((params.get('requestId'), response.get('url', '')))
+
+    for request_id, url in responses[-STOVE_NETWORK_MAX_RESPONSES:]:
+        try:
+            body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            text = body.get('body', '')
+            if body.get('base64Encoded'):
+                text = base64.b64decode(text).decode('utf-8', errors='replace')
+            payload = json.loads(text)
+        except Exception:
+            continue
+
+        items = _extract_stove_posts_from_payload(payload, board_url)
+        if _validate_stove_list(items):
+            user_posts = _filter_stove_list_items(items, 'network', cursor)
+            print(f"[NETWORK] {source} 목록 JSON 캡처 성공: {len(user_posts)}개 ({url[:80]})")
+            return user_posts
+
+    print(f"[NETWORK] {source} 목록 JSON 응답 없음 ({len(responses)}개 검사) - DOM 탐색 사용")
+    return None
+
+def _extract_stove_list_selenium(driver: webdriver.Chrome, board_url: str, source: str,
+                                 wait_time: int, cursor: Optional[int] = None) -> List[Dict]:
+    """
+    Selenium 폴백: 게시판 페이지 렌더링 후 게시글 목록 추출
+    SPA가 받아온 목록 JSON 응답을 우선 사용하고, 없을 때만 JavaScript DOM 탐색
+    """
+    driver.set_page_load_timeout(wait_time + 10)
+    # 추출은 execute_script 기반 - 요소 미존재 시 암시적 대기로 지연되지 않도록 0 유지
+    driver.implicitly_wait(0)
+
+    # 이전 대여자의 성능 로그 비우기
+    network_filter.collect(drain_performance_log(driver), source)
+
+    print(f"[DEBUG] 게시판 접속 중: {board_url}")
+    driver.get(board_url)
+
+    # 게시글 요소 등장 즉시 진행 (wait_time은 상한값)
+    print(f"[DEBUG] 페이지 준비 대기 중... (최대 {wait_time}초)")
+    page_ready_waiter.wait(driver, source, STOVE_LIST_READY_SELECTORS, wait_time)
+
+    # 네트워크 응답 캡처: 목록 JSON에서 구조화된 게시글 구성 (DOM 탐색 생략)
+    network_posts = capture_stove_list_from_network(driver, board_url, source, cursor)
+    if network_posts is not None:
+        return network_posts
+
+    # Phase 2: 지연 로딩 게시글 트리거 후 DOM 안정화 대기
+    driver.execute_script("window.scrollTo(0, 800);")
+    page_ready_waiter.wait_for_settle(
+        driver, STOVE_LIST_READY_SELECTORS[0],
+        CrawlingSchedule.SETTLE_CEILING, CrawlingSchedule.SETTLE_INTERVAL
+    )
+
+    # 디버깅용 HTML 저장
+    debug_filename = f"{source}_debug_selenium.html"
+    with open(debug_filename, "w", encoding="utf-8") as f:
+        f.write(driver.page_source)
+    print(f"[DEBUG] HTML 저장: {debug_filename}")
+
+    # Phase 2: Master 발견 선택자 우선 적용 - JavaScript 최적화
+    user_posts = driver.execute_script("""
+        var userPosts = [];
+        var cursor = arguments[0];  // 이미 처리한 최고 게시글 ID (없으면 null)
+
+        // Phase 2: Master 지적사항 - section.s-board-item 최우선 적용
+        const selectors = [
+            'section.s-board-item',           // Master 발견 선택자 (최우선)
+            'h3.s-board-title',               // 기존 선택자 (백업)
+            '[class*="board-title"]',         // 클래스명 포함
+            '[class*="post-title"]',          // post-title 포함
+            '[class*="article-title"]',       // article-title 포함
+            'h3[class*="title"]',            // h3 태그 title 포함
+            'a[href*="/view/"]'              // view 링크 직접 찾기
+        ];
+
+        var elements = [];
+        var successful_selector = '';
+
+        // 선택자별 시도
+        for (var i = 0; i < selectors.length; i++) {
+            try {
+                elements = document.querySelectorAll(selectors[i]);
+                if (elements && elements.length > 0) {
+                    successful_selector = selectors[i];
+                    console.log('Phase 2 선택자 성공:', selectors[i], '개수:', elements.length);
+                    break;
                 }
+            } catch (e) {
+                console.log('선택자 실패:', selectors[i], e);
+                continue;
             }
+        }
 
-            if (!elements || elements.length === 0) {
-                console.log('모든 선택자 실패');
-                return [];
-            }
+        if (!elements || elements.length === 0) {
+            console.log('모든 선택자 실패');
+            return [];
+        }
 
-            console.log('총 발견된 요소 수:', elements.length);
-
-            // 공지사항 ID들 (제외 대상)
-            const officialIds = ['10518001', '10855687', '10855562', '10855132'];
-
-            // 각 요소에서 게시글 정보 추출
-            for (var i = 0; i < Math.min(elements.length, 20); i++) {
-                var element = elements[i];
-
-                try {
-                    var linkElement, titleElement, contentElement = null;
-                    var href = '', title = '', preview_content = '';
-
-                    // 링크 요소 찾기
-                    if (successful_selector === 'section.s-board-item') {
-                        // Phase 2: Master 지적사항 - 목록 페이지에서 직접 본문 추출
-                        linkElement = element.querySelector('a[href*="/view/"]');
-                        titleElement = element.querySelector('.s-board-title-text, .board-title, h3 span, .title');
-
-                        // Master 발견: p.s-board-text에서 본문 직접 추출
-                        contentElement = element.querySelector('p.s-board-text');
-                        if (contentElement) {
-                            preview_content = contentElement.textContent?.trim() || '';
-                        }
-                    } else {
-                        // 기타 선택자 기반 추출
-                        linkElement = element.closest('a[href*="/view/"]') || element.querySelector('a[href*="/view/"]');
-                        titleElement = element;
-                    }
+        console.log('총 발견된 요소 수:', elements.length);
 
-                    // 링크 추출
-                    if (linkElement && linkElement.href) {
-                        href = linkElement.href;
-                    }
+        // 공지사항 ID들 (제외 대상)
+        const officialIds = ['10518001', '10855687', '10855562', '10855132'];
 
-                    // 제목 추출
-                    if (titleElement) {
-                        title = titleElement.textContent?.trim() || titleElement.innerText?.trim() || '';
-                    }
+        // 각 요소에서 게시글 정보 추출
+        for (var i = 0; i < Math.min(elements.length, 20); i++) {
+            var element = elements[i];
 
-                    // 유효성 검사
-                    if (!href || !title || title.length < 3) {
-                        continue;
-                    }
+            try {
+                var linkElement, titleElement, contentElement = null;
+                var href = '', title = '', preview_content = '';
 
-                    // URL에서 게시글 ID 추출
-                    var idMatch = href.match(/\/view\/(\d+)/);
-                    if (!idMatch) {
-                        continue;
-                    }
-                    var id = idMatch[1];
+                // 링크 요소 찾기
+                if (successful_selector === 'section.s-board-item') {
+                    // Phase 2: Master 지적사항 - 목록 페이지에서 직접 본문 추출
+                    linkElement = element.querySelector('a[href*="/view/"]');
+                    titleElement = element.querySelector('.s-board-title-text, .board-title, h3 span, .title');
 
-                    // 공지사항 제외
-                    if (officialIds.includes(id)) {
-                        console.log('공지사항 제외:', id, title.substring(0, 20));
-                        continue;
+                    // Master 발견: p.s-board-text에서 본문 직접 추출
+                    contentElement = element.querySelector('p.s-board-text');
+                    if (contentElement) {
+                        preview_content = contentElement.textContent?.trim() || '';
                     }
+                } else {
+                    // 기타 선택자 기반 추출
+                    linkElement = element.closest('a[href*="/view/"]') || element.querySelector('a[href*="/view/"]');
+                    titleElement = element;
+                }
 
-                    // 공지/이벤트 배지 확인
-                    var isNotice = element.querySelector('i.element-badge__s.notice, .notice, [class*="notice"]');
-                    var isEvent = element.querySelector('i.element-badge__s.event, .event, [class*="event"]');
-                    var isOfficial = element.querySelector('span.s-profile-staff-official, [class*="official"]');
+                // 링크 추출
+                if (linkElement && linkElement.href) {
+                    href = linkElement.href;
+                }
 
-                    if (isNotice || isEvent || isOfficial) {
-                        console.log('공지/이벤트 제외:', title.substring(0, 20));
-                        continue;
-                    }
+                // 제목 추출
+                if (titleElement) {
+                    title = titleElement.textContent?.trim() || titleElement.innerText?.trim() || '';
+                }
 
-                    // 제목에서 [공지], [이벤트] 등 키워드 제외  
-                    var skipKeywords = ['[공지]', '[이벤트]', '[안내]', '[점검]', '[공지사항]'];
-                    var shouldSkip = skipKeywords.some(function(keyword) {
-                        return title.includes(keyword);
-                    });
+                // 유효성 검사
+                if (!href || !title || title.length < 3) {
+                    continue;
+                }
 
-                    if (shouldSkip) {
-                        console.log('키워드 제외:', title.substring(0, 20));
-                        continue;
-                    }
+                // URL에서 게시글 ID 추출
+                var idMatch = href.match(/\/view\/(\d+)/);
+                if (!idMatch) {
+                    continue;
+                }
+                var id = idMatch[1];
 
-                    // URL 정규화
-                    var fullUrl = href.startsWith('http') ? href : 'https://page.onstove.com' + href;
+                // 공지사항 제외
+                if (officialIds.includes(id)) {
+                    console.log('공지사항 제외:', id, title.substring(0, 20));
+                    continue;
+                }
+
+                // 공지/이벤트 배지 확인
+                var isNotice = element.querySelector('i.element-badge__s.notice, .notice, [class*="notice"]');
+                var isEvent = element.querySelector('i.element-badge__s.event, .event, [class*="event"]');
+                var isOfficial = element.querySelector('span.s-profile-staff-official, [class*="official"]');
 
-                    userPosts.push({
-                        href: fullUrl,
-                        id: id,
-                        title: title.substring(0, 200).trim(),
-                        preview_content: preview_content.substring(0, 150).trim(),
-                        selector_used: successful_selector
-                    });
+                if (isNotice || isEvent || isOfficial) {
+                    console.log('공지/이벤트 제외:', title.substring(0, 20));
+                    continue;
+                }
 
-                    console.log('Phase 2 게시글 추가:', title.substring(0, 30));
+                // 제목에서 [공지], [이벤트] 등 키워드 제외  
+                var skipKeywords = ['[공지]', '[이벤트]', '[안내]', '[점검]', '[공지사항]'];
+                var shouldSkip = skipKeywords.some(function(keyword) {
+                    return title.includes(keyword);
+                });
 
-                } catch (e) {
-                    console.log('게시글 처리 오류:', e.message);
+                if (shouldSkip) {
+                    console.log('키워드 제외:', title.substring(0, 20));
                     continue;
                 }
+
+                // 커서 이하 게시글부터는 이미 처리됨 - 탐색 중단
+                if (cursor !== null && parseInt(id, 10) <= cursor) {
+                    console.log('커서 도달:', id);
+                    break;
+                }
+
+                // URL 정규화
+                var fullUrl = href.startsWith('http') ? href : 'https://page.onstove.com' + href;
+
+                userPosts.push({
+                    href: fullUrl,
+                    id: id,
+                    title: title.substring(0, 200).trim(),
+                    preview_content: preview_content.substring(0, 150).trim(),
+                    selector_used: successful_selector
+                });
+
+                console.log('Phase 2 게시글 추가:', title.substring(0, 30));
+
+            } catch (e) {
+                console.log('게시글 처리 오류:', e.message);
+                continue;
             }
+        }
+
+        console.log('Phase 2 최종 추출된 유저 게시글 수:', userPosts.length);
+        return userPosts;
+    """, cursor)
 
-            console.log('Phase 2 최종 추출된 유저 게시글 수:', userPosts.length);
-            return userPosts;
-        """)
+    print(f"[DEBUG] Phase 2 JavaScript로 {len(user_posts)}개 게시글 발견")
 
-        print(f"[DEBUG] Phase 2 JavaScript로 {len(user_posts)}개 게시글 발견")
+    return user_posts or []
 
-        # 🚀 Master 요구사항: 각 게시글별 즉시 처리
+# =============================================================================
+# 🚀 Master 요구사항: Stove 게시판 크롤링 + 즉시 처리 통합
+# =============================================================================
+
+def crawl_stove_board(board_url: str, source: str, force_crawl: bool = False, 
+                     schedule_type: str = "frequent", region: str = "korea",
+                     on_post_process: Optional[Callable[[Dict], None]] = None,
+                     cancel_token: Optional[CancelToken] = None) -> List[Dict]:
+    """
+    Stove 게시판 크롤링 + 즉시 처리 통합
+    Master 요구사항: 게시글별 즉시 처리 (크롤링→감성분석→알림→마킹)
+    """
+
+    posts = []
+
+    print(f"[INFO] {source} 크롤링 시작 - URL: {board_url}")
+    print(f"[DEBUG] 기존 링크 수: {len(crawled_link_index)}, Force Crawl: {force_crawl}")
+
+    driver = None
+    abort_hook = None
+
+    def borrow_driver() -> webdriver.Chrome:
+        """드라이버 대여 - 데드라인 초과 시 강제 종료되도록 취소 콜백 등록"""
+        nonlocal abort_hook
+        borrowed = chrome_driver_pool.acquire()
+        if cancel_token:
+            abort_hook = cancel_token.add_callback(lambda: chrome_driver_pool.abort(borrowed))
+        network_filter.apply(borrowed, source)
+        return borrowed
+
+    try:
+        wait_time = CrawlingSchedule.get_wait_time(schedule_type)
+
+        # 커서 이하 게시글은 이미 처리됨 (force_crawl 시 무시)
+        cursor = None if force_crawl else crawl_cursor_store.get(source)
+        if cursor:
+            print(f"[CURSOR] {source} 커서: {cursor} (이후 게시글만 수집)")
+
+        # 1차: HTTP 목록 수집 (Chrome 불필요), 검증 실패 시에만 Selenium 폴백
+        user_posts = fetch_stove_board_http(board_url, source, cursor=cursor)
+        if user_posts is None:
+            print(f"[FALLBACK] {source} HTTP 목록 검증 실패 - Selenium 경로 사용")
+            driver = borrow_driver()
+            user_posts = _extract_stove_list_selenium(driver, board_url, source, wait_time, cursor)
+
+        crawl_cursor_store.register(source, [post_info['id'] for post_info in user_posts])
+        if not user_posts:
+            print(f"[CURSOR] {source} 신규 게시글 없음")
+
+        # 1단계: 목록 기준 필터링 - 본문 확보 방법 결정
+        candidates = []
         for i, post_info in enumerate(user_posts, 1):
             try:
-                href = post_info['href']
+                href = fix_url_bug(post_info['href'])  # URL 버그 수정 적용
                 title = post_info['title']
                 post_id = post_info['id']
-                preview_content = post_info.get('preview_content', '')
-
-                # URL 버그 수정 적용
-                href = fix_url_bug(href)
 
                 print(f"[DEBUG] 게시글 {i}/{len(user_posts)}: {title[:40]}...")
                 print(f"[DEBUG] URL: {href}")
 
                 # 시간 기반 중복 확인 (24시간 내 처리된 경우만 SKIP)
-                if not force_crawl and is_recently_processed(href, link_data["links"]):
+                if not force_crawl and is_recently_processed(href):
                     print(f"[SKIP] 24시간 내 처리된 링크: {post_id}")
+                    crawl_cursor_store.complete(source, post_id)
                     continue
 
                 # 제목 길이 검증
                 if len(title) < 5:
                     print(f"[SKIP] 제목이 너무 짧음: {title}")
+                    crawl_cursor_store.complete(source, post_id)
                     continue
 
-                # Phase 2: 목록 페이지에서 추출한 본문이 있으면 사용, 없으면 개별 페이지 방문
+                candidates.append((href, title, post_id, post_info.get('preview_content', '')))
+
+            except Exception as e:
+                print(f"[ERROR] 게시글 처리 실패: {e}")
+                continue
+
+        # 2단계: 목록 미리보기가 짧은 게시글만 상세 페이지 일괄 수집
+        # HTTP 병렬 수집(브라우저 쿠키 재사용) → 검증 실패분만 멀티탭 브라우저 수집
+        detail_urls = [href for href, _, _, preview in candidates if not preview or len(preview) < 50]
+        details = {}
+        if detail_urls and not (cancel_token and cancel_token.cancelled):
+            print(f"[FALLBACK] 상세 페이지 {len(detail_urls)}개 본문 추출")
+            details = fetch_stove_details_http(detail_urls, source, export_driver_cookies(driver))
+
+            browser_urls = [url for url in detail_urls if url not in details]
+            if browser_urls and not (cancel_token and cancel_token.cancelled):
+                if driver is None:
+                    driver = borrow_driver()  # HTTP 경로였다면 이때만 드라이버 대여
+                details.update(fetch_stove_details_multitab(
+                    driver, browser_urls, source, schedule_type, cancel_token=cancel_token
+                ))
+
+        # 🚀 Master 요구사항: 3단계 - 각 게시글별 즉시 처리
+        for i, (href, title, post_id, preview_content) in enumerate(candidates, 1):
+            if cancel_token and cancel_token.cancelled:
+                print(f"[CANCEL] {source} 데드라인 초과 - {i - 1}/{len(candidates)}개 처리 후 중단")
+                break
+            try:
+                # Phase 2: 목록 페이지에서 추출한 본문이 있으면 사용, 없으면 상세 수집 결과
                 if preview_content and len(preview_content) >= 50:
                     content = preview_content
                     print(f"[PHASE2] 목록 페이지에서 본문 직접 추출 성공 (90% 시간 단축)")
+                elif href in details:
+                    content = details[href]
                 else:
-                    # 개별 페이지 방문 (백업)
-                    print(f"[FALLBACK] 개별 페이지 방문하여 본문 추출")
-                    content = get_stove_post_content(href, driver, source, schedule_type)
+                    print(f"[SKIP] 상세 수집 시간 예산 초과 - 다음 실행에서 재시도: {post_id}")
+                    continue
 
-                # 최소 본문 길이 검증
+                # 최소 본문 길이 검증 (내용 기준 제외는 처리 완료로 보고 커서 진행 - 매 실행 재수집 방지)
                 if len(content) < 20:
                     print(f"[SKIP] 본문이 너무 짧음: {content[:50]}")
+                    crawl_cursor_store.complete(source, post_id)
                     continue
 
                 # 게시글 데이터 구성
@@ -1030,7 +2350,7 @@ def crawl_stove_board(board_url: str, source: str, force_crawl: bool = False,
                 if on_post_process:
                     try:
                         on_post_process(post_data)
-                        print(f"[IMMEDIATE] 즉시 처리 완료: {title[:30]}...")
+                        print(f"[IMMEDIATE] 처리 파이프라인 투입: {title[:30]}...")
                     except Exception as e:
                         print(f"[ERROR] 즉시 처리 실패: {e}")
 
@@ -1047,12 +2367,13 @@ def crawl_stove_board(board_url: str, source: str, force_crawl: bool = False,
     except Exception as e:
         print(f"[ERROR] {source} 크롤링 실패: {e}")
     finally:
+        if cancel_token and abort_hook:
+            cancel_token.remove_callback(abort_hook)
         if driver:
-            try:
-                driver.quit()
-                print(f"[DEBUG] ChromeDriver 종료: {source}")
-            except Exception as e:
-                print(f"[WARNING] ChromeDriver 종료 실패: {e}")
+            if not (cancel_token and cancel_token.cancelled):
+                network_filter.collect(drain_performance_log(driver), source)
+            chrome_driver_pool.release(driver)
+            print(f"[DEBUG] ChromeDriver 풀 반납: {source}")
 
     return posts
 
@@ -1061,14 +2382,14 @@ def crawl_stove_board(board_url: str, source: str, force_crawl: bool = False,
 # =============================================================================
 
 def crawl_ruliweb_epic7(force_crawl: bool = False, schedule_type: str = "frequent", 
-                       on_post_process: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+                       on_post_process: Optional[Callable[[Dict], None]] = None,
+                       cancel_token: Optional[CancelToken] = None) -> List[Dict]:
     """
     ✨ 완전 신규 구현: 루리웹 에픽세븐 게시판 크롤링
     Master 요구사항: 6번째 소스 완전 구현
     """
     
     posts = []
-    link_data = load_crawled_links()
     
     print("[INFO] 루리웹 Epic7 크롤링 시작")
     
@@ -1096,9 +2417,6 @@ def crawl_ruliweb_epic7(force_crawl: bool = False, schedule_type: str = "frequen
         response = requests.get(url, headers=headers, timeout=wait_time)
         response.raise_for_status()
         
-        # 페이지 로딩 대기
-        time.sleep(wait_time)
-        
         soup = BeautifulSoup(response.text, 'html.parser')
         
         # 루리웹 게시글 선택자 (실제 HTML 구조 기반)
@@ -1106,7 +2424,13 @@ def crawl_ruliweb_epic7(force_crawl: bool = False, schedule_type: str = "frequen
         
         print(f"[DEBUG] 루리웹에서 {len(board_items)}개 항목 발견")
         
+        # 커서 이하 게시글은 이미 처리됨 (force_crawl 시 무시)
+        cursor = None if force_crawl else crawl_cursor_store.get('ruliweb_epic7')
+        
         for item in board_items:
+            if cancel_token and cancel_token.cancelled:
+                print("[CANCEL] 루리웹 데드라인 초과 - 처리 중단")
+                break
             try:
                 # 제목 및 링크 추출
                 title_element = item.select_one('td.subject a.deco')
@@ -1129,15 +2453,21 @@ def crawl_ruliweb_epic7(force_crawl: bool = False, schedule_type: str = "frequen
                 if notice_element:
                     continue
                 
+                # 게시글 ID 추출 (규칙 밖 URL도 프로세스 간 고정된 식별자)
+                post_id = canonical_post_key(href)[1]
+                
+                # 커서 도달 - 이후 게시글은 이미 처리됨
+                if cursor is not None and post_id.isdigit() and int(post_id) <= cursor:
+                    print(f"[CURSOR] 루리웹 커서 도달: {post_id}")
+                    break
+                crawl_cursor_store.register('ruliweb_epic7', [post_id])
+                
                 # 중복 체크
-                if not force_crawl and is_recently_processed(href, link_data["links"]):
+                if not force_crawl and is_recently_processed(href):
                     print(f"[SKIP] 24시간 내 처리된 링크: {href}")
+                    crawl_cursor_store.complete('ruliweb_epic7', post_id)
                     continue
                 
-                # 게시글 ID 추출
-                post_id_match = re.search(r'/hobby/(\d+)', href)
-                post_id = post_id_match.group(1) if post_id_match else str(hash(href))
-                
                 # 작성자 정보
                 author_element = item.select_one('td.writer .nick')
                 author = author_element.get_text(strip=True) if author_element else "익명"
@@ -1160,6 +2490,7 @@ def crawl_ruliweb_epic7(force_crawl: bool = False, schedule_type: str = "frequen
                 
                 if not any(keyword.lower() in title.lower() for keyword in epic7_keywords):
                     print(f"[SKIP] Epic7 관련 없는 게시글: {title[:30]}...")
+                    crawl_cursor_store.complete('ruliweb_epic7', post_id)
                     continue
                 
                 # 게시글 데이터 구성
@@ -1181,7 +2512,7 @@ def crawl_ruliweb_epic7(force_crawl: bool = False, schedule_type: str = "frequen
                 if on_post_process:
                     try:
                         on_post_process(post_data)
-                        print(f"[IMMEDIATE] 루리웹 즉시 처리 완료: {title[:30]}...")
+                        print(f"[IMMEDIATE] 루리웹 처리 파이프라인 투입: {title[:30]}...")
                     except Exception as e:
                         print(f"[ERROR] 루리웹 즉시 처리 실패: {e}")
                 
@@ -1205,11 +2536,11 @@ def crawl_ruliweb_epic7(force_crawl: bool = False, schedule_type: str = "frequen
 # =============================================================================
 
 def crawl_reddit_epic7(force_crawl: bool = False, schedule_type: str = "frequent",
-                      on_post_process: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+                      on_post_process: Optional[Callable[[Dict], None]] = None,
+                      cancel_token: Optional[CancelToken] = None) -> List[Dict]:
     """Reddit r/EpicSeven 서브레딧 크롤링"""
     
     posts = []
-    link_data = load_crawled_links()
     
     print("[INFO] Reddit Epic7 크롤링 시작")
     
@@ -1240,6 +2571,9 @@ def crawl_reddit_epic7(force_crawl: bool = False, schedule_type: str = "frequent
         
         # 최신 게시글 20개 가져오기
         for submission in subreddit.new(limit=20):
+            if cancel_token and cancel_token.cancelled:
+                print("[CANCEL] Reddit 데드라인 초과 - 처리 중단")
+                break
             try:
                 # 기본 검증
                 if not submission.title or len(submission.title) < 5:
@@ -1249,7 +2583,7 @@ def crawl_reddit_epic7(force_crawl: bool = False, schedule_type: str = "frequent
                 post_url = f"https://www.reddit.com{submission.permalink}"
                 
                 # 중복 체크
-                if not force_crawl and is_recently_processed(post_url, link_data["links"]):
+                if not force_crawl and is_recently_processed(post_url):
                     continue
                 
                 # 스팸 키워드 필터
@@ -1290,7 +2624,7 @@ def crawl_reddit_epic7(force_crawl: bool = False, schedule_type: str = "frequent
                 if on_post_process:
                     try:
                         on_post_process(post_data)
-                        print(f"[IMMEDIATE] Reddit 즉시 처리 완료: {submission.title[:30]}...")
+                        print(f"[IMMEDIATE] Reddit 처리 파이프라인 투입: {submission.title[:30]}...")
                     except Exception as e:
                         print(f"[ERROR] Reddit 즉시 처리 실패: {e}")
                 
@@ -1327,64 +2661,106 @@ def crawl_frequent_sites(force_crawl: bool = False, schedule_type: str = "freque
     
     print(f"[INFO] 빈번한 크롤링 시작 - 지역: {region}, Force: {force_crawl}")
     
-    # Master 요구사항: 6개 크롤링 소스 정의
+    # 크롤링 스레드는 게시글을 파이프라인에 넣기만 하고 다음 게시글로 진행
+    pipeline = immediate_processor.create_pipeline()
+    pipeline.start()
+    
+    # Master 요구사항: 6개 크롤링 소스 정의 (브라우저 폴백 소스 / HTTP 소스 구분)
+    # 게시글 투입은 작업 취소 토큰으로 감싸 데드라인 초과 후에는 파이프라인에 넣지 않음
+    process = immediate_processor.pipeline_submitter(pipeline)
     crawl_tasks = []
     
+    def stove_task(name: str, url: str, source: str, task_region: str) -> CrawlTask:
+        return CrawlTask(name, url, lambda token: crawl_stove_board(
+            url, source, force_crawl, schedule_type, task_region, token.guard(process), token
+        ), kind='browser')
+    
     if region in ["all", "korea"]:
         crawl_tasks.extend([
-            ('한국 버그 게시판', lambda: crawl_stove_board(
-                "https://page.onstove.com/epicseven/kr/list/1012?page=1&direction=LATEST",
-                "stove_korea_bug", force_crawl, schedule_type, "korea",
-                immediate_processor.process_post_immediately
-            )),
-            ('한국 자유게시판', lambda: crawl_stove_board(
-                "https://page.onstove.com/epicseven/kr/list/1005?page=1&direction=LATEST",
-                "stove_korea_general", force_crawl, schedule_type, "korea",
-                immediate_processor.process_post_immediately
-            )),
-            ('루리웹 Epic7', lambda: crawl_ruliweb_epic7(
-                force_crawl, schedule_type,
-                immediate_processor.process_post_immediately
-            ))
+            stove_task('한국 버그 게시판',
+                       "https://page.onstove.com/epicseven/kr/list/1012?page=1&direction=LATEST",
+                       "stove_korea_bug", "korea"),
+            stove_task('한국 자유게시판',
+                       "https://page.onstove.com/epicseven/kr/list/1005?page=1&direction=LATEST",
+                       "stove_korea_general", "korea"),
+            CrawlTask('루리웹 Epic7', "https://bbs.ruliweb.com/game/84834",
+                      lambda token: crawl_ruliweb_epic7(force_crawl, schedule_type, token.guard(process), token))
         ])
     
     if region in ["all", "global"]:
         crawl_tasks.extend([
-            ('글로벌 버그 게시판', lambda: crawl_stove_board(
-                "https://page.onstove.com/epicseven/global/list/998?page=1&direction=LATEST",
-                "stove_global_bug", force_crawl, schedule_type, "global",
-                immediate_processor.process_post_immediately
-            )),
-            ('글로벌 자유게시판', lambda: crawl_stove_board(
-                "https://page.onstove.com/epicseven/global/list/989?page=1&direction=LATEST",
-                "stove_global_general", force_crawl, schedule_type, "global",
-                immediate_processor.process_post_immediately
-            )),
-            ('Reddit Epic7', lambda: crawl_reddit_epic7(
-                force_crawl, schedule_type,
-                immediate_processor.process_post_immediately
-            ))
+            stove_task('글로벌 버그 게시판',
+                       "https://page.onstove.com/epicseven/global/list/998?page=1&direction=LATEST",
+                       "stove_global_bug", "global"),
+            stove_task('글로벌 자유게시판',
+                       "https://page.onstove.com/epicseven/global/list/989?page=1&direction=LATEST",
+                       "stove_global_general", "global"),
+            CrawlTask('Reddit Epic7', "https://www.reddit.com/r/EpicSeven/new",
+                      lambda token: crawl_reddit_epic7(force_crawl, schedule_type, token.guard(process), token))
         ])
     
-    # 병렬 크롤링 실행
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-        future_to_site = {executor.submit(task[1]): task[0] for task in crawl_tasks}
-        
-        for future in concurrent.futures.as_completed(future_to_site):
-            site_name = future_to_site[future]
-            try:
-                site_posts = future.result(timeout=300)  # 5분 타임아웃
-                all_posts.extend(site_posts)
-                print(f"[SUCCESS] {site_name}: {len(site_posts)}개 게시글")
-            except Exception as e:
-                print(f"[ERROR] {site_name} 크롤링 실패: {e}")
+    # 비동기 동시 크롤링 실행 - 완료 순서대로 결과 수집
+    def on_result(result: CrawlResult):
+        all_posts.extend(result.posts)
+        if result.ok:
+            print(f"[SUCCESS] {result.name}: {len(result.posts)}개 게시글 "
+                  f"({result.elapsed:.1f}초, 대기 {result.queued:.1f}초)")
+        elif result.status == 'timeout':
+            print(f"[TIMEOUT] {result.name} 데드라인 초과 취소 - 부분 결과 {len(result.posts)}개")
+        else:
+            print(f"[ERROR] {result.name} 크롤링 실패: {result.error}")
+    
+    run_start = time.time()
+    try:
+        crawl_orchestrator.run(crawl_tasks, on_result)
+        print(f"[INFO] 전체 소스 크롤링 소요: {time.time() - run_start:.1f}초")
+    finally:
+        # 반환 전 분류/알림/저장 단계 모두 처리 완료 대기
+        pipeline.drain()
     
     # 재시도 큐 처리
     immediate_processor.process_retry_queue()
     
+    # 링크 인덱스 / 콘텐츠 캐시 저널 압축 (임계값 초과 시 백그라운드 스냅샷 재작성)
+    crawled_link_index.flush()
+    content_cache.flush()
+    
+    # 처리 완료 구간까지 소스별 커서 전진
+    advanced_cursors = crawl_cursor_store.commit()
+    for source, cursor in advanced_cursors.items():
+        print(f"[CURSOR] {source} 커서 갱신: {cursor}")
+    
+    # 실행 종료 - 웜 드라이버 정리
+    pool_stats = chrome_driver_pool.get_stats()
+    chrome_driver_pool.close_all()
+    
     # 통계 출력
     stats = immediate_processor.get_stats()
     print(f"[STATS] 전체: {len(all_posts)}개, 즉시처리: {stats['processed']}개, 실패: {stats['failed']}개")
+    print(f"[STATS] 드라이버 풀: 생성 {pool_stats['created']}회, 재사용 {pool_stats['reused']}회, "
+          f"교체 {pool_stats['replaced']}회, 강제 종료 {pool_stats['aborted']}회")
+    cache_stats = content_cache.get_stats()
+    print(f"[STATS] 콘텐츠 캐시: 적중 {cache_stats['hits']}회, 미스 {cache_stats['misses']}회 "
+          f"(적중률 {cache_stats['hit_rate']:.0%}), 만료 {cache_stats['expired']}개, 제거 {cache_stats['evicted']}개")
+    classification_stats = classification_cache.get_stats()
+    print(f"[STATS] 분류 캐시: 적중 {classification_stats['hits']}회, 미스 {classification_stats['misses']}회 "
+          f"(적중률 {classification_stats['hit_rate']:.0%}), 제거 {classification_stats['evictions']}개, "
+          f"스필 적중 {classification_stats['spill_hits']}회")
+    seen_stats = crawled_link_index.get_seen_filter_stats()
+    if seen_stats:
+        print(f"[STATS] 장기 중복 필터: {seen_stats['items']}개 ID, 세대 {seen_stats['generations']}개, "
+              f"{seen_stats['bytes'] / 1024:.0f}KB (최장 {seen_stats['oldest_days']}일)")
+    filter_stats = network_filter.get_stats()
+    if filter_stats['applied']:
+        print(f"[STATS] 네트워크 필터: 요청 {filter_stats['requests']}개 중 {filter_stats['blocked']}개 차단, "
+              f"절감 추정 {filter_stats['bytes_saved'] / 1024 / 1024:.1f}MB {filter_stats['blocked_by_type']}")
+    for stage_name, stage_stats in pipeline.get_stats().items():
+        print(f"[STATS] 파이프라인 {stage_name}: 처리 {stage_stats['processed']}개, 실패 {stage_stats['failed']}개, "
+              f"큐 최대 {stage_stats['max_depth']}/{stage_stats['capacity']}, 평균 {stage_stats['avg_depth']}, "
+              f"대기 발생 {stage_stats['blocked_puts']}회")
+    for source, load_stats in page_ready_waiter.get_stats().items():
+        print(f"[STATS] 로딩 지연 {source}: 평균 {load_stats['avg_time']}초, "
+              f"최대 {load_stats['max_time']}초, 상한 도달 {load_stats['timeouts']}회")
     
     return all_posts
 
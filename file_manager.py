@@ -23,6 +23,7 @@ from pathlib import Path
 import logging
 
 from config import config
+from state_journal import StateJournal
 
 logger = logging.getLogger(__name__)
 
@@ -36,27 +37,29 @@ class FileManager:
         logger.info("파일 매니저 초기화 완료")
     
     @contextmanager
-    def file_lock(self, file_path: str, timeout: float = 30.0):
+    def file_lock(self, file_path: str, timeout: float = 30.0, shared: bool = False):
         """
         파일 잠금 컨텍스트 매니저
         
         Args:
             file_path: 잠금할 파일 경로
             timeout: 잠금 대기 시간 (초)
+            shared: True면 공유(읽기) 잠금, False면 배타(쓰기) 잠금
         """
         lock_file = self.lock_dir / f"{Path(file_path).name}.lock"
+        lock_mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
         
         acquired = False
         start_time = time.time()
         
-        try:
-            # 잠금 파일 생성 및 잠금 시도
-            with open(lock_file, 'w') as f:
+        # 잠금 파일은 삭제하지 않음 - 대기 중인 다른 프로세스가 삭제된 inode를 잠그면 상호 배제가 깨짐
+        with open(lock_file, 'a') as f:
+            try:
                 while time.time() - start_time < timeout:
                     try:
-                        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        fcntl.flock(f.fileno(), lock_mode | fcntl.LOCK_NB)
                         acquired = True
-                        logger.debug(f"파일 잠금 획득: {file_path}")
+                        logger.debug(f"파일 잠금 획득 ({'공유' if shared else '배타'}): {file_path}")
                         break
                     except IOError:
                         time.sleep(0.1)
@@ -66,13 +69,10 @@ class FileManager:
                 
                 yield
                 
-        finally:
-            if acquired:
-                try:
-                    lock_file.unlink()
+            finally:
+                if acquired:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
                     logger.debug(f"파일 잠금 해제: {file_path}")
-                except FileNotFoundError:
-                    pass
     
     def safe_load_json(self, file_path: str, default: Any = None) -> Any:
         """
@@ -82,7 +82,7 @@ class FileManager:
             file_path: JSON 파일 경로
             default: 파일이 없을 때 반환할 기본값
         """
-        with self.file_lock(file_path):
+        with self.file_lock(file_path, shared=True):
             try:
                 if os.path.exists(file_path):
                     with open(file_path, 'r', encoding='utf-8') as f:
@@ -112,34 +112,55 @@ class FileManager:
                     backup_path = f"{file_path}.backup"
                     shutil.copy2(file_path, backup_path)
                 
-                # 임시 파일에 먼저 저장
-                temp_file = tempfile.NamedTemporaryFile(
-                    mode='w',
-                    encoding='utf-8',
-                    suffix='.tmp',
-                    dir=os.path.dirname(file_path) or '.',
-                    delete=False
-                )
-                
-                with temp_file:
-                    json.dump(data, temp_file, ensure_ascii=False, indent=2)
-                
-                # 원자적 이동
-                shutil.move(temp_file.name, file_path)
+                self.write_json_atomic(file_path, data)
                 
                 logger.debug(f"JSON 파일 저장 성공: {file_path}")
                 return True
                 
             except Exception as e:
                 logger.error(f"JSON 파일 저장 실패: {file_path}, 에러: {e}")
-                # 임시 파일 정리
-                try:
-                    if 'temp_file' in locals():
-                        os.unlink(temp_file.name)
-                except:
-                    pass
                 return False
     
+    def write_json_atomic(self, file_path: str, data: Any):
+        """
+        임시 파일에 쓴 뒤 원자적으로 교체 (잠금은 호출 측에서 보유)
+        
+        Args:
+            file_path: JSON 파일 경로
+            data: 저장할 데이터
+        """
+        temp_file = tempfile.NamedTemporaryFile(
+            mode='w',
+            encoding='utf-8',
+            suffix='.tmp',
+            dir=os.path.dirname(file_path) or '.',
+            delete=False
+        )
+        
+        try:
+            with temp_file:
+                json.dump(data, temp_file, ensure_ascii=False, indent=2, default=str)
+            
+            # 원자적 이동
+            os.replace(temp_file.name, file_path)
+        except Exception:
+            # 임시 파일 정리
+            try:
+                os.unlink(temp_file.name)
+            except OSError:
+                pass
+            raise
+    
+    def open_journal(self, file_path: str, **kwargs) -> StateJournal:
+        """
+        상태 파일용 추가 전용 저널 생성 (스냅샷 교체 시 파일 잠금 사용)
+        
+        Args:
+            file_path: 스냅샷 JSON 파일 경로 (저널은 같은 이름의 .jsonl)
+            **kwargs: StateJournal 옵션 (encode, decode, apply, max_bytes, max_age, indent)
+        """
+        return StateJournal(file_path, lock_factory=self.file_lock, **kwargs)
+    
     def cleanup_old_files(self, max_age_days: int = 30):
         """
         오래된 파일들 정리
@@ -152,6 +173,7 @@ class FileManager:
         cleanup_patterns = [
             "*.backup",
             "*.tmp",
+            "*.jsonl.compacting",
             "debug/*.html",
             "debug/*.log"
         ]
@@ -21,10 +21,13 @@ import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict
+from functools import lru_cache
 
 # 공통 모듈 임포트
 from config import config
 from utils import is_korean_text, get_category_emoji, setup_logging
+from classifier import TextProfile
+from classifier_rules import get_rule_pack, REPORT_PREFIX
 
 # 로깅 설정
 import logging
@@ -35,13 +38,12 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 class Epic7Classifier:
-    """Epic7 실시간 분류기"""
+    """Epic7 실시간 분류기 (리포트 API) - 실시간 분류기와 같은 규칙 팩/오토마톤 엔진 사용"""
     
     def __init__(self):
-        """분류기 초기화"""
-        self.load_keywords()
-        self.load_source_config()
-        self.load_priority_patterns()
+        """분류기 초기화 - 키워드/패턴/소스 설정은 규칙 팩(classifier_rules.json의 report)에서 로드"""
+        self.rule_pack = None
+        self.refresh_rules()
         
         # 설정에서 임계값 가져오기
         self.sentiment_thresholds = config.Classification.SENTIMENT_THRESHOLDS
@@ -50,291 +52,73 @@ class Epic7Classifier:
         
         logger.info("Epic7 실시간 분류기 v3.1 초기화 완료")
     
-    def load_keywords(self):
-        """다국어 키워드 로드"""
-        
-        # ======= 버그 키워드 시스템 =======
-        
-        # 치명적 버그 키워드 (Critical)
-        self.critical_bug_keywords = {
-            'korean': [
-                '서버다운', '서버장애', '서버오류', '접속불가', '접속장애',
-                '로그인불가', '로그인안됨', '게임시작안됨', '게임안됨',
-                '데이터손실', '데이터날아감', '세이브파일', '진행사항삭제',
-                '결제오류', '결제안됨', '결제실패', '환불요청',
-                '크래시', '강제종료', '게임꺼짐', '앱종료', '튕김',
-                '완전먹통', '아예안됨', '전혀안됨', '완전망함'
-            ],
-            'english': [
-                'server down', 'server crash', 'server error', 'cannot connect', 'connection failed',
-                'login failed', 'cannot login', 'game wont start', 'game broken',
-                'data loss', 'save file', 'progress lost', 'data corrupted',
-                'payment error', 'payment failed', 'purchase failed', 'refund request',
-                'crash', 'force close', 'game crash', 'app crash', 'freeze',
-                'completely broken', 'totally broken', 'not working at all'
-            ]
-        }
-        
-        # 높은 우선순위 버그 키워드 (High)
-        self.high_bug_keywords = {
-            'korean': [
-                '버그', '오류', '에러', '문제', '장애', '이상',
-                '작동안함', '실행안됨', '멈춤', '정지', '끊김',
-                '로딩안됨', '화면멈춤', '반응없음', '느림', '렉',
-                '스킬버그', '캐릭터버그', '아이템버그', '매치버그',
-                'pvp버그', 'pve버그', '길드버그', '상점버그',
-                '업데이트오류', '패치오류', '설치오류'
-            ],
-            'english': [
-                'bug', 'error', 'issue', 'problem', 'glitch', 'broken',
-                'not working', 'not responding', 'stuck', 'frozen', 'lag',
-                'loading issue', 'screen freeze', 'no response', 'slow', 'laggy',
-                'skill bug', 'character bug', 'item bug', 'match bug',
-                'pvp bug', 'pve bug', 'guild bug', 'shop bug',
-                'update error', 'patch error', 'installation error'
-            ]
-        }
-        
-        # 중간 우선순위 버그 키워드 (Medium)
-        self.medium_bug_keywords = {
-            'korean': [
-                '이상함', '이상해', '비정상', '불안정',
-                '가끔안됨', '때때로', '종종', '자주',
-                'ui버그', '인터페이스', '화면깨짐', '글자깨짐',
-                '사운드오류', '음성오류', '그래픽오류', '표시오류',
-                '번역오류', '텍스트오류', '맞춤법', '오타'
-            ],
-            'english': [
-                'weird', 'strange', 'abnormal', 'unstable',
-                'sometimes', 'occasionally', 'often', 'frequently',
-                'ui bug', 'interface', 'screen broken', 'text broken',
-                'sound error', 'audio error', 'graphic error', 'display error',
-                'translation error', 'text error', 'typo', 'spelling'
-            ]
-        }
-        
-        # 낮은 우선순위 버그 키워드 (Low)
-        self.low_bug_keywords = {
-            'korean': [
-                '불편', '아쉬움', '개선필요', '건의',
-                '조금이상', '살짝', '약간', '미세하게',
-                '색상', '폰트', '정렬', '배치',
-                '툴팁', '설명', '가이드', '도움말'
-            ],
-            'english': [
-                'inconvenient', 'suggestion', 'improvement needed', 'request',
-                'slightly', 'a bit', 'minor', 'small',
-                'color', 'font', 'alignment', 'layout',
-                'tooltip', 'description', 'guide', 'help'
-            ]
-        }
-        
-        # 버그 제외 키워드 (긍정적 맥락)
-        self.bug_exclusion_keywords = {
-            'korean': [
-                '수정', '해결', '고침', '패치', '업데이트', '개선',
-                '버그수정', '오류수정', '문제해결', '해결됨',
-                '수정됨', '개선됨', '업데이트됨', '패치됨'
-            ],
-            'english': [
-                'fixed', 'solved', 'resolved', 'patched', 'updated', 'improved',
-                'bug fix', 'error fix', 'issue resolved', 'problem solved',
-                'has been fixed', 'has been resolved', 'has been updated'
-            ]
-        }
-        
-        # ======= 감성 키워드 시스템 =======
-        
-        # 긍정 감성 키워드
-        self.positive_keywords = {
-            'korean': [
-                '좋아', '좋다', '최고', '굿', '굿굿', '감사', '고마워',
-                '수고', '잘했', '잘만들', '완벽', '훌륭', '멋지', '쩐다',
-                '대박', '개좋', '개쩐', '사랑', '❤️', '♥️', '👍',
-                '👏', '🔥', '💯', '개선', '향상', '업그레이드',
-                '패치굿', '업데이트굿', '밸런스굿', '재밌', '재미있',
-                '만족', '행복', '즐거움', '기쁨', '추천', '강추'
-            ],
-            'english': [
-                'good', 'great', 'awesome', 'amazing', 'excellent',
-                'perfect', 'love', 'like', 'enjoy', 'fun', 'cool',
-                'nice', 'wonderful', 'fantastic', 'brilliant', 'outstanding',
-                'improvement', 'better', 'upgrade', 'enhanced', 'upgraded',
-                'thanks', 'thank you', 'appreciate', 'well done', 'good job',
-                'satisfied', 'happy', 'enjoyable', 'recommend', 'recommended',
-                '❤️', '♥️', '👍', '👏', '🔥', '💯'
-            ]
-        }
-        
-        # 부정 감성 키워드
-        self.negative_keywords = {
-            'korean': [
-                '싫어', '싫다', '별로', '안좋', '나쁘', '최악', '망했',
-                '실망', '짜증', '화남', '열받', '빡침', '개빡', '개짜증',
-                '쓰레기', '헛소리', '개소리', '뭐지', '이상해', '이상함',
-                '너무어려워', '너무힘들어', '포기', '그만', '탈주', '삭제',
-                '밸런스개판', '밸런스망', '운영진', '멍청', '바보',
-                '돈벌이', '과금유도', '현질', '지갑털기', '사기'
-            ],
-            'english': [
-                'bad', 'terrible', 'awful', 'horrible', 'hate',
-                'dislike', 'annoying', 'frustrating', 'disappointed', 'disgusting',
-                'angry', 'mad', 'stupid', 'dumb', 'trash', 'garbage',
-                'worst', 'sucks', 'boring', 'too hard', 'too difficult',
-                'give up', 'quit', 'uninstall', 'delete', 'remove',
-                'balance sucks', 'devs suck', 'developers suck', 'greedy',
-                'pay to win', 'p2w', 'cash grab', 'scam', 'wtf', 'wth'
-            ]
-        }
-        
-        # 중립 감성 키워드
-        self.neutral_keywords = {
-            'korean': [
-                '그냥', '보통', '평범', '무난', '괜찮', '나쁘지않',
-                '어떨까', '궁금', '질문', '문의', '확인', '체크',
-                '정보', '공지', '알림', '안내', '가이드', '설명'
-            ],
-            'english': [
-                'okay', 'normal', 'average', 'decent', 'not bad',
-                'question', 'ask', 'wondering', 'curious', 'info',
-                'information', 'notice', 'guide', 'explanation', 'how to'
-            ]
-        }
+    def refresh_rules(self):
+        """규칙 팩이 다시 로드되었으면 리포트 규칙 교체"""
+        pack = get_rule_pack()
+        if pack is self.rule_pack:
+            return
+        
+        report = pack.report
+        self.critical_bug_keywords = report.keywords['critical_bug']
+        self.high_bug_keywords = report.keywords['high_bug']
+        self.medium_bug_keywords = report.keywords['medium_bug']
+        self.low_bug_keywords = report.keywords['low_bug']
+        self.bug_exclusion_keywords = report.keywords['bug_exclusion']
+        self.positive_keywords = report.keywords['positive']
+        self.negative_keywords = report.keywords['negative']
+        self.neutral_keywords = report.keywords['neutral']
+        self.source_config = report.source_config
+        self.priority_patterns = defaultdict(list)
+        for priority, pattern, _ in report.priority_patterns:
+            self.priority_patterns[priority].append(pattern)
+        self.priority_patterns = dict(self.priority_patterns)
+        
+        self.report_rules = report
+        self.keyword_automata = pack.automata
+        self.rule_pack = pack
     
-    def load_source_config(self):
-        """소스별 설정 로드"""
-        self.source_config = {
-            # 15분 간격 - 버그 게시판 (실시간 알림)
-            'stove_bug': {
-                'type': 'korean',
-                'schedule': 'frequent',
-                'weight': 1.0,
-                'bug_priority_boost': 0.3,
-                'realtime_alert': True,
-                'alert_threshold': 0.5
-            },
-            'stove_global_bug': {
-                'type': 'global',
-                'schedule': 'frequent',
-                'weight': 1.0,
-                'bug_priority_boost': 0.3,
-                'realtime_alert': True,
-                'alert_threshold': 0.5
-            },
-            
-            # 30분 간격 - 일반 게시판
-            'stove_general': {
-                'type': 'korean',
-                'schedule': 'regular',
-                'weight': 0.8,
-                'bug_priority_boost': 0.0,
-                'realtime_alert': False,
-                'alert_threshold': 0.7
-            },
-            'stove_global_general': {
-                'type': 'global',
-                'schedule': 'regular',
-                'weight': 0.8,
-                'bug_priority_boost': 0.0,
-                'realtime_alert': False,
-                'alert_threshold': 0.7
-            },
-            'ruliweb_epic7': {
-                'type': 'korean',
-                'schedule': 'regular',
-                'weight': 0.7,
-                'bug_priority_boost': 0.0,
-                'realtime_alert': False,
-                'alert_threshold': 0.8
-            },
-            'reddit_epic7': {
-                'type': 'global',
-                'schedule': 'regular',
-                'weight': 0.7,
-                'bug_priority_boost': 0.0,
-                'realtime_alert': False,
-                'alert_threshold': 0.8
-            }
-        }
-    
-    def load_priority_patterns(self):
-        """우선순위 패턴 로드"""
-        self.priority_patterns = {
-            'critical': [
-                r'서버.*다운', r'접속.*불가', r'로그인.*안됨', r'게임.*안됨',
-                r'데이터.*손실', r'결제.*오류', r'강제.*종료', r'완전.*먹통',
-                r'server.*down', r'cannot.*connect', r'login.*failed', r'game.*broken',
-                r'data.*loss', r'payment.*error', r'force.*close', r'completely.*broken'
-            ],
-            'high': [
-                r'버그|오류|에러|문제', r'작동.*안함', r'실행.*안됨', r'멈춤|정지',
-                r'bug|error|issue|problem', r'not.*working', r'not.*responding', r'stuck|frozen'
-            ],
-            'medium': [
-                r'이상함|이상해|비정상', r'가끔.*안됨', r'ui.*버그', r'화면.*깨짐',
-                r'weird|strange|abnormal', r'sometimes', r'ui.*bug', r'screen.*broken'
-            ],
-            'low': [
-                r'불편|아쉬움|개선.*필요', r'조금.*이상', r'색상|폰트|정렬',
-                r'inconvenient|suggestion', r'slightly|minor', r'color|font|alignment'
-            ]
-        }
+    def build_profile(self, title: str, content: str = "") -> TextProfile:
+        """게시글 텍스트 프로필 생성 (정규화/언어 판별/키워드 스캔 1회, 규칙 변경 확인)"""
+        self.refresh_rules()
+        return TextProfile(title, content, self.keyword_automata)
     
-    def get_bug_priority(self, title: str, content: str = "", source: str = "") -> Tuple[str, float, str]:
+    def get_bug_priority(self, title: str, content: str = "", source: str = "",
+                         profile: Optional[TextProfile] = None) -> Tuple[str, float, str]:
         """버그 우선순위 판별"""
         if not title:
             return "low", 0.0, "제목 없음"
         
-        # 텍스트 정규화
-        text = (title + " " + content).lower().strip()
+        # 텍스트 정규화 + 키워드 매칭 (프로필 공유)
+        profile = profile or self.build_profile(title, content)
+        cache_key = ('report_bug_priority', source)
+        if cache_key in profile.results:
+            return profile.results[cache_key]
+        
+        profile.results[cache_key] = result = self._get_bug_priority(profile, source)
+        return result
+    
+    def _get_bug_priority(self, profile: TextProfile, source: str) -> Tuple[str, float, str]:
+        matches = profile.matches
+        rules = self.report_rules
         
         # 버그 제외 키워드 확인
-        language = 'korean' if is_korean_text(text) else 'english'
-        
-        for exclusion in self.bug_exclusion_keywords[language]:
-            if exclusion in text:
-                return "low", 0.0, f"버그 제외 키워드: {exclusion}"
-        
-        # 우선순위별 키워드 매칭
-        priority_scores = {
-            'critical': 0.0,
-            'high': 0.0,
-            'medium': 0.0,
-            'low': 0.0
-        }
+        exclusions = matches.hits(REPORT_PREFIX + 'bug_exclusion')
+        if exclusions:
+            return "low", 0.0, f"버그 제외 키워드: {exclusions[0]}"
         
+        # 우선순위별 키워드 매칭 (치명적 0.5, 높음 0.3, 중간 0.2, 낮음 0.1)
+        priority_scores = {}
         matched_keywords = []
-        
-        # 치명적 버그 키워드 확인
-        for keyword in self.critical_bug_keywords[language]:
-            if keyword in text:
-                priority_scores['critical'] += 0.5
-                matched_keywords.append(f"치명적:{keyword}")
-        
-        # 높은 우선순위 버그 키워드 확인
-        for keyword in self.high_bug_keywords[language]:
-            if keyword in text:
-                priority_scores['high'] += 0.3
-                matched_keywords.append(f"높음:{keyword}")
-        
-        # 중간 우선순위 버그 키워드 확인
-        for keyword in self.medium_bug_keywords[language]:
-            if keyword in text:
-                priority_scores['medium'] += 0.2
-                matched_keywords.append(f"중간:{keyword}")
-        
-        # 낮은 우선순위 버그 키워드 확인
-        for keyword in self.low_bug_keywords[language]:
-            if keyword in text:
-                priority_scores['low'] += 0.1
-                matched_keywords.append(f"낮음:{keyword}")
+        for priority, label in (('critical', '치명적'), ('high', '높음'), ('medium', '중간'), ('low', '낮음')):
+            category = f"{REPORT_PREFIX}{priority}_bug"
+            priority_scores[priority] = matches.score(category)
+            matched_keywords.extend(f"{label}:{keyword}" for keyword in matches.hits(category))
         
         # 패턴 매칭 추가 점수
-        for priority, patterns in self.priority_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text):
-                    priority_scores[priority] += 0.2
-                    matched_keywords.append(f"패턴:{pattern}")
+        for priority, pattern, regex in rules.priority_patterns:
+            if regex.search(profile.text):
+                priority_scores[priority] += rules.pattern_weight
+                matched_keywords.append(f"패턴:{pattern}")
         
         # 소스별 가중치 적용
         if source in self.source_config:
@@ -345,13 +129,14 @@ class Epic7Classifier:
         # 최고 점수 우선순위 결정
         max_priority = max(priority_scores.items(), key=lambda x: x[1])
         
-        if max_priority[1] >= 0.3:
+        if max_priority[1] >= rules.bug_threshold:
             reason = f"매칭 키워드: {', '.join(matched_keywords[:5])}"
             return max_priority[0], min(max_priority[1], 1.0), reason
         else:
             return "low", 0.0, "버그 키워드 없음"
     
-    def is_bug_post(self, title: str, content: str = "", source: str = "") -> Tuple[bool, float, str]:
+    def is_bug_post(self, title: str, content: str = "", source: str = "",
+                    profile: Optional[TextProfile] = None) -> Tuple[bool, float, str]:
         """버그 게시글 판별"""
         if not title:
             return False, 0.0, "제목 없음"
@@ -361,26 +146,29 @@ class Epic7Classifier:
             return True, 1.0, f"버그 전용 게시판 ({source})"
         
         # 우선순위 기반 버그 판별
-        priority, confidence, reason = self.get_bug_priority(title, content, source)
+        priority, confidence, reason = self.get_bug_priority(title, content, source, profile)
         
         # 우선순위가 낮음이 아니면 버그로 판별
-        is_bug = priority != "low" or confidence >= 0.3
+        is_bug = priority != "low" or confidence >= self.report_rules.bug_threshold
         
         return is_bug, confidence, reason
     
-    def is_high_priority_bug(self, title: str, content: str = "", source: str = "") -> bool:
+    def is_high_priority_bug(self, title: str, content: str = "", source: str = "",
+                             profile: Optional[TextProfile] = None) -> bool:
         """고우선순위 버그 판별"""
         if not title:
             return False
         
+        profile = profile or self.build_profile(title, content)
+        
         # 먼저 버그 게시글인지 확인
-        is_bug, confidence, _ = self.is_bug_post(title, content, source)
+        is_bug, confidence, _ = self.is_bug_post(title, content, source, profile)
         
         if not is_bug:
             return False
         
         # 우선순위 확인
-        priority, priority_confidence, _ = self.get_bug_priority(title, content, source)
+        priority, priority_confidence, _ = self.get_bug_priority(title, content, source, profile)
         
         # 치명적 또는 높은 우선순위이면 고우선순위
         if priority in ['critical', 'high']:
@@ -392,43 +180,22 @@ class Epic7Classifier:
         
         return False
     
-    def analyze_sentiment(self, title: str, content: str = "", source: str = "") -> Tuple[str, float, str]:
+    def analyze_sentiment(self, title: str, content: str = "", source: str = "",
+                          profile: Optional[TextProfile] = None) -> Tuple[str, float, str]:
         """감성 분석"""
         if not title:
             return "neutral", 0.0, "제목 없음"
         
-        # 텍스트 정규화
-        text = (title + " " + content).lower().strip()
+        # 텍스트 정규화 + 키워드 매칭 (프로필 공유, 긍정/부정 0.3, 중립 0.2)
+        matches = (profile or self.build_profile(title, content)).matches
         
-        # 언어 판별
-        language = 'korean' if is_korean_text(text) else 'english'
-        
-        # 감성 점수 계산
-        positive_score = 0.0
-        negative_score = 0.0
-        neutral_score = 0.0
-        
-        positive_matches = []
-        negative_matches = []
-        neutral_matches = []
-        
-        # 긍정 키워드 매칭
-        for keyword in self.positive_keywords[language]:
-            if keyword in text:
-                positive_matches.append(keyword)
-                positive_score += 0.3
-        
-        # 부정 키워드 매칭
-        for keyword in self.negative_keywords[language]:
-            if keyword in text:
-                negative_matches.append(keyword)
-                negative_score += 0.3
-        
-        # 중립 키워드 매칭
-        for keyword in self.neutral_keywords[language]:
-            if keyword in text:
-                neutral_matches.append(keyword)
-                neutral_score += 0.2
+        positive_matches = matches.hits(REPORT_PREFIX + 'positive')
+        negative_matches = matches.hits(REPORT_PREFIX + 'negative')
+        neutral_matches = matches.hits(REPORT_PREFIX + 'neutral')
+        
+        positive_score = matches.score(REPORT_PREFIX + 'positive')
+        negative_score = matches.score(REPORT_PREFIX + 'negative')
+        neutral_score = matches.score(REPORT_PREFIX + 'neutral')
         
         # 소스별 가중치 적용
         if source in self.source_config:
@@ -497,12 +264,15 @@ class Epic7Classifier:
         content = post_data.get('content', '')
         source = post_data.get('source', '')
         
+        # 텍스트 프로필 (버그/감성 단계 공유)
+        profile = self.build_profile(title, content)
+        
         # 버그 분석
-        is_bug, bug_confidence, bug_reason = self.is_bug_post(title, content, source)
-        bug_priority, priority_confidence, priority_reason = self.get_bug_priority(title, content, source)
+        is_bug, bug_confidence, bug_reason = self.is_bug_post(title, content, source, profile)
+        bug_priority, priority_confidence, priority_reason = self.get_bug_priority(title, content, source, profile)
         
         # 감성 분석
-        sentiment, sentiment_confidence, sentiment_reason = self.analyze_sentiment(title, content, source)
+        sentiment, sentiment_confidence, sentiment_reason = self.analyze_sentiment(title, content, source, profile)
         
         # 소스 정보
         source_config = self.source_config.get(source, {})
@@ -510,7 +280,7 @@ class Epic7Classifier:
         schedule_type = source_config.get('schedule', 'regular')
         
         # 언어 판별
-        language = 'korean' if is_korean_text(title + " " + content) else 'english'
+        language = profile.language
         
         # 최종 카테고리 결정
         if is_bug:
@@ -656,50 +426,48 @@ class Epic7Classifier:
 # 편의 함수들 (하위 호환성)
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def get_classifier() -> Epic7Classifier:
+    """프로세스 공용 분류기 (규칙 변경은 규칙 팩 핫 리로드로 반영)"""
+    return Epic7Classifier()
+
 def is_bug_post(title: str, content: str = "", source: str = "") -> bool:
     """버그 게시글 판별 (하위 호환성)"""
-    classifier = Epic7Classifier()
-    is_bug, _, _ = classifier.is_bug_post(title, content, source)
+    is_bug, _, _ = get_classifier().is_bug_post(title, content, source)
     return is_bug
 
 def is_high_priority_bug(title: str, content: str = "", source: str = "") -> bool:
     """고우선순위 버그 판별 (하위 호환성)"""
-    classifier = Epic7Classifier()
-    return classifier.is_high_priority_bug(title, content, source)
+    return get_classifier().is_high_priority_bug(title, content, source)
 
 def extract_bug_severity(title: str, content: str = "", source: str = "") -> str:
     """버그 심각도 추출"""
-    classifier = Epic7Classifier()
-    priority, _, _ = classifier.get_bug_priority(title, content, source)
+    priority, _, _ = get_classifier().get_bug_priority(title, content, source)
     return priority
 
 def is_positive_post(title: str, content: str = "", source: str = "") -> bool:
     """긍정 게시글 판별 (하위 호환성)"""
-    classifier = Epic7Classifier()
-    sentiment, _, _ = classifier.analyze_sentiment(title, content, source)
+    sentiment, _, _ = get_classifier().analyze_sentiment(title, content, source)
     return sentiment == 'positive'
 
 def is_negative_post(title: str, content: str = "", source: str = "") -> bool:
     """부정 게시글 판별 (하위 호환성)"""
-    classifier = Epic7Classifier()
-    sentiment, _, _ = classifier.analyze_sentiment(title, content, source)
+    sentiment, _, _ = get_classifier().analyze_sentiment(title, content, source)
     return sentiment == 'negative'
 
 def classify_post(title: str, content: str = "", source: str = "") -> str:
     """게시글 분류 (하위 호환성)"""
-    classifier = Epic7Classifier()
     post_data = {
         'title': title,
         'content': content,
         'source': source
     }
-    result = classifier.classify_post(post_data)
+    result = get_classifier().classify_post(post_data)
     return result.get('category', 'neutral')
 
 def should_send_realtime_alert(post_data: Dict) -> bool:
     """실시간 알림 전송 여부 판별 (새로운 함수)"""
-    classifier = Epic7Classifier()
-    classification = classifier.classify_post(post_data)
+    classification = get_classifier().classify_post(post_data)
     return classification.get('realtime_alert', {}).get('should_alert', False)
 
 # =============================================================================
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 키워드 매칭 엔진 - Aho-Corasick 다중 패턴 오토마톤
+여러 카테고리(긍정/부정/중립/버그/고우선순위)의 키워드 목록을 하나의 오토마톤으로 컴파일해
+텍스트를 한 번만 훑어 카테고리별 매칭 키워드와 점수를 계산합니다.
+
+점수 호환성:
+- 키워드 목록 순서대로 가중치를 누적하므로 `for keyword in keywords: if keyword in text`
+  방식과 부동소수점까지 같은 점수가 나옵니다.
+- 목록에 중복된 키워드는 기존 방식처럼 중복 횟수만큼 매칭/가산됩니다.
+
+pyahocorasick(C 구현)이 설치되어 있으면 사용하고, 없으면 순수 Python 오토마톤을 사용합니다.
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+from collections import deque
+from typing import Dict, List, Tuple, Callable, Optional
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 카테고리별 키워드 가중치 함수 (키워드 → 가중치)
+WeightFunction = Callable[[str], float]
+
+# =============================================================================
+# 매칭 결과
+# =============================================================================
+
+class KeywordMatches:
+    """텍스트 한 건의 카테고리별 매칭 결과"""
+
+    __slots__ = ('_hits', '_scores')
+
+    def __init__(self, hits: Dict[str, List[str]], scores: Dict[str, float]):
+        self._hits = hits
+        self._scores = scores
+
+    def hits(self, category: str) -> List[str]:
+        """매칭된 키워드 (키워드 목록 순서, 중복 포함)"""
+        return self._hits.get(category, [])
+
+    def score(self, category: str) -> float:
+        """매칭 키워드 가중치 합계"""
+        return self._scores.get(category, 0.0)
+
+# =============================================================================
+# Aho-Corasick 오토마톤
+# =============================================================================
+
+class KeywordAutomaton:
+    """
+    카테고리별 키워드 목록을 컴파일한 Aho-Corasick 오토마톤
+
+    categories: {카테고리: [키워드, ...]} (키워드는 소문자로 매칭됨을 전제)
+    weights: {카테고리: 가중치 함수} (없으면 키워드당 0.0)
+    """
+
+    def __init__(self, categories: Dict[str, List[str]],
+                 weights: Optional[Dict[str, WeightFunction]] = None,
+                 use_native: bool = AHOCORASICK_AVAILABLE):
+        self.categories = {category: list(keywords) for category, keywords in categories.items()}
+        weights = weights or {}
+
+        # 패턴별 (카테고리, 목록 내 위치) - 같은 키워드가 여러 카테고리/위치에 있을 수 있음
+        self._patterns: List[str] = []
+        self._occurrences: List[List[Tuple[str, int]]] = []
+        # 카테고리별 목록 위치의 가중치 (점수 누적 순서 보존용)
+        self._weights: Dict[str, List[float]] = {}
+        # 빈 키워드 ('' in text 는 항상 참)
+        self._always: List[int] = []
+
+        pattern_ids: Dict[str, int] = {}
+        for category, keywords in self.categories.items():
+            weight_fn = weights.get(category)
+            self._weights[category] = [weight_fn(keyword) if weight_fn else 0.0 for keyword in keywords]
+            for index, keyword in enumerate(keywords):
+                pattern_id = pattern_ids.get(keyword)
+                if pattern_id is None:
+                    pattern_id = pattern_ids[keyword] = len(self._patterns)
+                    self._patterns.append(keyword)
+                    self._occurrences.append([])
+                    if not keyword:
+                        self._always.append(pattern_id)
+                self._occurrences[pattern_id].append((category, index))
+
+        self._native = self._build_native() if use_native and AHOCORASICK_AVAILABLE else None
+        if self._native is None:
+            self._build()
+
+    def _build_native(self):
+        """pyahocorasick 오토마톤 (값은 패턴 ID, 패턴이 없으면 None)"""
+        automaton = ahocorasick.Automaton()
+        for pattern_id, pattern in enumerate(self._patterns):
+            if pattern:
+                automaton.add_word(pattern, pattern_id)
+        if not len(automaton):
+            return None
+        automaton.make_automaton()
+        return automaton
+
+    def _build(self):
+        """트라이 + 실패 링크 + 출력 병합"""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self._patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(pattern_id)
+
+        # BFS로 실패 링크 계산 (루트 자식은 루트), 실패 상태의 출력을 병합해 스캔 시 링크 추적 제거
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                link = fail[state]
+                while link and ch not in goto[link]:
+                    link = fail[link]
+                fail[next_state] = goto[link].get(ch, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(output) for output in outputs]
+
+    @property
+    def pattern_count(self) -> int:
+        return len(self._patterns)
+
+    def find(self, text: str) -> set:
+        """텍스트에 포함된 패턴 ID 집합 (한 번의 순회)"""
+        found = set(self._always)
+        if self._native is not None:
+            found.update(pattern_id for _, pattern_id in self._native.iter(text))
+            return found
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+    def match(self, text: str) -> KeywordMatches:
+        """카테고리별 매칭 키워드/점수 - 키워드 목록 순서로 누적해 기존 점수와 동일"""
+        positions: Dict[str, List[int]] = {category: [] for category in self.categories}
+        for pattern_id in self.find(text):
+            for category, index in self._occurrences[pattern_id]:
+                positions[category].append(index)
+
+        hits = {}
+        scores = {}
+        for category, indexes in positions.items():
+            indexes.sort()
+            keywords = self.categories[category]
+            weights = self._weights[category]
+            score = 0.0
+            for index in indexes:
+                score += weights[index]
+            hits[category] = [keywords[index] for index in indexes]
+            scores[category] = score
+        return KeywordMatches(hits, scores)
+
+# =============================================================================
+# 참조 구현 (키워드별 부분 문자열 검사)
+# =============================================================================
+
+class KeywordScanner:
+    """
+    KeywordAutomaton과 같은 인터페이스의 참조 구현 - 카테고리별로 `keyword in text`를 반복
+    오토마톤 결과 일치성 검증과 벤치마크 기준선으로 사용합니다.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]],
+                 weights: Optional[Dict[str, WeightFunction]] = None):
+        self.categories = {category: list(keywords) for category, keywords in categories.items()}
+        weights = weights or {}
+        self._weights = {
+            category: [weights[category](keyword) if category in weights else 0.0 for keyword in keywords]
+            for category, keywords in self.categories.items()
+        }
+
+    def match(self, text: str) -> KeywordMatches:
+        hits = {}
+        scores = {}
+        for category, keywords in self.categories.items():
+            weights = self._weights[category]
+            matched = []
+            score = 0.0
+            for index, keyword in enumerate(keywords):
+                if keyword in text:
+                    matched.append(keyword)
+                    score += weights[index]
+            hits[category] = matched
+            scores[category] = score
+        return KeywordMatches(hits, scores)
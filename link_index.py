@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 크롤링 링크 인덱스 - 스레드 안전 O(1) 중복 체크
+crawled_links.json을 실행당 한 번 로드하여 dict로 조회하고,
+변경은 추가 전용 저널(crawled_links.jsonl)에 한 줄씩 기록합니다.
+
+스냅샷은 기존 파일 형식({"links": [{"url", "processed_at", "notified"}]})과 호환됩니다.
+SQLite 백엔드(EPIC7_STORAGE_BACKEND=sqlite)에서는 crawled_links 테이블을 직접 조회합니다.
+
+정확 인덱스보다 긴 기간(30일)의 중복 체크는 블룸 필터(crawled_links.bloom)가 담당합니다.
+필터에 있으면 처리된 게시글로 판정하고, 없으면 정확 인덱스로 다시 확인합니다
+(필터 비트는 flush/close 때만 저장되고 저널 기록은 이벤트마다 저장되므로).
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+import os
+import time
+import atexit
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config import config
+from bloom_filter import GenerationalBloomFilter
+from file_manager import file_manager
+from sqlite_store import SQLiteStateStore, get_state_store
+from utils import post_identity
+
+# 인덱스 보존 기간 및 최대 항목 수
+LINK_RETENTION_HOURS = 24
+MAX_LINK_ENTRIES = 5000
+
+def get_crawled_links_file():
+    """워크플로우별 독립적인 크롤링 링크 파일명 생성"""
+    workflow_name = os.environ.get('GITHUB_WORKFLOW', 'default')
+
+    if 'debug' in workflow_name.lower() or 'test' in workflow_name.lower():
+        return "crawled_links_debug.json"
+    elif 'monitor' in workflow_name.lower():
+        return "crawled_links_monitor.json"
+    else:
+        return "crawled_links.json"
+
+def get_seen_filter_file():
+    """크롤링 링크 파일과 짝을 이루는 장기 중복 체크 블룸 필터 파일명"""
+    return os.path.splitext(get_crawled_links_file())[0] + ".bloom"
+
+def canonical_link_key(url: str) -> str:
+    """중복 체크 키 - 게시글 식별자 ("source:post_id", URL 변형 무관)"""
+    return post_identity(url)
+
+class CrawledLinkIndex:
+    """크롤링 링크 중복 체크 인덱스 (키 → epoch 처리 시각)"""
+
+    def __init__(self, file_path: Optional[str] = None,
+                 retention_hours: float = LINK_RETENTION_HOURS, max_entries: int = MAX_LINK_ENTRIES,
+                 store: Optional[SQLiteStateStore] = None,
+                 seen_filter: Optional[GenerationalBloomFilter] = None):
+        self._file_path = file_path
+        self._store = store
+        self._seen_filter = seen_filter
+        self._seen_filter_ready = False
+        self.retention_seconds = retention_hours * 3600
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = None
+        self._journal = None
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path or get_crawled_links_file()
+
+    def is_recent(self, url: str, hours: float = LINK_RETENTION_HOURS) -> bool:
+        """hours 시간 내 처리된 링크인지 확인"""
+        key = canonical_link_key(url)
+        if self._store is not None:
+            return self._store.link_processed_since(key, time.time() - hours * 3600)
+        with self._lock:
+            entry = self._load().get(key)
+            return bool(entry) and time.time() - entry['ts'] < hours * 3600
+
+    def is_seen(self, url: str, hours: float = LINK_RETENTION_HOURS) -> bool:
+        """
+        장기 중복 체크 - 정확 인덱스보다 블룸 필터를 먼저 조회
+        필터에 있으면 보존 기간(30일) 내 처리로 판정 (오탐률만큼 틀릴 수 있음), 없으면 정확 인덱스로 확인
+        """
+        seen_filter = self._get_seen_filter()
+        if seen_filter is None:
+            return self.is_recent(url, hours)
+
+        if canonical_link_key(url) in seen_filter:
+            return True
+        # 필터 미스는 정확 인덱스로 확인
+        # - 공유 DB: 다른 실행(한국/글로벌)이 기록한 링크가 이 필터에 없을 수 있음
+        # - JSON: 필터 비트는 flush()/close() 때만 저장되고 저널 기록은 이벤트마다 저장되므로,
+        #   flush 전에 종료된 실행의 처리 기록은 필터에 없고 인덱스에만 있음
+        return self.is_recent(url, hours)
+
+    def mark(self, url: str, notified: bool = False):
+        """처리 완료 기록 (저널에 이벤트 한 줄 추가)"""
+        key = canonical_link_key(url)
+        entry = {'url': url, 'ts': time.time(), 'notified': notified}
+        seen_filter = self._get_seen_filter()
+        if seen_filter is not None:
+            seen_filter.add(key)
+        if self._store is not None:
+            self._store.mark_link(key, url, entry['ts'], notified)
+            return
+        with self._lock:
+            self._load()[key] = entry
+            self._journal.record_set(key, entry)
+
+    def __len__(self) -> int:
+        if self._store is not None:
+            return self._store.count_links()
+        with self._lock:
+            return len(self._load())
+
+    def snapshot(self) -> Dict:
+        """기존 파일 형식 dict 반환"""
+        if self._store is not None:
+            return self._to_file_format(self._store.get_links(time.time() - self.retention_seconds))
+        with self._lock:
+            return self._to_file_format(self._load())
+
+    def replace(self, link_data: Dict):
+        """기존 파일 형식 dict로 인덱스 전체 교체 (스냅샷 즉시 재작성)"""
+        if self._store is not None:
+            self._store.replace_links(self._from_file_format(link_data))
+            return
+        with self._lock:
+            self._load()
+            self._entries = self._from_file_format(link_data)
+            self._journal.compact(self._entries)
+
+    def flush(self, force: bool = False) -> bool:
+        """만료 항목 정리 후 저널이 임계값을 넘었으면 스냅샷으로 압축 (force 시 항상)"""
+        if self._seen_filter is not None:
+            self._seen_filter.flush()
+        if self._store is not None:
+            self._store.prune_links(time.time() - self.retention_seconds, self.max_entries)
+            return True
+        with self._lock:
+            if self._entries is None:
+                return False
+
+            self._prune()
+            try:
+                if force:
+                    compacted = self._journal.compact(self._entries)
+                else:
+                    compacted = self._journal.maybe_compact(self._entries)
+                if compacted:
+                    print(f"[INFO] 크롤링 링크 스냅샷 압축: {len(self._entries)}개")
+                return compacted
+            except Exception as e:
+                print(f"[ERROR] 링크 저장 실패: {e}")
+                return False
+
+    def close(self):
+        """블룸 필터 저장 및 진행 중인 백그라운드 압축 완료 대기"""
+        if self._seen_filter is not None:
+            self._seen_filter.flush()
+        if self._journal is not None:
+            self._journal.close()
+
+    def get_seen_filter_stats(self) -> Dict:
+        """블룸 필터 세대/항목/크기 통계 (필터 미사용 시 빈 dict)"""
+        seen_filter = self._get_seen_filter()
+        return seen_filter.get_stats() if seen_filter is not None else {}
+
+    def _get_seen_filter(self) -> Optional[GenerationalBloomFilter]:
+        """블룸 필터 - 파일이 없으면 최초 한 번 정확 인덱스의 기록으로 채움"""
+        if self._seen_filter is None or self._seen_filter_ready:
+            return self._seen_filter
+        with self._lock:
+            if not self._seen_filter_ready:
+                if not self._seen_filter.exists:
+                    if self._store is not None:
+                        keys = list(self._store.get_links(0).keys())
+                    else:
+                        keys = list(self._load().keys())
+                    self._seen_filter.add_many(keys)
+                    print(f"[INFO] 장기 중복 체크 필터 생성: 기존 링크 {len(keys)}개 반영")
+                self._seen_filter_ready = True
+        return self._seen_filter
+
+    def _load(self) -> Dict[str, Dict]:
+        """최초 접근 시 한 번만 스냅샷 + 저널 재생 (ISO 시각 → epoch 변환은 이때 한 번)"""
+        if self._entries is None:
+            self._journal = file_manager.open_journal(
+                self.file_path, encode=self._to_file_format, decode=self._from_file_format
+            )
+            try:
+                # 저널에 이전 키 형식으로 기록된 항목도 현재 식별자로 다시 매핑
+                entries = self._journal.load()
+                self._entries = {canonical_link_key(entry['url']): entry for entry in entries.values()}
+            except Exception as e:
+                print(f"[WARNING] 크롤링 링크 파일 읽기 실패: {e}")
+                self._entries = {}
+            self._prune()
+            print(f"[INFO] {LINK_RETENTION_HOURS}시간 기준 유효한 링크: {len(self._entries)}개")
+        return self._entries
+
+    def _prune(self):
+        """보존 기간 경과 항목 제거 및 최대 항목 수 유지"""
+        cutoff = time.time() - self.retention_seconds
+        expired = [key for key, entry in self._entries.items() if entry['ts'] < cutoff]
+        for key in expired:
+            del self._entries[key]
+
+        if len(self._entries) > self.max_entries:
+            newest = sorted(self._entries.items(), key=lambda item: item[1]['ts'], reverse=True)
+            self._entries = dict(newest[:self.max_entries])
+
+    @staticmethod
+    def _from_file_format(link_data) -> Dict[str, Dict]:
+        entries = {}
+        if link_data is None:
+            return entries
+        links = link_data.get('links', []) if isinstance(link_data, dict) else link_data
+        for item in links or []:
+            try:
+                if isinstance(item, str):
+                    # 구버전 단순 URL 목록 - 보존 기간 밖으로 취급
+                    continue
+                url = item['url']
+                ts = datetime.fromisoformat(item['processed_at']).timestamp()
+                entries[canonical_link_key(url)] = {
+                    'url': url, 'ts': ts, 'notified': item.get('notified', False)
+                }
+            except (KeyError, ValueError, TypeError):
+                continue
+        return entries
+
+    @staticmethod
+    def _to_file_format(entries: Dict[str, Dict]) -> Dict:
+        links = sorted(entries.values(), key=lambda entry: entry['ts'], reverse=True)
+        return {
+            'links': [
+                {
+                    'url': entry['url'],
+                    'processed_at': datetime.fromtimestamp(entry['ts']).isoformat(),
+                    'notified': entry['notified']
+                }
+                for entry in links
+            ],
+            'last_updated': datetime.now().isoformat()
+        }
+
+# 전역 링크 인덱스 인스턴스
+crawled_link_index = CrawledLinkIndex(
+    store=get_state_store(),
+    seen_filter=GenerationalBloomFilter(
+        get_seen_filter_file(),
+        retention_days=config.Crawling.SEEN_FILTER_RETENTION_DAYS,
+        generation_days=config.Crawling.SEEN_FILTER_GENERATION_DAYS,
+        capacity=config.Crawling.SEEN_FILTER_CAPACITY,
+        error_rate=config.Crawling.SEEN_FILTER_ERROR_RATE,
+        max_generations=config.Crawling.SEEN_FILTER_MAX_GENERATIONS
+    )
+)
+atexit.register(crawled_link_index.close)
@@ -63,8 +63,13 @@ except ImportError as e:
         return []
     def get_all_posts_for_report(*args, **kwargs):
         return []
-    def mark_as_processed(*args, **kwargs):
-        pass
+    def mark_as_processed(url: str, notified: bool = False):
+        """crawler 없이도 링크 인덱스에 처리 완료 기록"""
+        try:
+            from link_index import crawled_link_index
+            crawled_link_index.mark(url, notified)
+        except ImportError:
+            pass
 
 try:
     from classifier import (
@@ -92,6 +97,7 @@ from notifier import (
     send_daily_report,
     send_health_check
 )
+from state_store import sentiment_state
 
 # 로깅 설정
 logging.basicConfig(
@@ -1083,34 +1089,8 @@ class Epic7Monitor:
             return False
     
     def _save_sentiment_direct(self, post_data: Dict, classification: Dict) -> bool:
-        """감성 데이터 직접 저장 (폴백) - 🔧 수정 4: json 파일 처리 안전화 적용"""
+        """감성 데이터 직접 저장 (폴백) - 공유 상태 저장소 경유 (다른 실행 기록과 병합, 24시간 정리)"""
         try:
-            sentiment_file = "daily_sentiment_data.json"
-            
-            # 🔧 수정 4: 안전한 json 파일 처리
-            try:
-                if os.path.exists(sentiment_file):
-                    with open(sentiment_file, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                        if not content:
-                            sentiment_data = []
-                        else:
-                            sentiment_data = json.loads(content)
-                            
-                    # 데이터 타입 검증
-                    if not isinstance(sentiment_data, list):
-                        logger.warning("sentiment_data.json이 배열이 아님 - 새로 생성")
-                        sentiment_data = []
-                else:
-                    sentiment_data = []
-            except (json.JSONDecodeError, ValueError) as e:
-                logger.warning(f"sentiment_data.json 파싱 실패 - 새로 생성: {e}")
-                sentiment_data = []
-            except Exception as e:
-                logger.error(f"sentiment_data.json 읽기 실패: {e}")
-                return False
-                
-            # 새로운 데이터 추가
             new_entry = {
                 'title': post_data.get('title', ''),
                 'content': post_data.get('content', '')[:200],
@@ -1123,27 +1103,11 @@ class Epic7Monitor:
                 'saved_at': datetime.now().isoformat()
             }
             
-            sentiment_data.append(new_entry)
-            
-            # 24시간 이전 데이터 정리
-            cutoff_time = datetime.now() - timedelta(hours=24)
-            sentiment_data = [
-                entry for entry in sentiment_data
-                if datetime.fromisoformat(entry.get('saved_at', entry.get('timestamp', datetime.now().isoformat()))) > cutoff_time
-            ]
-            
-            # 파일에 안전하게 저장
-            try:
-                with open(sentiment_file, 'w', encoding='utf-8') as f:
-                    json.dump(sentiment_data, f, ensure_ascii=False, indent=2)
-                    
+            if sentiment_state.append([new_entry]):
                 logger.debug(f"감성 데이터 직접 저장 성공: {new_entry['title'][:30]}...")
                 return True
-                
-            except Exception as e:
-                logger.error(f"sentiment_data.json 쓰기 실패: {e}")
-                return False
-                
+            return False
+            
         except Exception as e:
             logger.error(f"감성 데이터 직접 저장 실패: {e}")
             return False
@@ -1199,52 +1163,18 @@ class Epic7Monitor:
             return False
     
     def _get_30min_sentiment_summary(self) -> Dict:
-        """30분간 감성 요약 데이터 생성 - v4.5 완전 보존 + 🔧 수정 4: json 처리 안전화"""
+        """30분간 감성 요약 데이터 생성 - v4.5 완전 보존 (공유 상태 저장소 조회)"""
         try:
-            sentiment_file = "daily_sentiment_data.json"
-            
-            # 🔧 수정 4: 안전한 json 파일 처리
-            try:
-                if not os.path.exists(sentiment_file):
-                    return {'total_posts': 0}
-                    
-                with open(sentiment_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if not content:
-                        return {'total_posts': 0}
-                    sentiment_data = json.loads(content)
-                    
-                if not isinstance(sentiment_data, list):
-                    logger.warning("sentiment_data.json이 배열이 아님")
-                    return {'total_posts': 0}
-                    
-            except (json.JSONDecodeError, ValueError) as e:
-                logger.warning(f"sentiment_data.json 파싱 실패: {e}")
-                return {'total_posts': 0}
-            except Exception as e:
-                logger.error(f"sentiment_data.json 읽기 실패: {e}")
-                return {'total_posts': 0}
-            
             # 30분 이전 데이터 필터링
             cutoff_time = datetime.now() - timedelta(minutes=30)
-            recent_data = [
-                entry for entry in sentiment_data
-                if datetime.fromisoformat(entry.get('timestamp', datetime.now().isoformat())) > cutoff_time
-            ]
+            sentiment_counts = sentiment_state.count_by_sentiment(since=cutoff_time)
+            total_posts = sum(sentiment_counts.values())
             
-            if not recent_data:
+            if not total_posts:
                 return {'total_posts': 0}
             
-            # 감성별 통계 계산
-            sentiment_counts = {'positive': 0, 'negative': 0, 'neutral': 0}
-            
-            for entry in recent_data:
-                sentiment = entry.get('sentiment', 'neutral')
-                if sentiment in sentiment_counts:
-                    sentiment_counts[sentiment] += 1
-            
             return {
-                'total_posts': len(recent_data),
+                'total_posts': total_posts,
                 'sentiment_distribution': sentiment_counts,
                 'time_period': '최근 30분간',
                 'timestamp': datetime.now().isoformat()
@@ -1299,48 +1229,11 @@ class Epic7Monitor:
             return False
     
     def _get_24h_sentiment_summary(self) -> Dict:
-        """24시간 감성 요약 - v4.5 완전 보존 + 🔧 수정 4: json 처리 안전화"""
+        """24시간 감성 요약 - v4.5 완전 보존 (공유 상태 저장소 조회)"""
         try:
-            sentiment_file = "daily_sentiment_data.json"
-            
-            # 🔧 수정 4: 안전한 json 파일 처리
-            try:
-                if not os.path.exists(sentiment_file):
-                    return {'positive': 0, 'negative': 0, 'neutral': 0}
-                    
-                with open(sentiment_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if not content:
-                        return {'positive': 0, 'negative': 0, 'neutral': 0}
-                    sentiment_data = json.loads(content)
-                    
-                if not isinstance(sentiment_data, list):
-                    logger.warning("sentiment_data.json이 배열이 아님")
-                    return {'positive': 0, 'negative': 0, 'neutral': 0}
-                    
-            except (json.JSONDecodeError, ValueError) as e:
-                logger.warning(f"sentiment_data.json 파싱 실패: {e}")
-                return {'positive': 0, 'negative': 0, 'neutral': 0}
-            except Exception as e:
-                logger.error(f"sentiment_data.json 읽기 실패: {e}")
-                return {'positive': 0, 'negative': 0, 'neutral': 0}
-            
-            # 24시간 데이터만 필터링
+            # 24시간 데이터만 감성별 카운트
             cutoff_time = datetime.now() - timedelta(hours=24)
-            daily_data = [
-                entry for entry in sentiment_data
-                if datetime.fromisoformat(entry.get('timestamp', datetime.now().isoformat())) > cutoff_time
-            ]
-            
-            # 감성별 카운트
-            sentiment_counts = {'positive': 0, 'negative': 0, 'neutral': 0}
-            
-            for entry in daily_data:
-                sentiment = entry.get('sentiment', 'neutral')
-                if sentiment in sentiment_counts:
-                    sentiment_counts[sentiment] += 1
-            
-            return sentiment_counts
+            return sentiment_state.count_by_sentiment(since=cutoff_time)
             
         except Exception as e:
             logger.error(f"24시간 감성 요약 생성 실패: {e}")
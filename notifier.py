@@ -51,6 +51,16 @@ import logging
 import psutil
 import subprocess
 
+from state_journal import StateJournal
+from sqlite_store import get_state_store
+from state_store import sentiment_state, DAILY_SENTIMENT_DATA_FILE
+
+# 파일 잠금 관리자 (없으면 잠금 없이 저널 사용)
+try:
+    from file_manager import file_manager
+except ImportError:
+    file_manager = None
+
 # ✨ 번역 기능 추가 (안전화 처리) ✨
 try:
     from deep_translator import GoogleTranslator
@@ -240,15 +250,10 @@ safe_translation_system = SafeTranslationSystem()
 # 🚀 v3.4 추가: 일간 리포트용 감성 데이터 관리
 # =============================================================================
 
-DAILY_SENTIMENT_DATA_FILE = "daily_sentiment_data.json"
-
 def save_sentiment_data_for_daily_report(post_data: Dict, classification: Dict) -> bool:
-    """🚀 v3.4: 일간 리포트용 감성 데이터 저장"""
+    """🚀 v3.4: 일간 리포트용 감성 데이터 저장 (공유 상태 저장소 - 다른 실행 기록과 병합)"""
     try:
-        # 기존 데이터 로드
-        daily_data = load_daily_sentiment_data()
-        
-        # 새로운 감성 데이터 추가
+        # 새로운 감성 데이터
         sentiment_entry = {
             'timestamp': datetime.now().isoformat(),
             'title': post_data.get('title', ''),
@@ -260,18 +265,9 @@ def save_sentiment_data_for_daily_report(post_data: Dict, classification: Dict)
             'saved_at': datetime.now().isoformat()
         }
         
-        daily_data.append(sentiment_entry)
-        
-        # 24시간 이전 데이터 정리
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        daily_data = [
-            entry for entry in daily_data
-            if datetime.fromisoformat(entry['saved_at']) > cutoff_time
-        ]
-        
-        # 파일에 저장
-        with open(DAILY_SENTIMENT_DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(daily_data, f, ensure_ascii=False, indent=2)
+        # 추가 + 24시간 이전 데이터 정리는 저장소에서 배타 잠금 안에 수행
+        if not sentiment_state.append([sentiment_entry]):
+            return False
         
         logger.info(f"💾 일간 리포트용 감성 데이터 저장 완료: {sentiment_entry['title'][:30]}...")
         return True
@@ -281,23 +277,9 @@ def save_sentiment_data_for_daily_report(post_data: Dict, classification: Dict)
         return False
 
 def load_daily_sentiment_data() -> List[Dict]:
-    """일간 리포트용 감성 데이터 로드"""
+    """일간 리포트용 감성 데이터 로드 (최근 24시간)"""
     try:
-        if os.path.exists(DAILY_SENTIMENT_DATA_FILE):
-            with open(DAILY_SENTIMENT_DATA_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            # 24시간 이전 데이터 필터링
-            cutoff_time = datetime.now() - timedelta(hours=24)
-            filtered_data = [
-                entry for entry in data
-                if datetime.fromisoformat(entry['saved_at']) > cutoff_time
-            ]
-            
-            return filtered_data
-        else:
-            return []
-            
+        return sentiment_state.load(since=datetime.now() - timedelta(hours=24))
     except Exception as e:
         logger.error(f"일간 리포트용 데이터 로드 실패: {e}")
         return []
@@ -311,25 +293,56 @@ class NotificationStats:
     
     STATS_FILE = "notification_stats.json"
     
+    # 추가 전용 저널 (notification_stats.jsonl) 및 마지막으로 기록된 상태
+    _journal = None
+    _last_state = None
+    
+    @staticmethod
+    def _get_journal() -> StateJournal:
+        """통계 저널 (최초 호출 시 생성)"""
+        if NotificationStats._journal is None:
+            decode = lambda data: data if isinstance(data, dict) else NotificationStats._get_empty_stats()
+            if file_manager is not None:
+                NotificationStats._journal = file_manager.open_journal(NotificationStats.STATS_FILE, decode=decode)
+            else:
+                NotificationStats._journal = StateJournal(NotificationStats.STATS_FILE, decode=decode)
+        return NotificationStats._journal
+    
     @staticmethod
     def load_stats() -> Dict:
-        """통계 데이터 로드"""
+        """통계 데이터 로드 (스냅샷 + 저널 재생, SQLite 백엔드에서는 테이블 조회)"""
         try:
-            if os.path.exists(NotificationStats.STATS_FILE):
-                with open(NotificationStats.STATS_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            store = get_state_store()
+            if store is not None:
+                stats = store.get_notification_stats() or NotificationStats._get_empty_stats()
             else:
-                return NotificationStats._get_empty_stats()
+                stats = NotificationStats._get_journal().load()
+            NotificationStats._last_state = json.loads(json.dumps(stats))
+            return stats
         except Exception as e:
             logger.error(f"통계 로드 실패: {e}")
             return NotificationStats._get_empty_stats()
     
     @staticmethod
     def save_stats(stats: Dict):
-        """통계 데이터 저장"""
+        """통계 데이터 저장 - 변경된 최상위 키만 저널(또는 SQLite)에 기록"""
         try:
-            with open(NotificationStats.STATS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(stats, f, ensure_ascii=False, indent=2)
+            previous = NotificationStats._last_state
+            if previous is None:
+                previous = NotificationStats.load_stats()
+            changed = {key: value for key, value in stats.items() if previous.get(key) != value}
+            merged = {**previous, **stats}
+            NotificationStats._last_state = json.loads(json.dumps(merged))
+            
+            store = get_state_store()
+            if store is not None:
+                store.set_notification_stats(changed)
+                return
+            
+            journal = NotificationStats._get_journal()
+            for key, value in changed.items():
+                journal.record_set(key, value)
+            journal.maybe_compact(merged, background=False)
         except Exception as e:
             logger.error(f"통계 저장 실패: {e}")
     
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 감성 데이터 재분류 도구 - 저장된 과거 게시글을 현재 분류 규칙으로 다시 분류
+키워드/임계값(classifier_rules.json)을 바꾼 뒤 과거 감성 데이터의 감성/카테고리를 갱신합니다.
+
+- 입력: 감성 데이터 저장소 (SQLite 백엔드면 sentiment_posts 테이블, 아니면 daily_sentiment_data.json)
+- 분류: 게시글을 청크로 나눠 ProcessPoolExecutor 워커(코어 수만큼)의 Epic7Classifier로 분류
+- 기록: 완료 청크 결과를 주기적으로 저장소에 반영 (JSON은 공유 잠금 병합, SQLite는 행 단위 갱신)
+- 재개: 반영된 항목 키를 체크포인트(JSONL)에 추가 기록, 중단 후 다시 실행하면 남은 항목만 처리
+  (규칙 팩이 바뀌었으면 체크포인트를 버리고 처음부터)
+
+갱신 필드: sentiment, confidence, category, reclassified_at, rules_version
+저장된 내용이 잘려 있는 항목(예: content 200자)은 저장된 내용 기준으로 분류됩니다.
+
+사용 예:
+    python reclassify.py                          # 기본 저장소 전체 재분류
+    python reclassify.py --dry-run                # 기록 없이 변경 통계만 출력
+    python reclassify.py --db epic7_state.db --workers 8
+    python reclassify.py --restart                # 체크포인트 무시하고 처음부터
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import hashlib
+import logging
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from typing import Dict, List, Iterator, Iterable, Tuple, Set, Any
+
+from config import config
+from classifier import Epic7Classifier
+from classifier_rules import get_rule_pack
+from state_store import SentimentState, DAILY_SENTIMENT_DATA_FILE
+from sqlite_store import SQLiteStateStore, get_state_store
+
+# 재분류로 갱신하는 필드 중 변경 통계 대상
+TRACKED_FIELDS = ('sentiment', 'category')
+
+# =============================================================================
+# 감성 데이터 소스
+# =============================================================================
+
+class JsonSentimentSource:
+    """daily_sentiment_data.json - 항목 키는 (url, 제목, 기록 시각) 해시"""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.state = SentimentState(file_path)
+        self.name = f"json:{os.path.abspath(file_path)}"
+
+    @staticmethod
+    def entry_key(entry: Dict) -> str:
+        stamp = entry.get('saved_at') or entry.get('timestamp') or entry.get('processed_at') or ''
+        payload = json.dumps([entry.get('url', ''), entry.get('title', ''), str(stamp)], ensure_ascii=False)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def count(self) -> int:
+        return len(self.state.file.read())
+
+    def iter_items(self) -> Iterator[Tuple[str, Dict]]:
+        # JSON 배열이므로 한 번에 읽고 순회
+        for entry in self.state.file.read():
+            yield self.entry_key(entry), entry
+
+    def write(self, results: Dict[str, Dict]) -> int:
+        """배타 잠금 안에서 최신 파일에 병합 (그 사이 다른 실행이 추가한 항목 유지)"""
+        updated = 0
+
+        def merge(entries: List[Dict]) -> List[Dict]:
+            nonlocal updated
+            for entry in entries:
+                fields = results.get(self.entry_key(entry))
+                if fields is not None:
+                    entry.update(fields)
+                    updated += 1
+            return entries
+
+        self.state.file.update(merge)
+        return updated
+
+class SQLiteSentimentSource:
+    """sentiment_posts 테이블 - 항목 키는 행 ID"""
+
+    def __init__(self, store: SQLiteStateStore):
+        self.store = store
+        self.name = f"sqlite:{os.path.abspath(store.db_path)}"
+
+    def count(self) -> int:
+        return self.store.count_sentiment_posts()
+
+    def iter_items(self) -> Iterator[Tuple[int, Dict]]:
+        return self.store.iter_sentiment_rows()
+
+    def write(self, results: Dict[int, Dict]) -> int:
+        return self.store.update_sentiment_posts(results)
+
+# =============================================================================
+# 체크포인트
+# =============================================================================
+
+class ReclassifyCheckpoint:
+    """
+    재개용 체크포인트 (JSONL, 추가 전용)
+
+    첫 줄은 {'source', 'rules_version', 'started_at'} 헤더, 이후 줄은 저장소에 반영된 항목 키 목록입니다.
+    마지막 줄이 잘린 경우(기록 중 종료) 해당 줄은 반영되지 않은 것으로 봅니다.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    def load(self, source_name: str, rules_version: str) -> Set:
+        """같은 소스/규칙 팩으로 반영된 키 집합 (다르면 빈 집합)"""
+        if not os.path.exists(self.file_path):
+            return set()
+
+        done = set()
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except ValueError:
+            header = {}
+        if header.get('source') != source_name or header.get('rules_version') != rules_version:
+            print(f"[CHECKPOINT] 소스 또는 규칙 팩이 달라 체크포인트를 사용하지 않습니다: {self.file_path}")
+            return set()
+
+        for line in lines[1:]:
+            try:
+                done.update(json.loads(line)['keys'])
+            except (ValueError, KeyError):
+                continue
+        return done
+
+    def start(self, source_name: str, rules_version: str):
+        """새 체크포인트 (기존 파일 교체)"""
+        header = {'source': source_name, 'rules_version': rules_version, 'started_at': datetime.now().isoformat()}
+        with open(self.file_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record(self, keys: Iterable):
+        with open(self.file_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'keys': list(keys)}) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def remove(self):
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
+
+# =============================================================================
+# 워커 프로세스
+# =============================================================================
+
+_worker_classifier = None
+
+def _init_worker():
+    global _worker_classifier
+    # Ctrl+C는 부모 프로세스가 처리 (완료 결과 기록 후 종료)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # 게시글별 분류 로그 억제
+    logging.disable(logging.INFO)
+    # 과거 게시글은 대부분 한 번씩만 분류하므로 결과 캐시 미사용
+    _worker_classifier = Epic7Classifier(use_cache=False)
+
+def _classify_chunk(items: List[Tuple[Any, Dict]]) -> List[Tuple[Any, Dict, Tuple]]:
+    """청크 분류 - (키, 갱신 필드, 기존 (감성, 카테고리)) 목록 (제목 없는 항목은 갱신 필드 None)"""
+    reclassified_at = datetime.now().isoformat()
+    rules_version = _worker_classifier.rule_pack.content_hash[:12]
+    titled = [(key, entry) for key, entry in items if str(entry.get('title') or '').strip()]
+    results = [(key, None, tuple(entry.get(field) for field in TRACKED_FIELDS))
+               for key, entry in items if not str(entry.get('title') or '').strip()]
+
+    # 청크 단위 일괄 분류 (통계 엔진 사용 시 배치 추론)
+    classifications = _worker_classifier.classify_posts({
+        'title': entry.get('title', ''),
+        'content': entry.get('content') or '',
+        'source': entry.get('source', ''),
+        'url': entry.get('url', ''),
+        'timestamp': entry.get('timestamp') or entry.get('saved_at') or reclassified_at
+    } for _, entry in titled)
+    for (key, entry), classification in zip(titled, classifications):
+        previous = tuple(entry.get(field) for field in TRACKED_FIELDS)
+        sentiment = classification.get('sentiment_analysis', {})
+        fields = {
+            'sentiment': sentiment.get('sentiment', 'neutral'),
+            'confidence': sentiment.get('confidence', 0.0),
+            'category': classification.get('category', 'neutral'),
+            'reclassified_at': reclassified_at,
+            'rules_version': rules_version
+        }
+        results.append((key, fields, previous))
+    return results
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# =============================================================================
+# 재분류 실행
+# =============================================================================
+
+class Reclassifier:
+    """청크 분배 / 결과 반영 / 진행 상황 출력"""
+
+    def __init__(self, source, checkpoint: ReclassifyCheckpoint, workers: int = None,
+                 chunk_size: int = None, flush_interval: float = None, dry_run: bool = False):
+        self.source = source
+        self.checkpoint = checkpoint
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size or config.Classification.RECLASSIFY_CHUNK_SIZE
+        self.flush_interval = (config.Classification.RECLASSIFY_FLUSH_INTERVAL
+                               if flush_interval is None else flush_interval)
+        self.dry_run = dry_run
+
+        self.total = 0
+        self.processed = 0
+        self.written = 0
+        self.skipped = 0
+        self.changes = {field: Counter() for field in TRACKED_FIELDS}
+        self._pending: Dict[Any, Dict] = {}
+        self._pending_skipped: List[Any] = []
+        self._stop_requested = False
+        self._started = 0.0
+        self._last_flush = 0.0
+        self._last_progress = 0.0
+
+    def run(self, restart: bool = False) -> bool:
+        """재분류 실행 - 전체 완료 시 True (중단 시 반영된 결과까지 체크포인트에 남김)"""
+        rules_version = get_rule_pack().content_hash[:12]
+        done = set() if restart or self.dry_run else self.checkpoint.load(self.source.name, rules_version)
+        if not self.dry_run and not done:
+            self.checkpoint.start(self.source.name, rules_version)
+
+        self.total = self.source.count()
+        print(f"[INFO] 재분류 대상 {self.total}건 (완료 {len(done)}건 제외), "
+              f"워커 {self.workers}개, 청크 {self.chunk_size}건, 규칙 팩 {rules_version}")
+
+        items = ((key, entry) for key, entry in self.source.iter_items() if key not in done)
+        self.total -= len(done)
+        self._started = self._last_flush = time.time()
+
+        # Ctrl+C는 중단 플래그만 설정 (저장소 기록 도중 중단되지 않도록)
+        previous_handler = signal.signal(signal.SIGINT, self._request_stop)
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as pool:
+                in_flight = set()
+                for chunk in _chunked(items, self.chunk_size):
+                    if self._stop_requested:
+                        break
+                    in_flight.add(pool.submit(_classify_chunk, chunk))
+                    # 제출 청크 수 제한 (입력 전체를 메모리에 올리지 않음)
+                    if len(in_flight) >= self.workers * 2:
+                        finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        self._collect(finished)
+
+                if self._stop_requested:
+                    # 시작 전 청크만 취소, 실행 중인 청크 결과는 반영
+                    in_flight = {future for future in in_flight if not future.cancel()}
+                while in_flight:
+                    finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    self._collect(finished)
+            self._flush()
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+
+        self._print_progress(force=True)
+        if self._stop_requested:
+            print(f"[INFO] 중단됨 - 반영 {self.written}건, 다시 실행하면 남은 항목부터 재개합니다")
+            return False
+        if not self.dry_run:
+            self.checkpoint.remove()
+        return True
+
+    def _request_stop(self, signum, frame):
+        if not self._stop_requested:
+            print("\n[INFO] 중단 요청 - 실행 중인 청크 결과 기록 후 종료합니다")
+        self._stop_requested = True
+
+    def _collect(self, futures):
+        for future in futures:
+            for key, fields, previous in future.result():
+                self.processed += 1
+                if fields is None:
+                    self.skipped += 1
+                    self._pending_skipped.append(key)
+                    continue
+                for field, old in zip(TRACKED_FIELDS, previous):
+                    if old != fields[field]:
+                        self.changes[field][f"{old}→{fields[field]}"] += 1
+                self._pending[key] = fields
+
+        # 기록 주기: JSON 파일은 기록마다 전체 재작성이므로 청크 수가 아닌 시간 기준
+        if time.time() - self._last_flush >= self.flush_interval:
+            self._flush()
+        self._print_progress()
+
+    def _flush(self):
+        if not self._pending and not self._pending_skipped:
+            return
+        if not self.dry_run:
+            if self._pending:
+                self.written += self.source.write(self._pending)
+            self.checkpoint.record(list(self._pending) + self._pending_skipped)
+        self._pending = {}
+        self._pending_skipped = []
+        self._last_flush = time.time()
+
+    def _print_progress(self, force: bool = False):
+        now = time.time()
+        if not force and now - self._last_progress < 2.0:
+            return
+        self._last_progress = now
+        elapsed = max(now - self._started, 1e-6)
+        rate = self.processed / elapsed
+        remaining = (self.total - self.processed) / rate if rate else 0
+        percent = self.processed / self.total * 100 if self.total else 100.0
+        print(f"[PROGRESS] {self.processed}/{self.total} ({percent:.1f}%) "
+              f"{rate:.0f}건/초, 경과 {elapsed:.1f}초, 남은 시간 약 {remaining:.0f}초")
+
+    def print_summary(self):
+        print(f"[SUMMARY] 분류 {self.processed - self.skipped}건 (제목 없음 {self.skipped}건 제외), 저장소 반영 {self.written}건"
+              f"{' (dry-run: 기록 안 함)' if self.dry_run else ''}")
+        for field, counter in self.changes.items():
+            changed = sum(counter.values())
+            print(f"[SUMMARY] {field} 변경 {changed}건")
+            for transition, count in counter.most_common(10):
+                print(f"  {transition}: {count}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Epic7 감성 데이터 재분류 (현재 분류 규칙 적용)")
+    parser.add_argument('--input', default=DAILY_SENTIMENT_DATA_FILE, help="감성 데이터 JSON 파일 (JSON 백엔드)")
+    parser.add_argument('--db', help="SQLite 데이터베이스 경로 (지정 시 sentiment_posts 테이블 재분류)")
+    parser.add_argument('--workers', type=int, default=None, help="워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument('--chunk-size', type=int, default=None, help="청크당 게시글 수")
+    parser.add_argument('--checkpoint', default=config.Classification.RECLASSIFY_CHECKPOINT, help="체크포인트 파일")
+    parser.add_argument('--restart', action='store_true', help="체크포인트 무시하고 처음부터")
+    parser.add_argument('--dry-run', action='store_true', help="저장소에 기록하지 않고 변경 통계만 출력")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    if args.db:
+        source = SQLiteSentimentSource(SQLiteStateStore(args.db))
+    elif get_state_store() is not None:
+        source = SQLiteSentimentSource(get_state_store())
+    else:
+        if not os.path.exists(args.input):
+            print(f"[ERROR] 감성 데이터 파일이 없습니다: {args.input}")
+            return 1
+        source = JsonSentimentSource(args.input)
+
+    reclassifier = Reclassifier(source, ReclassifyCheckpoint(args.checkpoint), workers=args.workers,
+                                chunk_size=args.chunk_size, dry_run=args.dry_run)
+    completed = reclassifier.run(restart=args.restart)
+    reclassifier.print_summary()
+    return 0 if completed else 130
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -31,6 +31,8 @@ from functools import wraps
 import psutil
 import gc
 
+from state_store import sentiment_state, DAILY_SENTIMENT_DATA_FILE
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -211,26 +213,9 @@ class BufferedSaveManager:
             return False
     
     def _write_buffer_to_file(self, buffer_data: List[Dict]) -> bool:
-        """버퍼 데이터를 파일에 쓰기"""
+        """버퍼 데이터를 파일에 쓰기 (공유 상태 저장소 경유 - 다른 실행 기록과 병합)"""
         try:
-            # 기존 데이터 로드
-            sentiment_file = "daily_sentiment_data.json"
-            
-            if os.path.exists(sentiment_file):
-                with open(sentiment_file, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-            else:
-                existing_data = {'posts': [], 'last_updated': datetime.now().isoformat()}
-            
-            # 새 데이터 추가
-            existing_data['posts'].extend(buffer_data)
-            existing_data['last_updated'] = datetime.now().isoformat()
-            
-            # 파일 쓰기
-            with open(sentiment_file, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, ensure_ascii=False, indent=2)
-            
-            return True
+            return sentiment_state.append(buffer_data)
             
         except Exception as e:
             logger.error(f"파일 쓰기 실패: {e}")
@@ -320,7 +305,7 @@ class Epic7SentimentManager:
     
     def __init__(self):
         # 파일 경로 설정
-        self.sentiment_file = "daily_sentiment_data.json"
+        self.sentiment_file = DAILY_SENTIMENT_DATA_FILE
         self.stats_file = "sentiment_statistics.json"
         self.reports_file = "daily_reports.json"
         
@@ -426,25 +411,11 @@ class Epic7SentimentManager:
             
             def _write_buffer_to_file(self, buffer_data: List[Dict]) -> bool:
                 try:
-                    # 기존 데이터 로드
-                    if os.path.exists(self.sentiment_manager.sentiment_file):
-                        with open(self.sentiment_manager.sentiment_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                    else:
-                        data = {'posts': [], 'last_updated': datetime.now().isoformat()}
+                    # 잠금 안에서 최신 파일과 병합 후 스마트 정리 적용 (SQLite 백엔드는 행 추가)
+                    def cleanup(posts: List[Dict]) -> List[Dict]:
+                        return self.sentiment_manager._cleanup_old_data_smart({'posts': posts})['posts']
                     
-                    # 새 데이터 추가
-                    data['posts'].extend(buffer_data)
-                    data['last_updated'] = datetime.now().isoformat()
-                    
-                    # 스마트 정리 적용
-                    data = self.sentiment_manager._cleanup_old_data_smart(data)
-                    
-                    # 파일 저장
-                    with open(self.sentiment_manager.sentiment_file, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, ensure_ascii=False, indent=2)
-                    
-                    return True
+                    return sentiment_state.append(buffer_data, transform=cleanup)
                     
                 except Exception as e:
                     logger.error(f"감성 데이터 저장 실패: {e}")
@@ -571,11 +542,7 @@ class Epic7SentimentManager:
     def load_sentiment_data(self) -> Dict:
         """감성 데이터 로드"""
         try:
-            if os.path.exists(self.sentiment_file):
-                with open(self.sentiment_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                return {'posts': [], 'last_updated': datetime.now().isoformat()}
+            return {'posts': sentiment_state.load(), 'last_updated': datetime.now().isoformat()}
         except Exception as e:
             logger.error(f"감성 데이터 로드 실패: {e}")
             return {'posts': [], 'last_updated': datetime.now().isoformat()}
@@ -1007,24 +974,22 @@ def save_sentiment_data(posts_data: Union[Dict, List[Dict]], sentiment_result: D
 def get_sentiment_summary(time_period: str = "24h") -> Dict:
     """감성 데이터 요약 반환 - 하위 호환성 함수"""
     try:
-        manager = Epic7SentimentManager()
-        data = manager.load_sentiment_data()
-        
-        # 기본 요약 생성
-        total_posts = len(data.get('posts', []))
-        sentiment_counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+        # 기간 조건 집계 (SQLite 백엔드는 집계 쿼리, JSON은 공유 잠금 읽기)
+        now = datetime.now()
+        if time_period == "today":
+            since = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        elif time_period.endswith('h') and time_period[:-1].isdigit():
+            since = now - timedelta(hours=int(time_period[:-1]))
+        else:
+            since = None
         
-        # 감성 분포 계산
-        for post in data.get('posts', []):
-            sentiment = post.get('sentiment', 'neutral')
-            if sentiment in sentiment_counts:
-                sentiment_counts[sentiment] += 1
+        sentiment_counts = sentiment_state.count_by_sentiment(since)
         
         return {
-            'total_posts': total_posts,
+            'total_posts': sum(sentiment_counts.values()),
             'sentiment_distribution': sentiment_counts,
             'time_period': time_period,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now.isoformat()
         }
     except Exception as e:
         logger.error(f"감성 요약 생성 실패: {e}")
@@ -0,0 +1,675 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 SQLite 상태 저장소 - WAL 모드 단일 데이터베이스 (선택적 백엔드)
+크롤링 링크, 콘텐츠 캐시, 감성 게시글, 알림 통계, 재시도 항목을 하나의 스키마로 관리합니다.
+
+EPIC7_STORAGE_BACKEND=sqlite 일 때만 사용되며, 기본값(json)에서는 기존 JSON 파일을 그대로 사용합니다.
+WAL 모드이므로 한국/글로벌 실행이 같은 데이터베이스를 동시에 읽고 쓸 수 있고,
+기간 조회는 파일 전체 파싱 대신 인덱스로 처리됩니다.
+
+사용법:
+  python sqlite_store.py migrate            # 기존 JSON 상태 파일 → SQLite 이관
+  python sqlite_store.py stats              # 테이블별 행 수 출력
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+import os
+import sys
+import json
+import glob
+import time
+import argparse
+import threading
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
+
+try:
+    import sqlite3
+    SQLITE_AVAILABLE = True
+except ImportError:
+    SQLITE_AVAILABLE = False
+
+from config import config
+from utils import post_identity
+
+logger = logging.getLogger(__name__)
+
+# 스키마 버전 (PRAGMA user_version)
+SCHEMA_VERSION = 2
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS crawled_links (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    source TEXT,
+    processed_at REAL NOT NULL,
+    notified INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_crawled_links_url ON crawled_links(url);
+CREATE INDEX IF NOT EXISTS idx_crawled_links_source ON crawled_links(source);
+CREATE INDEX IF NOT EXISTS idx_crawled_links_processed_at ON crawled_links(processed_at);
+
+CREATE TABLE IF NOT EXISTS content_cache (
+    source TEXT NOT NULL,
+    key TEXT NOT NULL,
+    url TEXT,
+    content TEXT NOT NULL,
+    ts REAL NOT NULL,
+    PRIMARY KEY (source, key)
+);
+CREATE INDEX IF NOT EXISTS idx_content_cache_ts ON content_cache(ts);
+
+CREATE TABLE IF NOT EXISTS sentiment_posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    post_id TEXT,
+    url TEXT,
+    source TEXT,
+    sentiment TEXT,
+    processed_at REAL NOT NULL,
+    data TEXT NOT NULL,
+    UNIQUE (url, processed_at)
+);
+CREATE INDEX IF NOT EXISTS idx_sentiment_posts_post_id ON sentiment_posts(post_id);
+CREATE INDEX IF NOT EXISTS idx_sentiment_posts_source ON sentiment_posts(source);
+CREATE INDEX IF NOT EXISTS idx_sentiment_posts_processed_at ON sentiment_posts(processed_at);
+
+CREATE TABLE IF NOT EXISTS notification_stats (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS retry_items (
+    url TEXT PRIMARY KEY,
+    source TEXT,
+    data TEXT NOT NULL,
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_retry_items_source ON retry_items(source);
+CREATE INDEX IF NOT EXISTS idx_retry_items_created_at ON retry_items(created_at);
+"""
+
+# 버전별 증분 마이그레이션 (기존 DB는 user_version 이후 단계만 적용)
+SCHEMA_MIGRATIONS = {
+    1: SCHEMA_SQL,
+    2: """
+CREATE TABLE IF NOT EXISTS classification_cache (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_classification_cache_stored_at ON classification_cache(stored_at);
+""",
+}
+
+def _to_epoch(value: Any, default: Optional[float] = None) -> Optional[float]:
+    """ISO 문자열/epoch 숫자 → epoch 초"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            pass
+    return default
+
+# =============================================================================
+# SQLite 상태 저장소
+# =============================================================================
+
+class SQLiteStateStore:
+    """
+    WAL 모드 SQLite 상태 저장소
+
+    스레드별 연결을 사용하며, 각 메서드는 하나의 트랜잭션으로 처리됩니다.
+    """
+
+    def __init__(self, db_path: str = None, busy_timeout: float = None):
+        if not SQLITE_AVAILABLE:
+            raise RuntimeError("sqlite3 모듈을 사용할 수 없습니다")
+        self.db_path = db_path or config.Storage.SQLITE_PATH
+        self.busy_timeout = busy_timeout if busy_timeout is not None else config.Storage.SQLITE_BUSY_TIMEOUT
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    # -------------------------------------------------------------------------
+    # 연결 / 스키마
+    # -------------------------------------------------------------------------
+
+    def _connect(self) -> 'sqlite3.Connection':
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+            self._local.conn = conn
+            self._ensure_schema(conn)
+        return conn
+
+    def _ensure_schema(self, conn: 'sqlite3.Connection'):
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for target in range(version + 1, SCHEMA_VERSION + 1):
+                conn.executescript(SCHEMA_MIGRATIONS[target])
+                conn.execute(f"PRAGMA user_version={target}")
+                logger.info(f"SQLite 스키마 {'초기화' if target == 1 else '마이그레이션'}: {self.db_path} (v{target})")
+            self._schema_ready = True
+
+    def _write(self, sql: str, params: Iterable = ()) -> int:
+        """단일 쓰기 문장 실행 (IMMEDIATE 트랜잭션)"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(sql, tuple(params))
+            conn.execute("COMMIT")
+            return cursor.rowcount
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _write_many(self, sql: str, rows: Iterable[Iterable]) -> int:
+        """다중 행 쓰기 (하나의 트랜잭션)"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.executemany(sql, [tuple(row) for row in rows])
+            conn.execute("COMMIT")
+            return cursor.rowcount
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        """현재 스레드 연결 종료"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # -------------------------------------------------------------------------
+    # 크롤링 링크
+    # -------------------------------------------------------------------------
+
+    def link_processed_since(self, key: str, since: float) -> bool:
+        """since(epoch) 이후 처리된 링크인지 확인"""
+        row = self._connect().execute(
+            "SELECT 1 FROM crawled_links WHERE key = ? AND processed_at >= ?", (key, since)
+        ).fetchone()
+        return row is not None
+
+    def mark_link(self, key: str, url: str, processed_at: float = None,
+                  notified: bool = False, source: str = None):
+        """링크 처리 기록 (같은 키는 갱신)"""
+        self._write(
+            "INSERT OR REPLACE INTO crawled_links (key, url, source, processed_at, notified) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, url, source, processed_at or time.time(), int(bool(notified)))
+        )
+
+    def mark_links(self, entries: Dict[str, Dict]):
+        """링크 일괄 기록 (key → {url, ts, notified})"""
+        self._write_many(
+            "INSERT OR REPLACE INTO crawled_links (key, url, source, processed_at, notified) "
+            "VALUES (?, ?, ?, ?, ?)",
+            ((key, entry['url'], entry.get('source'), entry['ts'], int(bool(entry.get('notified'))))
+             for key, entry in entries.items())
+        )
+
+    def get_links(self, since: float = 0) -> Dict[str, Dict]:
+        """since 이후 처리된 링크 (key → {url, ts, notified})"""
+        rows = self._connect().execute(
+            "SELECT key, url, processed_at, notified FROM crawled_links "
+            "WHERE processed_at >= ? ORDER BY processed_at DESC", (since,)
+        ).fetchall()
+        return {
+            row['key']: {'url': row['url'], 'ts': row['processed_at'], 'notified': bool(row['notified'])}
+            for row in rows
+        }
+
+    def replace_links(self, entries: Dict[str, Dict]):
+        """링크 전체 교체"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM crawled_links")
+            conn.executemany(
+                "INSERT INTO crawled_links (key, url, source, processed_at, notified) VALUES (?, ?, ?, ?, ?)",
+                [(key, entry['url'], entry.get('source'), entry['ts'], int(bool(entry.get('notified'))))
+                 for key, entry in entries.items()]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def prune_links(self, cutoff: float, max_entries: int = None) -> int:
+        """보존 기간 경과 링크 삭제 및 최대 항목 수 유지"""
+        removed = self._write("DELETE FROM crawled_links WHERE processed_at < ?", (cutoff,))
+        if max_entries:
+            removed += self._write(
+                "DELETE FROM crawled_links WHERE key NOT IN "
+                "(SELECT key FROM crawled_links ORDER BY processed_at DESC LIMIT ?)", (max_entries,)
+            )
+        return removed
+
+    def count_links(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM crawled_links").fetchone()[0]
+
+    # -------------------------------------------------------------------------
+    # 콘텐츠 캐시
+    # -------------------------------------------------------------------------
+
+    def get_content(self, source: str, key: str, min_ts: float = 0) -> Optional[Dict]:
+        """캐시 항목 조회 (min_ts 이전 기록은 없는 것으로 취급)"""
+        row = self._connect().execute(
+            "SELECT content, ts, url FROM content_cache WHERE source = ? AND key = ? AND ts >= ?",
+            (source, key, min_ts)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def put_content(self, source: str, key: str, url: str, content: str,
+                    ts: float = None, max_entries: int = None) -> int:
+        """캐시 항목 기록 후 소스별 최대 항목 수 초과분(오래된 순) 제거, 제거 수 반환"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO content_cache (source, key, url, content, ts) VALUES (?, ?, ?, ?, ?)",
+                (source, key, url, content, ts or time.time())
+            )
+            evicted = 0
+            if max_entries:
+                evicted = conn.execute(
+                    "DELETE FROM content_cache WHERE source = ? AND key NOT IN "
+                    "(SELECT key FROM content_cache WHERE source = ? ORDER BY ts DESC LIMIT ?)",
+                    (source, source, max_entries)
+                ).rowcount
+            conn.execute("COMMIT")
+            return evicted
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def prune_content(self, cutoff: float) -> int:
+        """만료 캐시 항목 삭제"""
+        return self._write("DELETE FROM content_cache WHERE ts < ?", (cutoff,))
+
+    def count_content(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM content_cache").fetchone()[0]
+
+    # -------------------------------------------------------------------------
+    # 감성 게시글
+    # -------------------------------------------------------------------------
+
+    def add_sentiment_posts(self, posts: List[Dict]) -> int:
+        """감성 게시글 추가 (같은 url + 처리 시각은 한 번만)"""
+        rows = []
+        for post in posts:
+            processed_at = _to_epoch(post.get('processed_at') or post.get('timestamp'), time.time())
+            url = post.get('url')
+            rows.append((
+                post_identity(url) if url else (post.get('post_id') or post.get('id')),
+                post.get('url'),
+                post.get('source'),
+                post.get('sentiment'),
+                processed_at,
+                json.dumps(post, ensure_ascii=False, default=str)
+            ))
+        return self._write_many(
+            "INSERT OR IGNORE INTO sentiment_posts (post_id, url, source, sentiment, processed_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)", rows
+        )
+
+    def query_sentiment_posts(self, since: float = 0, until: float = None,
+                              source: str = None, limit: int = None) -> List[Dict]:
+        """기간/소스 조건 감성 게시글 조회 (처리 시각 오름차순)"""
+        sql = "SELECT data FROM sentiment_posts WHERE processed_at >= ?"
+        params = [since]
+        if until is not None:
+            sql += " AND processed_at < ?"
+            params.append(until)
+        if source:
+            sql += " AND source = ?"
+            params.append(source)
+        sql += " ORDER BY processed_at"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row['data']) for row in self._connect().execute(sql, params)]
+
+    def count_sentiment(self, since: float = 0, until: float = None) -> Dict[str, int]:
+        """기간 내 감성별 게시글 수"""
+        sql = "SELECT sentiment, COUNT(*) AS n FROM sentiment_posts WHERE processed_at >= ?"
+        params = [since]
+        if until is not None:
+            sql += " AND processed_at < ?"
+            params.append(until)
+        sql += " GROUP BY sentiment"
+        return {row['sentiment'] or 'neutral': row['n'] for row in self._connect().execute(sql, params)}
+
+    def prune_sentiment_posts(self, cutoff: float) -> int:
+        """보존 기간 경과 감성 게시글 삭제"""
+        return self._write("DELETE FROM sentiment_posts WHERE processed_at < ?", (cutoff,))
+
+    def count_sentiment_posts(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM sentiment_posts").fetchone()[0]
+
+    def iter_sentiment_rows(self, after_id: int = 0, batch_size: int = 1000) -> Iterator[Tuple[int, Dict]]:
+        """감성 게시글 (행 ID, 데이터) 순회 - ID 순 배치 조회이므로 순회 중 쓰기 가능"""
+        conn = self._connect()
+        while True:
+            rows = conn.execute(
+                "SELECT id, data FROM sentiment_posts WHERE id > ? ORDER BY id LIMIT ?", (after_id, batch_size)
+            ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row['id'], json.loads(row['data'])
+            after_id = rows[-1]['id']
+
+    def update_sentiment_posts(self, updates: Dict[int, Dict]) -> int:
+        """행 ID별 필드 갱신 (data 병합 + sentiment 컬럼), 갱신된 행 수 반환 - 하나의 트랜잭션"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            updated = 0
+            for row_id, fields in updates.items():
+                row = conn.execute("SELECT data FROM sentiment_posts WHERE id = ?", (row_id,)).fetchone()
+                if row is None:
+                    # 그 사이 보존 기간 정리로 삭제된 행
+                    continue
+                data = json.loads(row['data'])
+                data.update(fields)
+                conn.execute(
+                    "UPDATE sentiment_posts SET sentiment = ?, data = ? WHERE id = ?",
+                    (data.get('sentiment'), json.dumps(data, ensure_ascii=False, default=str), row_id)
+                )
+                updated += 1
+            conn.execute("COMMIT")
+            return updated
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    # -------------------------------------------------------------------------
+    # 알림 통계
+    # -------------------------------------------------------------------------
+
+    def get_notification_stats(self) -> Dict:
+        """알림 통계 전체 (최상위 키 → 값)"""
+        rows = self._connect().execute("SELECT key, value FROM notification_stats").fetchall()
+        return {row['key']: json.loads(row['value']) for row in rows}
+
+    def set_notification_stats(self, stats: Dict):
+        """알림 통계 최상위 키 기록 (주어진 키만 갱신)"""
+        now = time.time()
+        self._write_many(
+            "INSERT OR REPLACE INTO notification_stats (key, value, updated_at) VALUES (?, ?, ?)",
+            ((key, json.dumps(value, ensure_ascii=False), now) for key, value in stats.items())
+        )
+
+    # -------------------------------------------------------------------------
+    # 재시도 항목
+    # -------------------------------------------------------------------------
+
+    def get_retry_items(self) -> List[Dict]:
+        """대기 중인 재시도 항목 (등록 순)"""
+        rows = self._connect().execute(
+            "SELECT data, retry_count FROM retry_items ORDER BY created_at"
+        ).fetchall()
+        items = []
+        for row in rows:
+            item = json.loads(row['data'])
+            item['retry_count'] = row['retry_count']
+            items.append(item)
+        return items
+
+    def save_retry_items(self, items: List[Dict]):
+        """재시도 항목 기록 (같은 URL은 갱신 - 다른 실행의 항목은 유지)"""
+        self._write_many(
+            "INSERT OR REPLACE INTO retry_items (url, source, data, retry_count, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (self._retry_row(item) for item in items if self._retry_url(item))
+        )
+
+    def delete_retry_items(self, urls: List[str]):
+        """처리 완료 재시도 항목 삭제"""
+        self._write_many("DELETE FROM retry_items WHERE url = ?", ((url,) for url in urls if url))
+
+    @staticmethod
+    def _retry_url(item: Dict) -> Optional[str]:
+        post_data = item.get('post_data') or item
+        return post_data.get('url')
+
+    def _retry_row(self, item: Dict) -> tuple:
+        post_data = item.get('post_data') or item
+        return (
+            self._retry_url(item),
+            post_data.get('source'),
+            json.dumps(item, ensure_ascii=False, default=str),
+            int(item.get('retry_count', 0)),
+            _to_epoch(item.get('timestamp'), time.time())
+        )
+
+    # -------------------------------------------------------------------------
+    # 분류 결과 캐시 (메모리 LRU에서 밀려난 항목)
+    # -------------------------------------------------------------------------
+
+    def get_classification(self, key: str) -> Optional[Dict]:
+        conn = self._connect()
+        row = conn.execute("SELECT result FROM classification_cache WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_classifications(self, results: Dict[str, Dict], max_entries: int = None) -> int:
+        """분류 결과 기록 후 최대 항목 수 초과분(오래된 순) 제거, 제거 수 반환"""
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO classification_cache (key, result, stored_at) VALUES (?, ?, ?)",
+                [(key, json.dumps(result, ensure_ascii=False, default=str), now) for key, result in results.items()]
+            )
+            evicted = 0
+            if max_entries:
+                evicted = conn.execute(
+                    "DELETE FROM classification_cache WHERE key NOT IN "
+                    "(SELECT key FROM classification_cache ORDER BY stored_at DESC LIMIT ?)",
+                    (max_entries,)
+                ).rowcount
+            conn.execute("COMMIT")
+            return evicted
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    # -------------------------------------------------------------------------
+    # 통계
+    # -------------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, int]:
+        """테이블별 행 수"""
+        conn = self._connect()
+        return {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ('crawled_links', 'content_cache', 'sentiment_posts',
+                          'notification_stats', 'retry_items', 'classification_cache')
+        }
+
+# =============================================================================
+# 전역 저장소 접근
+# =============================================================================
+
+_state_store = None
+_state_store_lock = threading.Lock()
+
+def is_sqlite_backend() -> bool:
+    """SQLite 백엔드 사용 여부 (EPIC7_STORAGE_BACKEND=sqlite)"""
+    return config.Storage.BACKEND == 'sqlite' and SQLITE_AVAILABLE
+
+def get_state_store() -> Optional[SQLiteStateStore]:
+    """SQLite 백엔드 사용 시 전역 저장소, 아니면 None"""
+    global _state_store
+    if not is_sqlite_backend():
+        return None
+    with _state_store_lock:
+        if _state_store is None:
+            _state_store = SQLiteStateStore()
+        return _state_store
+
+# =============================================================================
+# JSON → SQLite 이관
+# =============================================================================
+
+def _read_json(path: str) -> Any:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read().strip()
+        return json.loads(content) if content else None
+    except (OSError, ValueError) as e:
+        logger.warning(f"이관 대상 파일 읽기 실패: {path} ({e})")
+        return None
+
+def _state_files(directory: str, prefix: str) -> List[str]:
+    """스냅샷(.json) 또는 저널(.jsonl)이 있는 상태 파일의 스냅샷 경로 목록"""
+    bases = set()
+    for pattern in (f'{prefix}*.json', f'{prefix}*.jsonl'):
+        for path in glob.glob(os.path.join(directory, pattern)):
+            bases.add(os.path.splitext(path)[0] + '.json')
+    return sorted(bases)
+
+def _migrate_links(store: SQLiteStateStore, directory: str) -> int:
+    from link_index import CrawledLinkIndex, canonical_link_key
+
+    total = 0
+    for path in _state_files(directory, 'crawled_links'):
+        # 저널에 남은 변경분까지 반영된 스냅샷 기준
+        index = CrawledLinkIndex(file_path=path, retention_hours=24 * 365)
+        entries = {}
+        for item in index.snapshot().get('links', []):
+            ts = _to_epoch(item.get('processed_at'))
+            if item.get('url') and ts is not None:
+                entries[canonical_link_key(item['url'])] = {
+                    'url': item['url'], 'ts': ts, 'notified': item.get('notified', False)
+                }
+        index.close()
+        if entries:
+            store.mark_links(entries)
+        total += len(entries)
+        print(f"[MIGRATE] {os.path.basename(path)}: 링크 {len(entries)}개")
+    return total
+
+def _migrate_content_cache(store: SQLiteStateStore, directory: str) -> int:
+    from state_journal import StateJournal
+
+    def apply(shards, op, key, value):
+        source, content_key = key
+        if op == 'set':
+            shards.setdefault(source, {})[content_key] = value
+        elif op == 'del':
+            shards.get(source, {}).pop(content_key, None)
+
+    def decode(raw):
+        if isinstance(raw, dict) and raw.get('version') == 2:
+            return {source: dict(entries) for source, entries in raw.get('shards', {}).items()}
+        return {}
+
+    total = 0
+    for path in _state_files(directory, 'content_cache'):
+        shards = StateJournal(path, decode=decode, apply=apply).load()
+        count = 0
+        for source, entries in shards.items():
+            for key, entry in entries.items():
+                store.put_content(source, key, entry.get('url'), entry.get('content', ''), entry.get('ts'))
+                count += 1
+        total += count
+        print(f"[MIGRATE] {os.path.basename(path)}: 콘텐츠 캐시 {count}개")
+    return total
+
+def _migrate_sentiment(store: SQLiteStateStore, directory: str) -> int:
+    path = os.path.join(directory, 'daily_sentiment_data.json')
+    if not os.path.exists(path):
+        return 0
+    data = _read_json(path)
+    posts = data.get('posts', []) if isinstance(data, dict) else (data or [])
+    # 처리 시각이 없는 게시글은 파일 수정 시각 기준 (재실행 시 중복 방지)
+    fallback = datetime.fromtimestamp(os.path.getmtime(path)).isoformat()
+    posts = [
+        post if post.get('processed_at') or post.get('timestamp') else {**post, 'processed_at': fallback}
+        for post in posts if isinstance(post, dict)
+    ]
+    if posts:
+        store.add_sentiment_posts(posts)
+    print(f"[MIGRATE] {os.path.basename(path)}: 감성 게시글 {len(posts)}개")
+    return len(posts)
+
+def _migrate_notification_stats(store: SQLiteStateStore, directory: str) -> int:
+    from state_journal import StateJournal
+
+    path = os.path.join(directory, 'notification_stats.json')
+    if not os.path.exists(path) and not os.path.exists(os.path.splitext(path)[0] + '.jsonl'):
+        return 0
+    stats = StateJournal(path, decode=lambda data: data if isinstance(data, dict) else {}).load()
+    if stats:
+        store.set_notification_stats(stats)
+    print(f"[MIGRATE] {os.path.basename(path)}: 알림 통계 {len(stats)}개 키")
+    return len(stats)
+
+def _migrate_retry_items(store: SQLiteStateStore, directory: str) -> int:
+    path = os.path.join(directory, 'epic7_monitor_retry_queue.json')
+    if not os.path.exists(path):
+        return 0
+    data = _read_json(path)
+    items = [item for item in (data or []) if isinstance(item, dict)]
+    if items:
+        store.save_retry_items(items)
+    print(f"[MIGRATE] {os.path.basename(path)}: 재시도 항목 {len(items)}개")
+    return len(items)
+
+def migrate_from_json(store: SQLiteStateStore, directory: str = '.') -> Dict[str, int]:
+    """
+    기존 JSON 상태 파일을 SQLite로 이관 (여러 번 실행해도 같은 결과)
+    원본 JSON 파일은 수정하지 않습니다.
+    """
+    return {
+        'crawled_links': _migrate_links(store, directory),
+        'content_cache': _migrate_content_cache(store, directory),
+        'sentiment_posts': _migrate_sentiment(store, directory),
+        'notification_stats': _migrate_notification_stats(store, directory),
+        'retry_items': _migrate_retry_items(store, directory)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Epic7 SQLite 상태 저장소 도구")
+    parser.add_argument('command', choices=['migrate', 'stats'], help="migrate: JSON → SQLite 이관, stats: 행 수 출력")
+    parser.add_argument('--db', default=config.Storage.SQLITE_PATH, help="SQLite 데이터베이스 경로")
+    parser.add_argument('--dir', default='.', help="JSON 상태 파일 디렉토리")
+    args = parser.parse_args()
+
+    if not SQLITE_AVAILABLE:
+        print("[ERROR] sqlite3 모듈을 사용할 수 없습니다")
+        return 1
+
+    store = SQLiteStateStore(args.db)
+    if args.command == 'migrate':
+        start = time.time()
+        counts = migrate_from_json(store, args.dir)
+        print(f"[MIGRATE] 완료 ({time.time() - start:.2f}초): {counts}")
+    print(f"[STATS] {args.db}: {store.get_stats()}")
+    store.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 상태 저널 - 추가 전용(JSONL) 변경 기록 + 주기적 압축
+상태 파일을 변경마다 전체 재작성하는 대신 변경 이벤트 한 줄만 추가합니다.
+
+구성:
+- 스냅샷: 기존 JSON 상태 파일 (다른 모듈이 그대로 읽을 수 있는 형식)
+- 저널: <스냅샷 이름>.jsonl, 이벤트 한 줄 = {"op": "set"|"del", "k": 키, "v": 값}
+- 로드: 스냅샷 + (압축 중이던 저널) + 저널 순서로 재생
+- 압축: 저널 크기/경과 시간 임계값 초과 시 저널을 회전하고 백그라운드에서 스냅샷 재작성
+
+모든 이벤트는 멱등(set/del)이므로 압축 도중 중단되어 회전된 저널이 다시 재생되어도
+같은 상태로 수렴합니다. 마지막 줄이 잘린 경우(쓰기 중 종료) 해당 줄을 잘라내고 복구합니다.
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+# 압축 임계값 기본값
+DEFAULT_MAX_JOURNAL_BYTES = 512 * 1024   # 512KB
+DEFAULT_MAX_JOURNAL_AGE = 6 * 60 * 60    # 6시간
+
+def _apply_flat(state: Dict, op: str, key: Any, value: Any):
+    """기본 이벤트 적용기 - 단일 계층 dict"""
+    if op == 'set':
+        state[key] = value
+    elif op == 'del':
+        state.pop(key, None)
+
+@contextmanager
+def _no_lock(file_path: str):
+    yield
+
+class StateJournal:
+    """
+    추가 전용 상태 저널
+
+    Args:
+        snapshot_path: 스냅샷 JSON 파일 경로
+        encode: 상태 → 스냅샷 JSON 객체 변환
+        decode: 스냅샷 JSON 객체(없으면 None) → 상태 변환
+        apply: 이벤트 적용 함수 (state, op, key, value)
+        lock_factory: 스냅샷 교체 시 사용할 파일 잠금 컨텍스트 (file_path 인자)
+        indent: 스냅샷 JSON 들여쓰기 (None이면 공백 없는 압축 형식)
+
+    호출 측은 상태 변경과 record_* 호출, maybe_compact 호출을 같은 잠금 안에서 수행해야
+    스냅샷과 저널이 어긋나지 않습니다.
+    """
+
+    def __init__(self, snapshot_path: str,
+                 encode: Callable[[Any], Any] = None,
+                 decode: Callable[[Any], Any] = None,
+                 apply: Callable[[Any, str, Any, Any], None] = None,
+                 max_bytes: int = DEFAULT_MAX_JOURNAL_BYTES,
+                 max_age: float = DEFAULT_MAX_JOURNAL_AGE,
+                 lock_factory: Callable = None,
+                 fsync: bool = False,
+                 indent: Optional[int] = 2):
+        self.snapshot_path = snapshot_path
+        base, _ = os.path.splitext(snapshot_path)
+        self.journal_path = f"{base}.jsonl"
+        self.compacting_path = f"{self.journal_path}.compacting"
+        self.encode = encode or (lambda state: state)
+        self.decode = decode or (lambda data: dict(data or {}))
+        self.apply = apply or _apply_flat
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.lock_factory = lock_factory or _no_lock
+        self.fsync = fsync
+        self.indent = indent
+
+        self._lock = threading.Lock()
+        self._journal_started = None
+        self._compaction_thread = None
+        self.stats = {
+            'replayed': 0,
+            'appended': 0,
+            'compactions': 0,
+            'recovered_tail': 0,
+            'skipped_lines': 0
+        }
+
+    # -------------------------------------------------------------------------
+    # 로드 / 재생
+    # -------------------------------------------------------------------------
+
+    def load(self) -> Any:
+        """스냅샷 로드 후 저널 재생"""
+        with self._lock:
+            self._wait_compaction()
+
+            snapshot = None
+            if os.path.exists(self.snapshot_path):
+                try:
+                    with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                        snapshot = json.load(f)
+                except (ValueError, OSError) as e:
+                    logger.warning(f"스냅샷 로드 실패, 저널만 재생: {self.snapshot_path} ({e})")
+
+            state = self.decode(snapshot)
+
+            # 압축 도중 중단된 회전 저널 → 현재 저널 순서로 재생
+            for path in (self.compacting_path, self.journal_path):
+                if os.path.exists(path):
+                    self._replay(path, state)
+
+            return state
+
+    def _replay(self, path: str, state: Any):
+        """저널 재생 - 손상된 마지막 줄은 잘라내어 복구"""
+        good_offset = 0
+        with open(path, 'rb') as f:
+            lines = f.readlines()
+
+        offset = 0
+        for index, raw in enumerate(lines):
+            offset += len(raw)
+            is_last = index == len(lines) - 1
+
+            try:
+                if not raw.endswith(b'\n'):
+                    raise ValueError("불완전한 줄")
+                event = json.loads(raw.decode('utf-8'))
+                if 'ts' in event and self._journal_started is None and path == self.journal_path:
+                    self._journal_started = event['ts']
+                self.apply(state, event.get('op'), self._decode_key(event.get('k')), event.get('v'))
+                self.stats['replayed'] += 1
+                good_offset = offset
+            except (ValueError, UnicodeDecodeError, TypeError) as e:
+                if is_last:
+                    # 쓰기 도중 종료된 꼬리 - 잘라내어 다음 추가가 깨끗한 줄에서 시작되도록 함
+                    with open(path, 'r+b') as f:
+                        f.truncate(good_offset)
+                    self.stats['recovered_tail'] += 1
+                    logger.warning(f"저널 꼬리 복구: {path} ({len(raw)}바이트 제거)")
+                else:
+                    self.stats['skipped_lines'] += 1
+                    good_offset = offset
+                    logger.warning(f"저널 손상 줄 건너뜀: {path}:{index + 1} ({e})")
+
+    # -------------------------------------------------------------------------
+    # 기록
+    # -------------------------------------------------------------------------
+
+    def record_set(self, key: Any, value: Any):
+        """키 설정 이벤트 추가"""
+        self._append({'op': 'set', 'k': key, 'v': value})
+
+    def record_delete(self, key: Any):
+        """키 삭제 이벤트 추가"""
+        self._append({'op': 'del', 'k': key})
+
+    def _append(self, event: Dict):
+        event['ts'] = time.time()
+        line = json.dumps(event, ensure_ascii=False, separators=(',', ':')) + '\n'
+        with self._lock:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            if self._journal_started is None:
+                self._journal_started = event['ts']
+            self.stats['appended'] += 1
+
+    # -------------------------------------------------------------------------
+    # 압축
+    # -------------------------------------------------------------------------
+
+    def needs_compaction(self) -> bool:
+        """저널 크기 또는 경과 시간 임계값 초과 여부"""
+        try:
+            size = os.path.getsize(self.journal_path)
+        except OSError:
+            return False
+        if size == 0:
+            return False
+        if size >= self.max_bytes:
+            return True
+        return self._journal_started is not None and time.time() - self._journal_started >= self.max_age
+
+    def maybe_compact(self, state: Any, background: bool = True) -> bool:
+        """임계값 초과 시 압축"""
+        if not self.needs_compaction():
+            return False
+        return self.compact(state, background=background)
+
+    def compact(self, state: Any, background: bool = False) -> bool:
+        """
+        현재 상태로 스냅샷 재작성 후 저널 비우기
+        상태 직렬화와 저널 회전은 즉시 수행하고, 스냅샷 파일 쓰기는 백그라운드로 수행할 수 있습니다.
+        """
+        with self._lock:
+            self._wait_compaction()
+
+            separators = (',', ':') if self.indent is None else None
+            snapshot_text = json.dumps(self.encode(state), ensure_ascii=False,
+                                       indent=self.indent, separators=separators)
+
+            # 저널 회전 - 이후 추가 이벤트는 새 저널로
+            # (이전 압축이 실패해 회전 저널이 남아 있으면 이어 붙여 재생 대상 보존)
+            if os.path.exists(self.journal_path):
+                if os.path.exists(self.compacting_path):
+                    with open(self.journal_path, 'rb') as src, open(self.compacting_path, 'ab') as dst:
+                        dst.write(src.read())
+                    os.unlink(self.journal_path)
+                else:
+                    os.replace(self.journal_path, self.compacting_path)
+            self._journal_started = None
+
+            if background:
+                self._compaction_thread = threading.Thread(
+                    target=self._write_snapshot, args=(snapshot_text,),
+                    name=f"journal-compact-{os.path.basename(self.snapshot_path)}", daemon=False
+                )
+                self._compaction_thread.start()
+                return True
+
+        return self._write_snapshot(snapshot_text)
+
+    def _write_snapshot(self, snapshot_text: str) -> bool:
+        """스냅샷 원자적 교체 후 회전된 저널 삭제"""
+        try:
+            directory = os.path.dirname(self.snapshot_path) or '.'
+            with self.lock_factory(self.snapshot_path):
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory,
+                                                 suffix='.tmp', delete=False) as tmp:
+                    tmp.write(snapshot_text)
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+                os.replace(tmp.name, self.snapshot_path)
+
+            if os.path.exists(self.compacting_path):
+                os.unlink(self.compacting_path)
+            self.stats['compactions'] += 1
+            logger.debug(f"저널 압축 완료: {self.snapshot_path}")
+            return True
+        except Exception as e:
+            # 회전된 저널은 남겨 두어 다음 로드 시 재생
+            logger.error(f"저널 압축 실패: {self.snapshot_path} ({e})")
+            return False
+
+    def close(self):
+        """진행 중인 백그라운드 압축 완료 대기"""
+        with self._lock:
+            self._wait_compaction()
+
+    def _wait_compaction(self):
+        thread = self._compaction_thread
+        if thread is not None:
+            thread.join()
+            self._compaction_thread = None
+
+    @staticmethod
+    def _decode_key(key: Any) -> Any:
+        # JSON 배열 키(복합 키)는 튜플로 복원
+        return tuple(key) if isinstance(key, list) else key
+
+    def get_stats(self) -> Dict:
+        """저널 통계 반환"""
+        try:
+            size = os.path.getsize(self.journal_path)
+        except OSError:
+            size = 0
+        return {**self.stats, 'journal_bytes': size}
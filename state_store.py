@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 공유 상태 저장소 - 한국/글로벌 실행이 함께 쓰는 상태 파일 접근 계층
+읽기는 fcntl 공유 잠금, 갱신은 배타 잠금 안에서 최신 파일을 다시 읽어 병합한 뒤 원자적으로 교체합니다.
+
+각 모듈이 메모리에 들고 있던 오래된 내용으로 파일 전체를 덮어쓰지 않으므로
+같은 체크아웃을 쓰는 프로세스/스레드끼리는 기록이 유실되지 않습니다.
+fcntl 잠금은 GitHub 러너 간에 공유되지 않으므로, 러너별 체크아웃 간 유실은
+워크플로우 concurrency 그룹(epic7-state)의 직렬화로 막습니다.
+
+SQLite 백엔드(EPIC7_STORAGE_BACKEND=sqlite)에서는 감성 데이터를 sentiment_posts 테이블로 처리합니다.
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+import os
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Callable
+
+from config import config
+from file_manager import file_manager
+from sqlite_store import get_state_store
+
+logger = logging.getLogger(__name__)
+
+# 일간 리포트용 감성 데이터 파일 (한국/글로벌/일간 리포트 공유)
+DAILY_SENTIMENT_DATA_FILE = "daily_sentiment_data.json"
+
+# 감성 항목 시각 필드 (모듈별로 저장 필드가 달라 순서대로 확인)
+ENTRY_TIME_FIELDS = ('saved_at', 'timestamp', 'processed_at')
+
+def entry_time(entry: Dict) -> Optional[datetime]:
+    """감성 항목의 기록 시각"""
+    for field in ENTRY_TIME_FIELDS:
+        value = entry.get(field)
+        if value:
+            try:
+                return datetime.fromisoformat(str(value))
+            except ValueError:
+                continue
+    return None
+
+# =============================================================================
+# 공유 JSON 상태 파일
+# =============================================================================
+
+class SharedStateFile:
+    """
+    여러 실행이 함께 쓰는 JSON 상태 파일
+
+    read()는 공유 잠금으로 읽고, update(fn)는 배타 잠금 안에서
+    최신 내용 → fn(data) → 원자적 교체를 한 번에 수행합니다.
+    """
+
+    def __init__(self, file_path: str, default_factory: Callable[[], Any],
+                 normalize: Callable[[Any], Any] = None, lock_timeout: float = 30.0):
+        self.file_path = file_path
+        self.default_factory = default_factory
+        self.normalize = normalize or (lambda data: data)
+        self.lock_timeout = lock_timeout
+
+    def read(self) -> Any:
+        """현재 내용 (파일이 없거나 손상되면 기본값)"""
+        with file_manager.file_lock(self.file_path, timeout=self.lock_timeout, shared=True):
+            return self._load()
+
+    def update(self, fn: Callable[[Any], Any]) -> Any:
+        """배타 잠금 안에서 최신 내용에 fn 적용 후 저장 (fn의 반환값이 새 내용)"""
+        with file_manager.file_lock(self.file_path, timeout=self.lock_timeout):
+            data = fn(self._load())
+            file_manager.write_json_atomic(self.file_path, data)
+            return data
+
+    def _load(self) -> Any:
+        if not os.path.exists(self.file_path):
+            return self.default_factory()
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                content = f.read().strip()
+            if not content:
+                return self.default_factory()
+            return self.normalize(json.loads(content))
+        except (ValueError, OSError) as e:
+            logger.warning(f"상태 파일 읽기 실패, 기본값 사용: {self.file_path} ({e})")
+            return self.default_factory()
+
+# =============================================================================
+# 감성 데이터 상태
+# =============================================================================
+
+def _normalize_sentiment_entries(data: Any) -> List[Dict]:
+    # 배열 형식(notifier/monitor_bugs)과 {'posts': [...]} 형식(sentiment_data_manager) 모두 허용
+    if isinstance(data, dict):
+        data = data.get('posts', [])
+    if not isinstance(data, list):
+        return []
+    return [entry for entry in data if isinstance(entry, dict)]
+
+class SentimentState:
+    """일간 리포트용 감성 데이터 (배열 형식으로 저장)"""
+
+    def __init__(self, file_path: str = DAILY_SENTIMENT_DATA_FILE,
+                 retention_hours: float = None):
+        # 보존은 감성 데이터 정책(MAX_DATA_DAYS) 기준 - 24시간 창은 load(since=...)로 조회
+        self.retention_hours = retention_hours or config.Sentiment.MAX_DATA_DAYS * 24
+        self.file = SharedStateFile(file_path, list, _normalize_sentiment_entries)
+
+    def load(self, since: Optional[datetime] = None) -> List[Dict]:
+        """since 이후 기록된 감성 항목 (기록 순)"""
+        store = get_state_store()
+        if store is not None:
+            return store.query_sentiment_posts(since.timestamp() if since else 0)
+
+        entries = self.file.read()
+        if since is None:
+            return entries
+        return [entry for entry in entries if (entry_time(entry) or datetime.min) > since]
+
+    def append(self, entries: List[Dict],
+               transform: Optional[Callable[[List[Dict]], List[Dict]]] = None) -> bool:
+        """감성 항목 추가 - 다른 실행이 그 사이 추가한 항목과 병합 후 보존 기간 밖 항목 정리"""
+        if not entries:
+            return True
+
+        store = get_state_store()
+        if store is not None:
+            store.add_sentiment_posts(entries)
+            cutoff = datetime.now() - timedelta(hours=self.retention_hours)
+            store.prune_sentiment_posts(cutoff.timestamp())
+            return True
+
+        def merge(current: List[Dict]) -> List[Dict]:
+            cutoff = datetime.now() - timedelta(hours=self.retention_hours)
+            merged = [entry for entry in current + list(entries) if (entry_time(entry) or datetime.now()) > cutoff]
+            return transform(merged) if transform else merged
+
+        try:
+            self.file.update(merge)
+            return True
+        except Exception as e:
+            logger.error(f"감성 데이터 저장 실패: {e}")
+            return False
+
+    def count_by_sentiment(self, since: Optional[datetime] = None) -> Dict[str, int]:
+        """기간 내 감성별 항목 수"""
+        counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+        store = get_state_store()
+        if store is not None:
+            for sentiment, count in store.count_sentiment(since.timestamp() if since else 0).items():
+                if sentiment in counts:
+                    counts[sentiment] += count
+            return counts
+
+        for entry in self.load(since):
+            sentiment = entry.get('sentiment', 'neutral')
+            if sentiment in counts:
+                counts[sentiment] += 1
+        return counts
+
+# 전역 감성 데이터 상태 인스턴스
+sentiment_state = SentimentState()
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Epic7 통계 분류 엔진 (선택) - 문자 n-gram 해싱 특징 + 로지스틱 회귀, 순수 NumPy / CPU 전용
+키워드 규칙(classifier.py)이 놓치는 표현(띄어쓰기/어미 변형, 신조어, 오타)을 보완합니다.
+
+구성:
+- HashingVectorizer: 정규화 텍스트의 문자 n-gram(기본 1~3, 한글 음절 단위)을 고정 크기 특징 공간으로 해싱
+  배치 전체의 n-gram 해시를 한 번의 배열 연산으로 계산 (게시글 경계를 넘는 n-gram 제외)
+- 모델: 감성(긍정/부정/중립) + 버그(버그/기타) 두 헤드의 다중 클래스 로지스틱 회귀
+  가중치는 <모델>.npy (특징 수 × 클래스 수, float32), 라벨/편향은 <모델>.json
+- 추론: 가중치를 mmap으로 로드, 배치 희소 특징 × 가중치 행렬 곱을 gather + 행별 합으로 한 번에 계산
+- 학습: 저장된 감성 데이터(sentiment, category 필드)를 라벨로 오프라인 학습 (AdaGrad 미니배치)
+
+분류기 연동: EPIC7_STATISTICAL_ENGINE=1 이고 모델 파일이 있으면 Epic7Classifier가 사용합니다.
+키워드 감성이 중립일 때만 모델 감성으로 보완하며, 모델 단독 버그 판정은
+EPIC7_STATISTICAL_BUG_OVERRIDE=1 일 때 키워드 결과가 비어 있는 게시글에만 적용합니다.
+
+사용 예:
+    python statistical_classifier.py train --input daily_sentiment_data.json
+    python statistical_classifier.py train --db epic7_state.db --epochs 5
+    python statistical_classifier.py predict "서버 또 튕기네" "great update"
+
+Author: Epic7 Monitoring Team
+Version: 1.0
+Date: 2025-07-28
+"""
+
+import re
+import sys
+import json
+import time
+import random
+import hashlib
+import logging
+import argparse
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from config import config
+from state_store import DAILY_SENTIMENT_DATA_FILE
+
+logger = logging.getLogger(__name__)
+
+# 모델 파일 형식 버전 (해싱/헤드 구조 변경 시 올림)
+MODEL_FORMAT_VERSION = 1
+
+# 헤드별 라벨 (가중치 행렬 열 순서)
+HEADS = {
+    'sentiment': ('positive', 'negative', 'neutral'),
+    'bug': ('bug', 'other')
+}
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# n-gram 해시 상수 (64비트 다항식 해시 + murmur3 fmix64)
+_HASH_PRIME = 0x100000001B3
+_FMIX_1 = 0xFF51AFD7ED558CCD
+_FMIX_2 = 0xC4CEB9FE1A85EC53
+
+def normalize_text(text: str) -> str:
+    """소문자 + 공백 정리, 앞뒤 공백 한 칸 (단어 경계 n-gram 포함)"""
+    return ' ' + WHITESPACE_PATTERN.sub(' ', text.lower()).strip() + ' '
+
+# =============================================================================
+# 해싱 특징 추출
+# =============================================================================
+
+class HashingVectorizer:
+    """
+    문자 n-gram 해싱 특징 (상태 없음 - 학습/추론이 같은 설정이면 같은 특징)
+
+    transform()은 배치 희소 행렬을 (행 번호, 특징 번호, 값) 배열로 반환합니다.
+    같은 게시글의 중복 n-gram은 한 번만 세고(이진 특징), 값은 행별 L2 정규화합니다.
+    """
+
+    def __init__(self, n_features_bits: int = 18, ngram_range: Tuple[int, int] = (1, 3)):
+        self.n_features_bits = n_features_bits
+        self.n_features = 1 << n_features_bits
+        self.ngram_range = tuple(ngram_range)
+
+    def transform(self, texts: List[str]) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        docs = [normalize_text(text) for text in texts]
+        lengths = np.fromiter((len(doc) for doc in docs), dtype=np.int64, count=len(docs))
+        # 배치 전체를 코드 포인트 배열 하나로 (UTF-32 = 문자당 4바이트)
+        codes = np.frombuffer(''.join(docs).encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+        doc_ids = np.repeat(np.arange(len(docs), dtype=np.int64), lengths)
+        total = len(codes)
+
+        keys = []
+        mask = np.uint64(self.n_features - 1)
+        for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+            count = total - n + 1
+            if count <= 0:
+                continue
+            hashes = np.full(count, n, dtype=np.uint64)
+            for offset in range(n):
+                hashes = hashes * np.uint64(_HASH_PRIME) + codes[offset:offset + count]
+            # 게시글 경계를 넘는 n-gram 제외
+            valid = doc_ids[:count] == doc_ids[n - 1:n - 1 + count]
+            hashes = self._mix(hashes[valid])
+            keys.append(doc_ids[:count][valid] * self.n_features + (hashes & mask).astype(np.int64))
+
+        if not keys:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0, dtype=np.float32)
+
+        # (행, 특징) 중복 제거 - 정렬 후 인접 비교 (결과는 행 순서로 정렬됨)
+        sorted_keys = np.sort(np.concatenate(keys))
+        unique_keys = sorted_keys[np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))]
+        rows = unique_keys >> self.n_features_bits
+        features = unique_keys & (self.n_features - 1)
+        counts = np.bincount(rows, minlength=len(docs))
+        values = (1.0 / np.sqrt(np.maximum(counts, 1)))[rows].astype(np.float32)
+        return rows, features, values
+
+    @staticmethod
+    def _mix(hashes: 'np.ndarray') -> 'np.ndarray':
+        hashes = hashes ^ (hashes >> np.uint64(33))
+        hashes = hashes * np.uint64(_FMIX_1)
+        hashes = hashes ^ (hashes >> np.uint64(33))
+        hashes = hashes * np.uint64(_FMIX_2)
+        return hashes ^ (hashes >> np.uint64(33))
+
+    def to_dict(self) -> Dict:
+        return {'n_features_bits': self.n_features_bits, 'ngram_range': list(self.ngram_range)}
+
+# =============================================================================
+# 통계 분류 모델
+# =============================================================================
+
+def _softmax(scores: 'np.ndarray') -> 'np.ndarray':
+    scores = scores - scores.max(axis=1, keepdims=True)
+    exp = np.exp(scores)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+class StatisticalModel:
+    """감성/버그 두 헤드 로지스틱 회귀 (가중치: 특징 수 × 전체 클래스 수)"""
+
+    def __init__(self, vectorizer: HashingVectorizer, weights: 'np.ndarray', bias: 'np.ndarray',
+                 metadata: Optional[Dict] = None):
+        self.vectorizer = vectorizer
+        self.weights = weights
+        self.bias = bias
+        self.metadata = metadata or {}
+        # 헤드별 가중치 열 구간
+        self.head_slices = {}
+        offset = 0
+        for head, labels in HEADS.items():
+            self.head_slices[head] = slice(offset, offset + len(labels))
+            offset += len(labels)
+
+    @property
+    def version(self) -> str:
+        """모델 식별자 (분류 결과 캐시 키에 포함)"""
+        return self.metadata.get('weights_sha256', 'untrained')[:12]
+
+    # -------------------------------------------------------------------------
+    # 추론
+    # -------------------------------------------------------------------------
+
+    def scores(self, rows: 'np.ndarray', features: 'np.ndarray', values: 'np.ndarray',
+               batch_size: int) -> 'np.ndarray':
+        """희소 특징 × 가중치 - 특징 행 gather 후 게시글별 합 (배치 × 클래스)"""
+        gathered = np.asarray(self.weights[features], dtype=np.float32) * values[:, None]
+        out = np.empty((batch_size, gathered.shape[1]), dtype=np.float32)
+        for column in range(gathered.shape[1]):
+            out[:, column] = np.bincount(rows, weights=gathered[:, column], minlength=batch_size)
+        return out + self.bias
+
+    def predict_proba(self, texts: List[str]) -> Dict[str, 'np.ndarray']:
+        """헤드별 클래스 확률 (배치 × 라벨 수)"""
+        rows, features, values = self.vectorizer.transform(texts)
+        scores = self.scores(rows, features, values, len(texts))
+        return {head: _softmax(scores[:, columns]) for head, columns in self.head_slices.items()}
+
+    def predict(self, texts: List[str]) -> List[Dict]:
+        """게시글별 예측 {'sentiment', 'sentiment_confidence', 'bug_probability'} (입력 순서)"""
+        if not texts:
+            return []
+        probabilities = self.predict_proba(texts)
+        sentiment = probabilities['sentiment']
+        best = sentiment.argmax(axis=1)
+        bug_column = HEADS['bug'].index('bug')
+        return [
+            {
+                'sentiment': HEADS['sentiment'][best[i]],
+                'sentiment_confidence': round(float(sentiment[i, best[i]]), 4),
+                'bug_probability': round(float(probabilities['bug'][i, bug_column]), 4)
+            }
+            for i in range(len(texts))
+        ]
+
+    # -------------------------------------------------------------------------
+    # 저장 / 로드
+    # -------------------------------------------------------------------------
+
+    def save(self, path: str):
+        """<path>.npy (가중치) + <path>.json (설정/편향/학습 정보)"""
+        weights_file, metadata_file = path + '.npy', path + '.json'
+        np.save(weights_file, np.ascontiguousarray(self.weights, dtype=np.float32))
+        with open(weights_file, 'rb') as f:
+            self.metadata['weights_sha256'] = hashlib.sha256(f.read()).hexdigest()
+
+        metadata = dict(self.metadata)
+        metadata.update({
+            'format': MODEL_FORMAT_VERSION,
+            'vectorizer': self.vectorizer.to_dict(),
+            'heads': {head: list(labels) for head, labels in HEADS.items()},
+            'bias': [float(value) for value in self.bias]
+        })
+        with open(metadata_file, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'StatisticalModel':
+        """모델 로드 - 가중치는 mmap (프로세스/워커 간 페이지 캐시 공유)"""
+        with open(path + '.json', 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+        if metadata.get('format') != MODEL_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 모델 형식: {metadata.get('format')}")
+        if metadata.get('heads') != {head: list(labels) for head, labels in HEADS.items()}:
+            raise ValueError("모델 라벨 구성이 현재 버전과 다릅니다")
+
+        vectorizer = HashingVectorizer(**metadata['vectorizer'])
+        weights = np.load(path + '.npy', mmap_mode='r')
+        if weights.shape != (vectorizer.n_features, sum(len(labels) for labels in HEADS.values())):
+            raise ValueError(f"가중치 크기 불일치: {weights.shape}")
+        return cls(vectorizer, weights, np.asarray(metadata['bias'], dtype=np.float32), metadata)
+
+# =============================================================================
+# 오프라인 학습
+# =============================================================================
+
+def entry_labels(entry: Dict) -> Optional[Tuple[str, int, int]]:
+    """감성 데이터 항목 → (텍스트, 감성 라벨 번호, 버그 라벨 번호) (라벨 없으면 None)"""
+    text = f"{entry.get('title') or ''} {entry.get('content') or ''}".strip()
+    sentiment = entry.get('sentiment')
+    if not text or sentiment not in HEADS['sentiment']:
+        return None
+    bug = 'bug' if entry.get('category') == 'bug' else 'other'
+    return text, HEADS['sentiment'].index(sentiment), HEADS['bug'].index(bug)
+
+def train_model(samples: List[Tuple[str, int, int]], vectorizer: HashingVectorizer,
+                epochs: int = 5, batch_size: int = 256, learning_rate: float = 0.5,
+                l2: float = 1e-6, seed: int = 7) -> StatisticalModel:
+    """
+    두 헤드 로지스틱 회귀 학습 (미니배치 AdaGrad, 배치에 나온 특징 행만 갱신)
+    samples: (텍스트, 감성 라벨 번호, 버그 라벨 번호)
+    """
+    n_classes = sum(len(labels) for labels in HEADS.values())
+    weights = np.zeros((vectorizer.n_features, n_classes), dtype=np.float32)
+    accumulator = np.full((vectorizer.n_features, n_classes), 1e-8, dtype=np.float32)
+    model = StatisticalModel(vectorizer, weights, np.zeros(n_classes, dtype=np.float32))
+
+    # 편향은 클래스 사전 확률로 시작
+    bias = []
+    for head, labels in HEADS.items():
+        column = 1 if head == 'sentiment' else 2
+        counts = np.bincount([sample[column] for sample in samples], minlength=len(labels)) + 1.0
+        bias.extend(np.log(counts / counts.sum()))
+    model.bias = np.asarray(bias, dtype=np.float32)
+
+    order = list(range(len(samples)))
+    rnd = random.Random(seed)
+    for epoch in range(epochs):
+        rnd.shuffle(order)
+        started = time.time()
+        loss = 0.0
+        for start in range(0, len(order), batch_size):
+            batch = [samples[i] for i in order[start:start + batch_size]]
+            rows, features, values = vectorizer.transform([sample[0] for sample in batch])
+            scores = model.scores(rows, features, values, len(batch))
+
+            # 헤드별 softmax 교차 엔트로피 기울기 (P - Y)
+            gradient = np.empty_like(scores)
+            for head, columns in model.head_slices.items():
+                labels = np.asarray([sample[1] if head == 'sentiment' else sample[2] for sample in batch])
+                probabilities = _softmax(scores[:, columns])
+                loss -= float(np.log(probabilities[np.arange(len(batch)), labels] + 1e-12).sum())
+                probabilities[np.arange(len(batch)), labels] -= 1.0
+                gradient[:, columns] = probabilities
+            gradient /= len(batch)
+
+            # 특징 행별 기울기 합 (X^T · G)
+            touched, inverse = np.unique(features, return_inverse=True)
+            contributions = gradient[rows] * values[:, None]
+            feature_gradient = np.empty((len(touched), n_classes), dtype=np.float32)
+            for column in range(n_classes):
+                feature_gradient[:, column] = np.bincount(inverse, weights=contributions[:, column],
+                                                          minlength=len(touched))
+            feature_gradient += l2 * weights[touched]
+
+            accumulator[touched] += feature_gradient ** 2
+            weights[touched] -= learning_rate * feature_gradient / np.sqrt(accumulator[touched])
+            model.bias -= learning_rate * 0.1 * gradient.sum(axis=0)
+
+        print(f"[TRAIN] epoch {epoch + 1}/{epochs}: 평균 손실 {loss / max(1, len(samples)):.4f} "
+              f"({time.time() - started:.1f}초)")
+
+    model.metadata.update({
+        'trained_at': datetime.now().isoformat(),
+        'samples': len(samples),
+        'epochs': epochs
+    })
+    return model
+
+def evaluate(model: StatisticalModel, samples: List[Tuple[str, int, int]], batch_size: int = 1024) -> Dict[str, float]:
+    """헤드별 정확도"""
+    correct = {'sentiment': 0, 'bug': 0}
+    for start in range(0, len(samples), batch_size):
+        batch = samples[start:start + batch_size]
+        probabilities = model.predict_proba([sample[0] for sample in batch])
+        correct['sentiment'] += int((probabilities['sentiment'].argmax(axis=1) ==
+                                     np.asarray([sample[1] for sample in batch])).sum())
+        correct['bug'] += int((probabilities['bug'].argmax(axis=1) ==
+                               np.asarray([sample[2] for sample in batch])).sum())
+    return {head: count / max(1, len(samples)) for head, count in correct.items()}
+
+# =============================================================================
+# 프로세스 공용 모델
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def load_statistical_model(path: str = None) -> Optional[StatisticalModel]:
+    """통계 모델 로드 (NumPy 또는 모델 파일이 없으면 None - 키워드 규칙만 사용)"""
+    path = path or config.Classification.STATISTICAL_MODEL
+    if not NUMPY_AVAILABLE:
+        logger.warning("NumPy가 설치되지 않아 통계 분류 엔진을 사용하지 않습니다")
+        return None
+    try:
+        model = StatisticalModel.load(path)
+        logger.info(f"통계 분류 모델 로드: {path} (v{model.version}, 학습 {model.metadata.get('samples', 0)}건)")
+        return model
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"통계 분류 모델 로드 실패, 키워드 규칙만 사용: {path} ({e})")
+        return None
+
+def get_statistical_model() -> Optional[StatisticalModel]:
+    """통계 엔진 사용 설정(EPIC7_STATISTICAL_ENGINE=1)이면 공용 모델, 아니면 None"""
+    if not config.Classification.STATISTICAL_ENGINE:
+        return None
+    return load_statistical_model()
+
+# =============================================================================
+# 명령
+# =============================================================================
+
+def _load_samples(args) -> List[Tuple[str, int, int]]:
+    from reclassify import JsonSentimentSource, SQLiteSentimentSource
+    from sqlite_store import SQLiteStateStore
+
+    source = SQLiteSentimentSource(SQLiteStateStore(args.db)) if args.db else JsonSentimentSource(args.input)
+    samples = []
+    for _, entry in source.iter_items():
+        sample = entry_labels(entry)
+        if sample is not None:
+            samples.append(sample)
+    return samples
+
+def run_train(args) -> int:
+    samples = _load_samples(args)
+    if not samples:
+        print("[ERROR] 라벨(sentiment)이 있는 학습 데이터가 없습니다")
+        return 1
+
+    random.Random(args.seed).shuffle(samples)
+    holdout = int(len(samples) * args.holdout)
+    train, test = samples[holdout:], samples[:holdout]
+    print(f"[INFO] 학습 {len(train)}건, 검증 {len(test)}건")
+
+    vectorizer = HashingVectorizer(args.bits, (args.ngram_min, args.ngram_max))
+    model = train_model(train, vectorizer, epochs=args.epochs, seed=args.seed)
+    if test:
+        accuracy = evaluate(model, test)
+        print(f"[EVAL] 검증 정확도: 감성 {accuracy['sentiment']:.1%}, 버그 {accuracy['bug']:.1%}")
+        model.metadata['holdout_accuracy'] = accuracy
+
+        texts = [sample[0] for sample in test[:1024]]
+        started = time.perf_counter()
+        model.predict(texts)
+        print(f"[EVAL] 배치 추론 {(time.perf_counter() - started) / len(texts) * 1e6:.1f}us/건 ({len(texts)}건)")
+
+    model.save(args.output)
+    print(f"[INFO] 모델 저장: {args.output}.npy / {args.output}.json (v{model.version})")
+    return 0
+
+def run_predict(args) -> int:
+    model = load_statistical_model(args.output)
+    if model is None:
+        print(f"[ERROR] 모델을 로드할 수 없습니다: {args.output}")
+        return 1
+    for text, prediction in zip(args.texts, model.predict(args.texts)):
+        print(f"{prediction} {text[:60]!r}")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Epic7 통계 분류 엔진 학습/예측")
+    parser.add_argument('command', choices=['train', 'predict'], help="train: 감성 데이터로 학습, predict: 텍스트 예측")
+    parser.add_argument('texts', nargs='*', help="예측할 텍스트 (predict)")
+    parser.add_argument('--input', default=DAILY_SENTIMENT_DATA_FILE, help="학습용 감성 데이터 JSON")
+    parser.add_argument('--db', help="학습용 SQLite 데이터베이스 (sentiment_posts)")
+    parser.add_argument('--output', default=config.Classification.STATISTICAL_MODEL, help="모델 경로 (확장자 제외)")
+    parser.add_argument('--epochs', type=int, default=5)
+    parser.add_argument('--bits', type=int, default=18, help="해싱 특징 수 (2^bits)")
+    parser.add_argument('--ngram-min', type=int, default=1)
+    parser.add_argument('--ngram-max', type=int, default=3)
+    parser.add_argument('--holdout', type=float, default=0.1, help="검증용 비율")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("[ERROR] NumPy가 필요합니다: pip install numpy")
+        return 1
+    if args.command == 'train':
+        return run_train(args)
+    return run_predict(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
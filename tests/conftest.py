@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""테스트 공통 설정 - 저장소 루트의 평면 모듈 임포트, 파일 잠금 디렉토리 격리"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture(autouse=True)
+def isolated_lock_dir(tmp_path, monkeypatch):
+    """공유 상태 잠금 파일(.file_locks)을 저장소 대신 테스트 임시 디렉토리에 생성"""
+    from file_manager import file_manager
+    lock_dir = tmp_path / '.file_locks'
+    lock_dir.mkdir()
+    monkeypatch.setattr(file_manager, 'lock_dir', lock_dir)
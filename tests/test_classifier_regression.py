@@ -0,0 +1,60 @@
+"""
+분류 결과 회귀 테스트 - 고정 게시글 묶음을 기준 구현(최적화 이전 classifier.py /
+generate_report.py, 커밋 c8e620b)으로 분류해 저장한 기대 결과와 비교
+"""
+
+import json
+import os
+
+import pytest
+
+import classifier
+import generate_report
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'classifier_regression.json')
+
+# 실행 시각 필드는 비교에서 제외
+VOLATILE_FIELDS = ('classification_timestamp',)
+
+
+def _comparable(result):
+    return {key: value for key, value in result.items() if key not in VOLATILE_FIELDS}
+
+
+@pytest.fixture(scope='module')
+def fixture_data():
+    with open(FIXTURE_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def realtime_classifier():
+    # 기준 구현에는 통계 엔진이 없으므로 키워드 규칙만으로 비교
+    instance = classifier.Epic7Classifier(use_cache=False)
+    instance.statistical_model = None
+    return instance
+
+
+def _assert_matches(api, actual, expected, posts):
+    assert len(actual) == len(expected)
+    for post, got, want in zip(posts, actual, expected):
+        assert _comparable(got) == want, f"{api} 결과 불일치: {post['title'][:40]!r}"
+
+
+def test_realtime_classifier_matches_baseline(fixture_data, realtime_classifier):
+    posts = fixture_data['posts']
+    actual = [realtime_classifier.classify_post(dict(post)) for post in posts]
+    _assert_matches('classifier', actual, fixture_data['expected']['classifier'], posts)
+
+
+def test_realtime_batch_api_matches_baseline(fixture_data, realtime_classifier):
+    posts = fixture_data['posts']
+    actual = list(realtime_classifier.classify_posts(dict(post) for post in posts))
+    _assert_matches('classifier', actual, fixture_data['expected']['classifier'], posts)
+
+
+def test_report_classifier_matches_baseline(fixture_data):
+    posts = fixture_data['posts']
+    report = generate_report.Epic7Classifier()
+    actual = [report.classify_post(dict(post)) for post in posts]
+    _assert_matches('generate_report', actual, fixture_data['expected']['generate_report'], posts)
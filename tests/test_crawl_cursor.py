@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""크롤링 커서 저장 테스트 (원자적 교체 / 실행 간 병합)"""
+
+import json
+
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('selenium')
+
+import crawler
+import file_manager as file_manager_module
+
+@pytest.fixture
+def cursor_file(tmp_path, monkeypatch):
+    path = str(tmp_path / 'crawl_cursors.json')
+    monkeypatch.setattr(crawler, 'get_crawl_cursor_file', lambda: path)
+    return path
+
+def _advance(store, source, post_ids):
+    store.register(source, post_ids)
+    for post_id in post_ids:
+        store.complete(source, post_id)
+    return store.commit()
+
+def test_failed_write_keeps_previous_cursors(cursor_file, monkeypatch):
+    assert _advance(crawler.CrawlCursorStore(), 'stove_korea_bug', [101, 102]) == {'stove_korea_bug': 102}
+
+    # 쓰기 도중 실패 (중간 종료) - 기존 파일은 그대로 남아야 함
+    def broken_dump(data, f, **kwargs):
+        f.write('{"cursors": {"stove_korea_b')
+        raise OSError("disk full")
+    with monkeypatch.context() as patch:
+        patch.setattr(file_manager_module.json, 'dump', broken_dump)
+        _advance(crawler.CrawlCursorStore(), 'stove_korea_bug', [103])
+
+    with open(cursor_file, 'r', encoding='utf-8') as f:
+        assert json.load(f)['cursors'] == {'stove_korea_bug': 102}
+    assert crawler.CrawlCursorStore().get('stove_korea_bug') == 102
+
+def test_save_merges_cursors_written_by_another_run(cursor_file):
+    korea = crawler.CrawlCursorStore()
+    korea.get('stove_korea_bug')
+
+    _advance(crawler.CrawlCursorStore(), 'stove_global_bug', [501])
+    _advance(korea, 'stove_korea_bug', [101])
+
+    with open(cursor_file, 'r', encoding='utf-8') as f:
+        assert json.load(f)['cursors'] == {'stove_global_bug': 501, 'stove_korea_bug': 101}
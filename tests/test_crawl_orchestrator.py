@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""크롤링 오케스트레이터 취소 / 파이프라인 종료 처리 테스트"""
+
+import time
+
+import pytest
+
+from crawl_orchestrator import CancelToken, CrawlCancelled, CrawlOrchestrator, CrawlTask
+from crawl_pipeline import CrawlPipeline, PipelineStage
+
+def test_submit_after_drain_is_rejected():
+    handled = []
+    pipeline = CrawlPipeline([PipelineStage('collect', handled.append)])
+
+    assert pipeline.submit('first')
+    assert pipeline.drain(timeout=5)
+
+    assert pipeline.submit('late') is False
+    assert handled == ['first']
+    assert pipeline.stages[0].threads == []
+
+def test_guarded_callback_stops_after_cancel():
+    token = CancelToken()
+    received = []
+    callback = token.guard(received.append)
+
+    callback('before')
+    token.cancel()
+    with pytest.raises(CrawlCancelled):
+        callback('after')
+    assert received == ['before']
+
+def test_detached_task_keeps_host_slot_until_it_exits():
+    timeline = {}
+
+    def stuck(token):
+        # 취소 신호를 무시하고 유예 시간보다 오래 실행되는 작업
+        time.sleep(0.5)
+        timeline['stuck_done'] = time.monotonic()
+        return []
+
+    def follower(token):
+        timeline['follower_start'] = time.monotonic()
+        return []
+
+    orchestrator = CrawlOrchestrator(default_host_limit=1, default_deadline=0.1, cancel_grace=0.1)
+    results = orchestrator.run([
+        CrawlTask('stuck', 'https://example.com/a', stuck),
+        CrawlTask('follower', 'https://example.com/b', follower)
+    ])
+
+    assert {result.name: result.status for result in results} == {'stuck': 'timeout', 'follower': 'success'}
+    assert timeline['follower_start'] >= timeline['stuck_done']
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""크롤러 → 분류/알림/저장 파이프라인 연결 테스트"""
+
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('selenium')
+
+import crawler
+
+POST = {
+    'title': '아레나 진입 시 게임이 멈추는 버그',
+    'content': '아레나 들어가면 화면이 멈춥니다',
+    'url': 'https://page.onstove.com/epicseven/kr/view/10001',
+    'source': 'stove_korea_bug',
+    'post_id': '10001'
+}
+
+def _patched_processor(monkeypatch):
+    processor = crawler.ImmediateProcessor()
+    calls = []
+    completed = []
+    retried = []
+
+    monkeypatch.setattr(crawler, 'EPIC7_MODULES_AVAILABLE', True)
+    monkeypatch.setattr(processor, '_analyze_sentiment',
+                        lambda post: calls.append('classify') or {'category': 'bug', 'sentiment_analysis': {}})
+    monkeypatch.setattr(processor, '_handle_notifications',
+                        lambda post, result: calls.append('notify') or True)
+    monkeypatch.setattr(processor, '_mark_as_processed',
+                        lambda url, notified=True: calls.append(('persist', url)))
+    monkeypatch.setattr(processor, '_add_to_retry_queue', lambda *args: retried.append(args))
+    monkeypatch.setattr(crawler.crawl_cursor_store, 'complete',
+                        lambda source, post_id: completed.append((source, post_id)))
+    return processor, calls, completed, retried
+
+def test_crawled_post_passes_all_stages(monkeypatch):
+    processor, calls, completed, retried = _patched_processor(monkeypatch)
+
+    # 크롤러와 같은 방식으로 게시글 dict를 그대로 투입
+    pipeline = processor.create_pipeline()
+    process = processor.pipeline_submitter(pipeline)
+    process(dict(POST))
+    assert pipeline.drain(timeout=10)
+
+    assert calls == ['classify', 'notify', ('persist', POST['url'])]
+    assert completed == [(POST['source'], POST['post_id'])]
+    assert retried == []
+    assert processor.processed_count == 1
+    assert processor.failed_count == 0
+    assert all(stats['failed'] == 0 for stats in pipeline.get_stats().values())
+
+def test_duplicate_post_completes_cursor_without_failure(monkeypatch):
+    processor, calls, completed, retried = _patched_processor(monkeypatch)
+    # 같은 게시글이 다른 게시판 ID로 한 번 더 수집된 경우
+    duplicate = dict(POST, source='stove_korea_general', post_id='20002')
+
+    assert processor.process_post_immediately(dict(POST))
+    assert processor.process_post_immediately(duplicate)
+
+    assert calls == ['classify', 'notify', ('persist', POST['url']), 'classify']
+    assert completed == [(POST['source'], POST['post_id']), ('stove_korea_general', '20002')]
+    assert retried == []
+    assert processor.processed_count == 1
+    assert processor.failed_count == 0
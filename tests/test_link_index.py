@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""링크 인덱스 블룸 필터 미스 → 정확 인덱스 확인 및 세대 회전/만료 테스트"""
+
+import bloom_filter
+from bloom_filter import GenerationalBloomFilter
+from link_index import CrawledLinkIndex, canonical_link_key
+
+DAY = 86400
+BASE_URL = 'https://page.onstove.com/epicseven/kr/view'
+
+class _Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+def _index(tmp_path):
+    seen_filter = GenerationalBloomFilter(str(tmp_path / 'links.bloom'))
+    return CrawledLinkIndex(file_path=str(tmp_path / 'links.json'), seen_filter=seen_filter)
+
+def test_filter_miss_falls_back_to_exact_index(tmp_path):
+    first = _index(tmp_path)
+    first.mark(f'{BASE_URL}/1')
+    first.close()
+
+    # 저널에는 기록됐지만 필터 저장(flush/close) 전에 종료된 실행
+    crashed = _index(tmp_path)
+    crashed.mark(f'{BASE_URL}/2')
+
+    reopened = _index(tmp_path)
+    assert canonical_link_key(f'{BASE_URL}/2') not in reopened._get_seen_filter()
+    assert reopened.is_seen(f'{BASE_URL}/1')
+    assert reopened.is_seen(f'{BASE_URL}/2')
+    assert not reopened.is_seen(f'{BASE_URL}/3')
+
+def test_generations_roll_over_and_expire(tmp_path, monkeypatch):
+    clock = _Clock(1_000_000.0)
+    monkeypatch.setattr(bloom_filter, 'time', clock)
+    path = str(tmp_path / 'seen.bloom')
+    seen = GenerationalBloomFilter(path, retention_days=10, generation_days=5, capacity=100)
+
+    seen.add('day0')
+    clock.now += 5 * DAY
+    seen.add('day5')
+    assert seen.get_stats()['generations'] == 2
+
+    # 다음 세대 시작(5일)이 보존 기간(10일) 밖이 되면 가장 오래된 세대 제거
+    clock.now += 11 * DAY
+    seen.add('day16')
+    assert 'day0' not in seen
+    assert 'day5' in seen and 'day16' in seen
+    assert seen.get_stats()['generations'] == 2
+
+    # 저장 후 다시 읽어도 같은 판정
+    assert seen.flush()
+    reloaded = GenerationalBloomFilter(path, retention_days=10, generation_days=5, capacity=100)
+    assert 'day5' in reloaded and 'day16' in reloaded and 'day0' not in reloaded
+
+def test_full_generation_rolls_over_within_max_generations(tmp_path, monkeypatch):
+    monkeypatch.setattr(bloom_filter, 'time', _Clock(1_000_000.0))
+    seen = GenerationalBloomFilter(str(tmp_path / 'seen.bloom'), capacity=2, max_generations=3)
+
+    for number in range(8):
+        seen.add(f'post-{number}')
+
+    stats = seen.get_stats()
+    assert stats['generations'] == 3
+    # 세대 수 상한 초과분은 가장 오래된 세대부터 제거
+    assert 'post-0' not in seen
+    assert all(f'post-{number}' in seen for number in range(4, 8))
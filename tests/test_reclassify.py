@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""재분류 중단 후 재개 테스트 (JSON 감성 데이터)"""
+
+import json
+import os
+from collections import Counter
+
+import reclassify
+from reclassify import JsonSentimentSource, ReclassifyCheckpoint, Reclassifier
+
+ENTRY_COUNT = 12
+
+def _write_entries(path):
+    entries = [{
+        'title': f'아레나 매칭 오류 {number}번째 제보',
+        'content': '매칭 후 화면이 멈춥니다',
+        'source': 'stove_korea_bug',
+        'url': f'https://page.onstove.com/epicseven/kr/view/{1000 + number}',
+        'sentiment': 'neutral',
+        'category': 'neutral',
+        'saved_at': f'2025-07-28T00:00:{number:02d}'
+    } for number in range(ENTRY_COUNT)]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, ensure_ascii=False)
+
+def _tracked_source(path, written: Counter) -> JsonSentimentSource:
+    source = JsonSentimentSource(path)
+    write = source.write
+
+    def tracked_write(results):
+        written.update(results.keys())
+        return write(results)
+
+    source.write = tracked_write
+    return source
+
+def _reclassifier(source, checkpoint_path) -> Reclassifier:
+    return Reclassifier(source, ReclassifyCheckpoint(checkpoint_path),
+                        workers=1, chunk_size=3, flush_interval=0)
+
+def _interrupt_after_first_flush(reclassifier: Reclassifier):
+    flush = reclassifier._flush
+
+    def flush_then_stop():
+        flush()
+        if reclassifier.written:
+            reclassifier._stop_requested = True
+
+    reclassifier._flush = flush_then_stop
+
+def test_interrupted_run_resumes_and_processes_each_entry_once(tmp_path):
+    data_path = str(tmp_path / 'daily_sentiment_data.json')
+    checkpoint_path = str(tmp_path / 'reclassify_checkpoint.jsonl')
+    _write_entries(data_path)
+    written = Counter()
+
+    first = _reclassifier(_tracked_source(data_path, written), checkpoint_path)
+    _interrupt_after_first_flush(first)
+    assert first.run() is False
+    assert 0 < first.written < ENTRY_COUNT
+    assert os.path.exists(checkpoint_path)
+
+    second = _reclassifier(_tracked_source(data_path, written), checkpoint_path)
+    assert second.run() is True
+    assert first.processed + second.processed == ENTRY_COUNT
+    assert not os.path.exists(checkpoint_path)
+
+    # 모든 항목이 정확히 한 번씩 반영됨
+    with open(data_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    assert len(written) == ENTRY_COUNT
+    assert set(written.values()) == {1}
+    assert all(entry.get('rules_version') for entry in entries)
+
+def test_changed_rules_version_discards_checkpoint(tmp_path, monkeypatch):
+    data_path = str(tmp_path / 'daily_sentiment_data.json')
+    checkpoint_path = str(tmp_path / 'reclassify_checkpoint.jsonl')
+    _write_entries(data_path)
+
+    first = _reclassifier(JsonSentimentSource(data_path), checkpoint_path)
+    _interrupt_after_first_flush(first)
+    assert first.run() is False
+    source_name = first.source.name
+    rules_version = reclassify.get_rule_pack().content_hash[:12]
+    assert ReclassifyCheckpoint(checkpoint_path).load(source_name, rules_version)
+
+    class _ChangedPack:
+        content_hash = 'f' * 64
+
+    # 규칙 팩이 바뀌면 체크포인트를 버리고 전체를 다시 분류
+    monkeypatch.setattr(reclassify, 'get_rule_pack', lambda: _ChangedPack())
+    assert ReclassifyCheckpoint(checkpoint_path).load(source_name, 'f' * 12) == set()
+    written = Counter()
+    second = _reclassifier(_tracked_source(data_path, written), checkpoint_path)
+    assert second.run() is True
+    assert second.processed == ENTRY_COUNT
+    assert len(written) == ENTRY_COUNT
@@ -0,0 +1,24 @@
+"""SQLite 상태 저장소 스키마 마이그레이션 테스트"""
+
+import sqlite3
+
+import sqlite_store
+from sqlite_store import SQLiteStateStore, SCHEMA_VERSION
+
+
+def test_v1_database_is_migrated_to_current_schema(tmp_path):
+    db_path = str(tmp_path / 'state.db')
+
+    # v1 스키마로 생성된 기존 DB (classification_cache 테이블 없음)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(sqlite_store.SCHEMA_MIGRATIONS[1])
+    conn.execute("PRAGMA user_version=1")
+    conn.close()
+
+    store = SQLiteStateStore(db_path)
+    store.put_classifications({'k': {'is_bug': False}})
+    assert store.get_classification('k') == {'is_bug': False}
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    conn.close()
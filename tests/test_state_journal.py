@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""상태 저널 테스트 - 잘린 꼬리 복구, 재생, 추가 중 압축"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+from state_journal import StateJournal
+
+def _journal(tmp_path, **kwargs) -> StateJournal:
+    return StateJournal(str(tmp_path / 'state.json'), **kwargs)
+
+def test_torn_final_line_is_truncated_and_recovered(tmp_path):
+    journal = _journal(tmp_path)
+    journal.record_set('a', 1)
+    journal.record_set('b', 2)
+    # 쓰기 도중 종료된 마지막 줄
+    with open(journal.journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"op":"set","k":"c","v":')
+
+    recovered = _journal(tmp_path)
+    assert recovered.load() == {'a': 1, 'b': 2}
+    assert recovered.stats['recovered_tail'] == 1
+    intact_size = os.path.getsize(recovered.journal_path)
+    with open(recovered.journal_path, 'rb') as f:
+        assert f.read().endswith(b'\n')
+
+    # 복구 후 추가 이벤트는 깨끗한 줄에서 시작
+    recovered.record_set('c', 3)
+    assert os.path.getsize(recovered.journal_path) > intact_size
+    reloaded = _journal(tmp_path)
+    assert reloaded.load() == {'a': 1, 'b': 2, 'c': 3}
+    assert reloaded.stats['recovered_tail'] == 0
+
+def test_replay_applies_snapshot_then_events_in_order(tmp_path):
+    journal = _journal(tmp_path)
+    journal.compact({'kept': 1, 'removed': 2})
+    journal.record_set('added', {'nested': True})
+    journal.record_delete('removed')
+    journal.record_set(['stove_korea_bug', 'k1'], 'composite')
+    journal.record_set('kept', 10)
+    # 중간 손상 줄은 건너뛰고 이후 이벤트는 계속 재생
+    with open(journal.journal_path, 'a', encoding='utf-8') as f:
+        f.write('not json\n')
+    journal.record_set('after', 'ok')
+
+    replayed = _journal(tmp_path)
+    assert replayed.load() == {
+        'kept': 10,
+        'added': {'nested': True},
+        ('stove_korea_bug', 'k1'): 'composite',
+        'after': 'ok'
+    }
+    assert replayed.stats['skipped_lines'] == 1
+
+def test_events_appended_during_background_compaction_survive(tmp_path):
+    snapshot_started = threading.Event()
+    release_snapshot = threading.Event()
+
+    @contextmanager
+    def slow_lock(file_path):
+        snapshot_started.set()
+        release_snapshot.wait(timeout=5)
+        yield
+
+    journal = _journal(tmp_path, lock_factory=slow_lock)
+    state = {}
+    for number in range(5):
+        state[f'k{number}'] = number
+        journal.record_set(f'k{number}', number)
+
+    assert journal.compact(dict(state), background=True)
+    assert snapshot_started.wait(timeout=5)
+
+    # 스냅샷을 쓰는 동안 추가된 이벤트는 새 저널로
+    journal.record_set('k5', 5)
+    journal.record_delete('k0')
+    release_snapshot.set()
+    journal.close()
+
+    assert not os.path.exists(journal.compacting_path)
+    assert journal.stats['compactions'] == 1
+    expected = {f'k{number}': number for number in range(1, 6)}
+    assert _journal(tmp_path).load() == expected
+
+def test_interrupted_compaction_is_replayed_and_merged(tmp_path):
+    @contextmanager
+    def failing_lock(file_path):
+        raise OSError("snapshot write failed")
+        yield
+
+    journal = _journal(tmp_path, lock_factory=failing_lock)
+    journal.record_set('a', 1)
+    assert journal.compact({'a': 1}) is False
+    assert os.path.exists(journal.compacting_path)
+
+    # 회전 저널이 남은 상태에서 추가/재압축해도 이벤트 유실 없음
+    journal.record_set('b', 2)
+    assert _journal(tmp_path).load() == {'a': 1, 'b': 2}
+
+    healthy = _journal(tmp_path)
+    state = healthy.load()
+    healthy.record_set('c', 3)
+    state['c'] = 3
+    assert healthy.compact(state)
+    assert not os.path.exists(healthy.compacting_path)
+    assert not os.path.exists(healthy.journal_path)
+    assert _journal(tmp_path).load() == {'a': 1, 'b': 2, 'c': 3}
@@ -0,0 +1,43 @@
+"""통계 모델 버그 판정이 키워드 판정을 뒤집지 않는지 확인"""
+
+import pytest
+
+from config import config
+from classifier import Epic7Classifier
+
+
+class _FakeModel:
+    version = 'test'
+
+
+BUG_PREDICTION = {'bug_probability': 0.99, 'sentiment': 'neutral', 'sentiment_confidence': 0.5}
+POSITIVE_POST = {'title': '오늘 업데이트 정말 최고 감사합니다', 'content': '정말 좋아요 최고', 'source': 'stove_korea_general'}
+EMPTY_POST = {'title': '그냥 질문 하나', 'content': '아무 내용 없는 평범한 글입니다', 'source': 'stove_korea_general'}
+
+
+@pytest.fixture
+def classifier():
+    instance = Epic7Classifier()
+    instance.use_cache = False
+    instance.statistical_model = _FakeModel()
+    return instance
+
+
+def test_override_is_off_by_default(classifier):
+    assert config.Classification.STATISTICAL_BUG_OVERRIDE is False
+    assert classifier._classify_post(EMPTY_POST, BUG_PREDICTION)['category'] == 'neutral'
+
+
+def test_override_never_replaces_keyword_verdict(classifier, monkeypatch):
+    monkeypatch.setattr(config.Classification, 'STATISTICAL_BUG_OVERRIDE', True)
+    assert classifier._classify_post(POSITIVE_POST, BUG_PREDICTION)['category'] == 'positive'
+
+
+def test_override_fills_empty_keyword_verdict(classifier, monkeypatch):
+    monkeypatch.setattr(config.Classification, 'STATISTICAL_BUG_OVERRIDE', True)
+    result = classifier._classify_post(EMPTY_POST, BUG_PREDICTION)
+    assert result['category'] == 'bug'
+    assert result['bug_analysis']['priority'] == 'low'
+
+    below_threshold = dict(BUG_PREDICTION, bug_probability=config.Classification.STATISTICAL_BUG_MIN_CONFIDENCE - 0.01)
+    assert classifier._classify_post(EMPTY_POST, below_threshold)['category'] == 'neutral'
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Stove 상세 페이지 본문 수집 (HTTP 우선 / 브라우저 폴백) 테스트"""
+
+import os
+import contextlib
+
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('selenium')
+
+import crawler
+
+POST_URL = 'https://page.onstove.com/epicseven/kr/view/10001'
+
+def test_browser_fallback_fetches_http_once(monkeypatch):
+    http_calls = []
+    browser_calls = []
+
+    monkeypatch.setattr(crawler.content_cache, 'get', lambda url, source: None)
+    monkeypatch.setattr(crawler.content_cache, 'put', lambda url, content, source: None)
+    monkeypatch.setattr(crawler, '_fetch_stove_detail_http',
+                        lambda url, cookies=None: http_calls.append(url) or None)
+    monkeypatch.setattr(crawler, '_get_stove_post_content_browser',
+                        lambda url, driver, source, schedule_type: browser_calls.append(driver) or '본문')
+    monkeypatch.setattr(crawler.chrome_driver_pool, 'borrow', lambda: contextlib.nullcontext('driver'))
+    monkeypatch.setattr(crawler.network_filter, 'apply', lambda driver, source: None)
+    monkeypatch.setattr(crawler.network_filter, 'collect', lambda entries, source: None)
+    monkeypatch.setattr(crawler, 'drain_performance_log', lambda driver: [])
+
+    assert crawler.get_stove_post_content(POST_URL) == '본문'
+    assert http_calls == [POST_URL]
+    assert browser_calls == ['driver']
+
+# 서버 렌더링 셸 샘플 (본문 없이 사이트 공통 meta 설명만 있는 클라이언트 렌더링 페이지)
+SSR_SHELL_PATH = os.path.join(os.path.dirname(__file__), 'data', 'stove_detail_ssr.html')
+
+ARTICLE_BODY = ('아레나 진입 시 로딩 화면에서 게임이 멈추고 강제 종료되는 문제가 오늘 업데이트 이후 계속 발생합니다. '
+                '재설치를 해도 같은 증상이 반복되어 확인 부탁드립니다.')
+
+class _Response:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+class _Session:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url, cookies=None, timeout=None):
+        return _Response(self.pages[url])
+
+def _serve(monkeypatch, pages):
+    monkeypatch.setattr(crawler, 'get_http_session', lambda: _Session(pages))
+
+def test_http_rejects_site_wide_meta_description(monkeypatch):
+    pytest.importorskip('bs4')
+    with open(SSR_SHELL_PATH, 'r', encoding='utf-8') as f:
+        shell = f.read()
+    _serve(monkeypatch, {POST_URL: shell})
+
+    # 브라우저 경로(메타 포함)라면 통과했을 공통 설명이 HTTP 경로에서는 본문으로 채택되지 않음
+    assert crawler._summarize_content_candidates(crawler._extract_content_candidates_from_html(shell))
+    assert crawler._fetch_stove_detail_http(POST_URL) is None
+
+def test_http_accepts_article_body(monkeypatch):
+    pytest.importorskip('bs4')
+    with open(SSR_SHELL_PATH, 'r', encoding='utf-8') as f:
+        shell = f.read()
+    page = shell.replace('<div class="s-wrap"></div>',
+                         f'<div class="s-wrap"><div class="s-article-content">{ARTICLE_BODY}</div></div>')
+    _serve(monkeypatch, {POST_URL: page})
+
+    content = crawler._fetch_stove_detail_http(POST_URL)
+    assert content and content.startswith('아레나 진입 시')
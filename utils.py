@@ -16,8 +16,9 @@ import time
 import random
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from functools import wraps
+from typing import Dict, List, Optional, Any, Tuple
+from functools import wraps, lru_cache
+from urllib.parse import urlsplit
 
 from config import config
 
@@ -109,21 +110,84 @@ def is_korean_text(text: str) -> bool:
     return korean_count / total_chars > 0.3
 
 def fix_stove_url(url: str) -> str:
-    """스토브 URL 정규화"""
+    """스토브 URL 정규화 (호스트 없는 경로는 스토브 기준)"""
     if not url:
         return url
     
-    if url.startswith('ttps://'):
-        url = 'h' + url
-    elif url.startswith('ttp://'):
+    if not url.startswith(('http', 'ttp', '/')):
+        url = '/' + url
+    if url.startswith('/') and not url.startswith('//'):
+        return 'https://page.onstove.com' + url
+    return normalize_post_url(url)
+
+# =============================================================================
+# 게시글 식별자 (URL 변형 → 고정 (source, post_id) 키)
+# =============================================================================
+
+# 호스트별 게시글 ID 추출 규칙 (호스트 접미사, source, 경로 정규식) - 모듈 로드 시 한 번 컴파일
+POST_IDENTITY_RULES = [
+    ('onstove.com', 'stove', re.compile(r'/view/(\d+)')),
+    ('ruliweb.com', 'ruliweb', re.compile(r'/read/(\d+)')),
+    ('reddit.com', 'reddit', re.compile(r'/comments/([a-z0-9]+)', re.IGNORECASE)),
+    ('redd.it', 'reddit', re.compile(r'^/([a-z0-9]+)/?$', re.IGNORECASE)),
+]
+
+# 상대 경로 URL의 호스트 추정 (경로 내 키워드 → 기본 호스트)
+RELATIVE_URL_HOSTS = [
+    (('onstove.com', 'epicseven'), 'https://page.onstove.com'),
+    (('ruliweb.com',), 'https://bbs.ruliweb.com'),
+    (('reddit.com', '/r/'), 'https://www.reddit.com'),
+]
+
+def normalize_post_url(url: str) -> str:
+    """
+    게시글 URL 보정 (잘린 스킴, 상대 경로, 스킴 누락)
+    crawler.fix_url_bug / fix_stove_url 공통 규칙
+    """
+    if not url:
+        return url
+    
+    url = url.strip()
+    if url.startswith(('ttps://', 'ttp://')):
         url = 'h' + url
+    elif url.startswith('//'):
+        url = 'https:' + url
     elif url.startswith('/'):
-        url = 'https://page.onstove.com' + url
-    elif not url.startswith('http'):
-        url = 'https://page.onstove.com' + ('/' if not url.startswith('/') else '') + url
+        for keywords, base in RELATIVE_URL_HOSTS:
+            if any(keyword in url for keyword in keywords):
+                url = base + url
+                break
+    elif not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
     
     return url
 
+@lru_cache(maxsize=8192)
+def canonical_post_key(url: str) -> Tuple[str, str]:
+    """
+    URL 변형(스킴, 쿼리, 프래그먼트, 끝 슬래시, 게시판 경로)에 관계없이 고정된 (source, post_id) 반환
+    규칙이 없는 호스트는 (호스트, 경로)를 키로 사용합니다. 프로세스 간에도 같은 값입니다.
+    """
+    parts = urlsplit(normalize_post_url(url or ''))
+    host = parts.netloc.lower().split(':')[0]
+    if host.startswith('www.'):
+        host = host[4:]
+    path = parts.path
+    
+    for host_suffix, source, pattern in POST_IDENTITY_RULES:
+        if host == host_suffix or host.endswith('.' + host_suffix):
+            match = pattern.search(path)
+            if match:
+                return source, match.group(1).lower() if source == 'reddit' else match.group(1)
+            break
+    
+    return host or 'url', path.rstrip('/') or (url or '').strip()
+
+def post_identity(url: str) -> str:
+    """중복 체크/캐시/알림 키로 쓰는 문자열 식별자 ("source:post_id")"""
+    source, post_id = canonical_post_key(url)
+    return f"{source}:{post_id}"
+
 # =============================================================================
 # 시간 처리 유틸리티
 # =============================================================================